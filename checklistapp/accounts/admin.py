@@ -1,3 +1,4 @@
+from core.invalidation import InvalidationBus
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import Group
@@ -30,24 +31,28 @@ class UserProjectPermissionsAdmin(admin.ModelAdmin):
 
     @admin.action(description="Rendre admin (active tous les droits)")
     def make_admin(self, request, queryset):
-        queryset.update(is_admin=True, can_edit=True, can_view=True)
+        self._update(queryset, is_admin=True, can_edit=True, can_view=True)
         self.message_user(request, f"{queryset.count()} permission(s) mise(s) à jour en admin.")
 
     @admin.action(description="Rendre éditeur (peut éditer et voir)")
     def make_editor(self, request, queryset):
-        queryset.update(is_admin=False, can_edit=True, can_view=True)
+        self._update(queryset, is_admin=False, can_edit=True, can_view=True)
         self.message_user(request, f"{queryset.count()} permission(s) mise(s) à jour en éditeur.")
 
     @admin.action(description="Rendre viewer (peut seulement voir)")
     def make_viewer(self, request, queryset):
-        queryset.update(is_admin=False, can_edit=False, can_view=True)
+        self._update(queryset, is_admin=False, can_edit=False, can_view=True)
         self.message_user(request, f"{queryset.count()} permission(s) mise(s) à jour en viewer.")
 
     @admin.action(description="Retirer droits d'édition")
     def remove_edit_rights(self, request, queryset):
-        queryset.update(is_admin=False, can_edit=False)
+        self._update(queryset, is_admin=False, can_edit=False)
         self.message_user(request, f"Droits d'édition retirés pour {queryset.count()} permission(s).")
 
+    def _update(self, queryset, **roles):
+        queryset.update(**roles)
+        InvalidationBus.publish("permissions")  # update() does not send the signals of signals.py
+
     def save_model(self, request, obj, form, change):
         # Appliquer la logique de dépendances
         if obj.is_admin:
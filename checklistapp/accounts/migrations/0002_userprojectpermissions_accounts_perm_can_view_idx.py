@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("projects", "0005_project_projects_status_due_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userprojectpermissions",
+            index=models.Index(
+                condition=models.Q(("can_view", True)), fields=["user", "project"], name="accounts_perm_can_view_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 6.0 on 2026-10-19 12:06
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_userprojectpermissions_accounts_perm_can_view_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="userprojectpermissions",
+            name="accounts_perm_can_view_idx",
+        ),
+    ]
@@ -14,7 +14,7 @@ class UserProjectPermissions(models.Model):
     is_admin = models.BooleanField(default=False)
 
     class Meta:
-        unique_together = ("user", "project")
+        unique_together = ("user", "project")  # Its index serves the projects of a user (get_projects_for_user)
 
     def __str__(self):
         if self.is_admin:
@@ -1,22 +1,32 @@
+import copy
+
 from core.exceptions import RecordNotFoundError
+from core.invalidation import LocalCache
+from core.routers import read_intent, write_intent
 from django.db import transaction
 from projects.models import Project
 
 from .models import User, UserProjectPermissions
 
+# Permission of a user on a project, read by every project page. Invalidated by the receivers of signals.py.
+PERMISSIONS_CACHE = LocalCache("permissions")
+
 
 class AccountService:
     @staticmethod
+    @read_intent
     def get_all_users_having_permissions(project_id):
         return UserProjectPermissions.objects.filter(project_id=project_id).select_related("user").order_by("user__username")
 
     @staticmethod
+    @read_intent
     def get_users(user_ids: list[int] | None = None):
         if user_ids is None:
             return User.objects.all()
         return User.objects.filter(id__in=user_ids)
 
     @staticmethod
+    @read_intent
     def get_user(user_id: int) -> User:
         try:
             return User.objects.get(id=user_id)
@@ -24,6 +34,7 @@ class AccountService:
             raise RecordNotFoundError("User not found.")
 
     @staticmethod
+    @read_intent
     def get_permission(project_id, permission_id):
         try:
             return UserProjectPermissions.objects.get(pk=permission_id, project__id=project_id)
@@ -31,10 +42,12 @@ class AccountService:
             raise RecordNotFoundError("Permission not found.")
 
     @staticmethod
+    @read_intent
     def get_all_permissions_for_project(project: list[int] | Project):
         return UserProjectPermissions.objects.filter(project=project)
 
     @staticmethod
+    @read_intent
     def get_all_permissions_for_user(user, read=True, write=False, admin=False):
         qs = UserProjectPermissions.objects.filter(user=user)
 
@@ -52,9 +65,24 @@ class AccountService:
 
     @staticmethod
     def get_permission_for_user_project(user, project_id):
-        return UserProjectPermissions.objects.filter(user=user, project_id=project_id).first()
+        # Read from the primary: the value stays in the cache until the next change, a lagging replica would keep it stale
+        permission = PERMISSIONS_CACHE.get_or_set(
+            (user.pk, int(project_id)),
+            lambda: UserProjectPermissions.objects.filter(user=user, project_id=project_id).first(),
+        )
+        return copy.copy(permission)  # The cached instance is shared by the threads
+
+    @staticmethod
+    async def aget_permission_for_user_project(user, project_id):
+        key, generation = (user.pk, int(project_id)), PERMISSIONS_CACHE.generation()
+        permission = PERMISSIONS_CACHE.get(key)
+        if permission is None:
+            permission = await UserProjectPermissions.objects.filter(user=user, project_id=project_id).afirst()
+            PERMISSIONS_CACHE.set(key, permission, generation)
+        return copy.copy(permission)
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def create_permission(
         project, user, can_view: bool = False, can_edit: bool = False, is_admin: bool = False
@@ -68,6 +96,7 @@ class AccountService:
         )
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def update_permission(project_id, permission_id, role: str, requestor: User) -> UserProjectPermissions:
         permission = AccountService.get_permission(project_id, permission_id)
@@ -0,0 +1,18 @@
+from core.invalidation import InvalidationBus
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import UserProjectPermissions
+
+"""
+Invalidate the cached permissions of every worker on change (see accounts.services.PERMISSIONS_CACHE).
+Records written with bulk_create/update must publish the invalidation explicitly.
+"""
+
+
+@receiver(post_save, sender=UserProjectPermissions)
+@receiver(post_delete, sender=UserProjectPermissions)
+def invalidate_permissions(sender, raw=False, **kwargs):
+    if raw:
+        return  # Loading fixtures
+    InvalidationBus.publish("permissions")
@@ -0,0 +1,36 @@
+import pytest
+
+from accounts.services import AccountService
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_is_cached_in_the_process(django_assert_num_queries, user, project, permission):
+    """The permission is read once, then served from the memory of the process"""
+    AccountService.get_permission_for_user_project(user, project.id)
+
+    with django_assert_num_queries(0):
+        cached = AccountService.get_permission_for_user_project(user, project.id)
+
+    assert cached == permission
+    assert cached is not AccountService.get_permission_for_user_project(user, project.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_change_invalidates_the_cache(admin_user, user, project, permission):
+    """Updated and deleted permissions are read again"""
+    AccountService.get_permission_for_user_project(user, project.id)
+
+    AccountService.update_permission(project.id, permission.id, "can_edit", admin_user)
+    assert AccountService.get_permission_for_user_project(user, project.id).can_edit
+
+    permission.delete()
+    assert AccountService.get_permission_for_user_project(user, project.id) is None
+
+
+@pytest.mark.django_db
+def test_permission_is_not_cached_inside_a_transaction(django_assert_num_queries, user, project, permission):
+    """What a transaction reads may be rolled back, the next reads query again"""
+    AccountService.get_permission_for_user_project(user, project.id)
+
+    with django_assert_num_queries(1):
+        AccountService.get_permission_for_user_project(user, project.id)
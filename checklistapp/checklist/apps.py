@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ChecklistConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "checklist"
+
+    def ready(self):
+        # Import signal handlers to maintain the read model of the checklists
+        import checklist.signals  # noqa
@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-19 09:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_count(apps, schema_editor):
+    ProjectTask = apps.get_model("checklist", "ProjectTask")
+    TaskComment = apps.get_model("checklist", "TaskComment")
+
+    active_comments = (
+        TaskComment.objects.filter(project_task=OuterRef("pk"), deleted_at__isnull=True)
+        .values("project_task")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    ProjectTask.objects.update(comment_count=Coalesce(Subquery(active_comments), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checklist", "0002_alter_projectstep_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projecttask",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of active (not deleted) comments, maintained on comment creation and soft delete",
+            ),
+        ),
+        migrations.RunPython(backfill_comment_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-19 10:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checklist", "0003_projecttask_comment_count"),
+        ("projects", "0003_projectarchive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChecklistReadModel",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="projects.project",
+                    ),
+                ),
+                ("version", models.PositiveIntegerField(default=1, help_text="Incremented on every change of the document")),
+                ("data", models.JSONField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
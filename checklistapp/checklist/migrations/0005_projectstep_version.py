@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-19 10:11
+
+import core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checklist", "0004_checklistreadmodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectstep",
+            name="version",
+            field=models.BigIntegerField(
+                default=core.utils.new_version, editable=False, help_text="Changed on every write, used as ETag"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 10:20
+
+from django.db import migrations
+
+
+def drop_read_models(apps, schema_editor):
+    # The steps of the documents now carry their version, the documents are rebuilt on the next read
+    apps.get_model("checklist", "ChecklistReadModel").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checklist", "0005_projectstep_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_read_models, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-19 11:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checklist", "0006_reset_checklistreadmodel"),
+        ("projects", "0005_project_projects_status_due_idx"),
+        ("templates_management", "0008_projectblueprint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectstep",
+            index=models.Index(
+                condition=models.Q(("step_template__isnull", False)),
+                fields=["step_template", "project"],
+                name="checklist_step_template_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(fields=["project_step", "status"], name="checklist_task_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="taskcomment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["project_task", "created_at"],
+                name="checklist_comment_active_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from core.utils import new_version
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from templates_management.models import StepTemplate, TaskTemplate
 
@@ -29,10 +31,19 @@ class ProjectStep(models.Model):
     order = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    version = models.BigIntegerField(default=new_version, editable=False, help_text="Changed on every write, used as ETag")
 
     class Meta:
         ordering = ["order"]
         unique_together = ["project", "order"]
+        indexes = [
+            # Propagation of the templates, joined with the active projects (a partial index cannot filter on another table)
+            models.Index(
+                fields=["step_template", "project"],
+                name="checklist_step_template_idx",
+                condition=models.Q(step_template__isnull=False),
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -47,14 +58,8 @@ class ProjectStep(models.Model):
         """
         total = self.tasks.count()
         if total == 0:
-            return "Not Started"
-        completed = self.tasks.filter(status__in=["done", "na"]).count()
-        if completed == 0:
-            return "Not Started"
-        elif completed == total:
-            return "Completed"
-        else:
-            return "In Progress"
+            return ProjectStep.status_from_counts(0, 0)
+        return ProjectStep.status_from_counts(self.tasks.filter(status__in=["done", "na"]).count(), total)
 
     def get_progress_text(self) -> str:
         """
@@ -62,20 +67,40 @@ class ProjectStep(models.Model):
         """
         total = self.tasks.count()
         if total == 0:
-            return "No tasks"
+            return ProjectStep.progress_text_from_counts(0, 0)
+        return ProjectStep.progress_text_from_counts(self.tasks.filter(status__in=["done", "na"]).count(), total)
 
-        completed = self.tasks.filter(status__in=["done", "na"]).count()
+    def get_completion_percentage(self) -> str:
+        """Returns percentage of completed tasks as a string (e.g., '75%')"""
+        total = self.tasks.count()
+        if total == 0:
+            return ProjectStep.completion_percentage_from_counts(0, 0)
+        return ProjectStep.completion_percentage_from_counts(self.tasks.filter(status__in=["done", "na"]).count(), total)
+
+    # The *_from_counts helpers are shared with the read model (see ReadModelService), which has the counts already
+
+    @staticmethod
+    def status_from_counts(completed: int, total: int) -> str:
+        if total == 0 or completed == 0:
+            return "Not Started"
+        elif completed == total:
+            return "Completed"
+        else:
+            return "In Progress"
+
+    @staticmethod
+    def progress_text_from_counts(completed: int, total: int) -> str:
+        if total == 0:
+            return "No tasks"
         if total > 1:
             return f"{completed} of {total} tasks"
         else:
             return f"{completed} of {total} task"
 
-    def get_completion_percentage(self) -> str:
-        """Returns percentage of completed tasks as a string (e.g., '75%')"""
-        total = self.tasks.count()
+    @staticmethod
+    def completion_percentage_from_counts(completed: int, total: int) -> str:
         if total == 0:
             return 0
-        completed = self.tasks.filter(status__in=["done", "na"]).count()
         return f"{(completed / total):.0%}"
 
 
@@ -107,10 +132,18 @@ class ProjectTask(models.Model):
         default=False,
         help_text="Indicates if the task was created manually or from a template",
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of active (not deleted) comments, maintained on comment creation and soft delete",
+    )
 
     class Meta:
         ordering = ["order"]
         unique_together = ["project_step", "order"]
+        indexes = [
+            # Progress of the steps and projects: count of the done tasks
+            models.Index(fields=["project_step", "status"], name="checklist_task_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.project_step.title} - Task {self.order}"
@@ -144,18 +177,46 @@ class TaskComment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # The comments shown on a task, the deleted ones are never listed
+            models.Index(
+                fields=["project_task", "created_at"],
+                name="checklist_comment_active_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.project_task}"
 
+    @transaction.atomic
     def soft_delete(self):
+        if self.is_deleted:
+            return
+
         self.deleted_at = timezone.now()
         self.save()
 
+        # Use update() to avoid triggering the ProjectTask post_save signal
+        ProjectTask.objects.filter(pk=self.project_task_id, comment_count__gt=0).update(comment_count=F("comment_count") - 1)
+
     @property
     def is_deleted(self):
         return self.deleted_at is not None
 
-    @property
-    def active_comments_count(self):
-        return self.comments.filter(deleted_at__isnull=True).count()
+
+class ChecklistReadModel(models.Model):
+    """
+    Denormalized copy of the checklist of a project (steps, tasks, counts, completion) used to serve
+    the read-only viewers with a single primary-key lookup. Maintained by ReadModelService:
+    the steps touched by a write are rebuilt in the same transaction, bulk operations drop the row
+    and the next read rebuilds it.
+    """
+
+    project = models.OneToOneField("projects.Project", on_delete=models.CASCADE, primary_key=True, related_name="+")
+    version = models.PositiveIntegerField(default=1, help_text="Incremented on every change of the document")
+    data = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __repr__(self):
+        return f"ChecklistReadModel(project_id={self.project_id}, version={self.version})"
@@ -1,13 +1,39 @@
-from core.exceptions import RecordNotFoundError
+from collections.abc import Iterable
+
+from asgiref.sync import sync_to_async
+from core.deletion import fast_delete
+from core.exceptions import InvalidParameterError, RecordNotFoundError
+from core.routers import read_intent, write_intent
 from django.db import models, transaction
-from django.db.models import Count, Max, Prefetch
+from django.db.models import Count, F, Max, Prefetch
+from django.utils.dateparse import parse_datetime
+from live.services import LiveService
+from projects.versions import bump_versions
+from search.services import SearchService
+from templates_management.catalog import StepTemplateSnapshot, TemplateCatalog
 from templates_management.models import StepTemplate, TaskTemplate
 
-from .models import ProjectStep, ProjectTask, TaskComment
+from .models import ChecklistReadModel, ProjectStep, ProjectTask, TaskComment
+
+BULK_BATCH_SIZE = 1000
+
+READ_MODEL_TASK_FIELDS = [
+    "id",
+    "title",
+    "info_text",
+    "help_url",
+    "work_url",
+    "order",
+    "status",
+    "completed_at",
+    "manually_created",
+    "comment_count",
+]
 
 
 class ChecklistService:
     @staticmethod
+    @read_intent
     def get_template(template_id: int | None = None, load_tasks=False):
         qs = StepTemplate.objects.filter(is_active=True).order_by("default_order")
         if load_tasks:
@@ -20,6 +46,18 @@ class ChecklistService:
         return qs
 
     @staticmethod
+    def get_template_catalog() -> tuple[StepTemplateSnapshot, ...]:
+        """Active step templates with their tasks, from the in-memory catalog (read only)"""
+        return TemplateCatalog.get().step_templates
+
+    @staticmethod
+    @read_intent
+    def get_steps(project_id):
+        """Steps of the project, without their tasks"""
+        return ProjectStep.objects.filter(project__id=project_id)
+
+    @staticmethod
+    @read_intent
     def get_step(project_id, step_id: int | None = None, prefetch_related: list[str] | None = None):
         qs = ProjectStep.objects.filter(project__id=project_id)
 
@@ -34,6 +72,21 @@ class ChecklistService:
         return qs
 
     @staticmethod
+    @read_intent
+    async def aget_step(project_id, step_id, prefetch_related: list | None = None) -> ProjectStep:
+        """get_step() of a single step for the async views, with its project"""
+        qs = ProjectStep.objects.filter(project__id=project_id, id=step_id).select_related("project")
+
+        if prefetch_related:
+            qs = qs.prefetch_related(*prefetch_related)
+
+        step = await qs.afirst()
+        if not step:
+            raise RecordNotFoundError(f"Step {step_id} not found in project {project_id}.")
+        return step
+
+    @staticmethod
+    @read_intent
     def get_steps_for_project(project):
         return (
             ProjectStep.objects.filter(project=project)  # i need the project Id that is in url
@@ -43,30 +96,48 @@ class ChecklistService:
         )
 
     @staticmethod
+    @write_intent
     @transaction.atomic
-    def add_step_to_project(project, template_id, custom_title: str | None = None) -> int:
-        step_template = ChecklistService.get_template(template_id, load_tasks=True)
+    def add_steps_to_project(project, items: list[tuple[int, int, str | None]]) -> dict:
+        """
+        Append several steps at once from a list of (template_id, count, custom_title).
+        Whatever the number of steps: 2 queries for the templates, 1 for the order and 1 bulk insert for steps and for tasks.
+        """
+        from projects.services import ArchiveService  # projects.services imports this module
 
-        # Determine inventory order and count
-        result = ProjectStep.objects.filter(project=project).aggregate(max_order=Max("order"), total=Count("id"))
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError("The project is in cold storage, restore it before changing it.")
+
+        templates = {
+            template.id: template
+            for template in ChecklistService.get_template(load_tasks=True).filter(id__in={item[0] for item in items})
+        }
+        missing = {item[0] for item in items} - set(templates)
+        if missing:
+            raise RecordNotFoundError("Step template not found.")
 
-        # Reorder does not follow the count, for example we can have task 1, 2, 3. Delete the 2, add a task and we have 1, 3, 4.
-        # Max Order is 3 avec the delete but count is 2
+        # Determine step order and count in a single query
+        result = ProjectStep.objects.filter(project=project).aggregate(max_order=Max("order"), total=Count("id"))
         current_max_order = result["max_order"] or 0
-        count_step = result["total"]
-
-        # Create the project inventory
-        project_step = ProjectStep.objects.create(
-            project=project,
-            description=step_template.description,
-            step_template=step_template,
-            title=custom_title or step_template.title,
-            icon=getattr(step_template, "icon", "📋"),
-            order=current_max_order + 1,
-        )
 
-        # Create fields from template
-        fields_to_create = [
+        steps = []
+        for template_id, count, custom_title in items:
+            step_template = templates[template_id]
+            for _ in range(count):
+                current_max_order += 1
+                steps.append(
+                    ProjectStep(
+                        project=project,
+                        description=step_template.description,
+                        step_template=step_template,
+                        title=custom_title or step_template.title,
+                        icon=getattr(step_template, "icon", "📋"),
+                        order=current_max_order,
+                    )
+                )
+        ProjectStep.objects.bulk_create(steps, batch_size=BULK_BATCH_SIZE)
+
+        tasks = [
             ProjectTask(
                 project_step=project_step,
                 task_template=task_template,
@@ -76,15 +147,19 @@ class ChecklistService:
                 work_url=task_template.work_url,
                 order=j,
             )
-            for j, task_template in enumerate(step_template.tasks.all())
+            for project_step in steps
+            for j, task_template in enumerate(project_step.step_template.tasks.all())
         ]
+        ProjectTask.objects.bulk_create(tasks, batch_size=BULK_BATCH_SIZE)
 
-        if fields_to_create:
-            ProjectTask.objects.bulk_create(fields_to_create)
-
-        return {"project_step": project_step, "count_step": count_step}
+        SearchService.index_many([*steps, *tasks])  # bulk_create does not send post_save
+        bump_versions([project.pk])
+        ReadModelService.refresh(project.pk, [step.pk for step in steps])
+        LiveService.publish(project.pk, "steps")
+        return {"project_steps": steps, "count_step": result["total"]}
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def reorder_inventory(project, ids: list[int]):
         """
@@ -105,13 +180,27 @@ class ChecklistService:
             steps[step_id].order = index
 
         ProjectStep.objects.bulk_update(steps.values(), ["order"])
+        bump_versions([project.pk])
+        ReadModelService.refresh(project.pk, steps.keys())
+        LiveService.publish(project.pk, "steps")
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def delete_step(project_id, step_id):
-        inventory = ChecklistService.get_step(project_id, step_id)
+        """
+        Delete the step with its tasks and comments using set-based DELETEs (no row loaded in memory).
+        The remaining tasks may all be done now, so the project status is updated like on a task change
+        (a project without tasks keeps its status, as before).
+        """
+        step = ChecklistService.get_step(project_id, step_id)
 
-        inventory.delete()
+        fast_delete(ProjectStep.objects.filter(pk=step.pk))
+        bump_versions([project_id])
+        ReadModelService.refresh(project_id, [step.pk])
+        LiveService.publish(project_id, "steps")
+        if ProjectTask.objects.filter(project_step__project_id=project_id).exists():
+            step.project.update_status()
 
 
 class TaskService:
@@ -122,6 +211,13 @@ class TaskService:
         except ProjectTask.DoesNotExist:
             raise RecordNotFoundError("Task not found.")
 
+    @staticmethod
+    async def aget_task(project_id, step_id, task_id):
+        try:
+            return await ProjectTask.objects.aget(id=task_id, project_step__id=step_id, project_step__project__id=project_id)
+        except ProjectTask.DoesNotExist:
+            raise RecordNotFoundError("Task not found.")
+
     @staticmethod
     @transaction.atomic
     def add_task_to_step(project_id, step_id, title):
@@ -163,6 +259,9 @@ class TaskService:
             raise PermissionError("Impossible to delete this task. Only tasks manually created can be deleted")
 
         task.delete()
+        bump_versions([project_id], step_ids=[task.project_step_id])
+        ReadModelService.refresh(project_id, [task.project_step_id])
+        LiveService.publish(project_id, f"tasks-{task.project_step_id}", f"step-{task.project_step_id}")
 
 
 class CommentService:
@@ -174,3 +273,137 @@ class CommentService:
             project_task__project_step__id=step_id,
             project_task__project_step__project__id=project_id,
         ).select_related("user", "project_task")
+
+    @staticmethod
+    def increment_comment_count(task_id):
+        # Use update() to avoid triggering the ProjectTask post_save signal
+        ProjectTask.objects.filter(pk=task_id).update(comment_count=F("comment_count") + 1)
+        ReadModelService.refresh_task(task_id)
+
+
+class ReadModelService:
+    """
+    Maintain the ChecklistReadModel of the projects: a JSON document
+    {"project": {...}, "frozen": bool, "steps": [{..., "get_status", "get_progress_text", "tasks": [...]}]}
+    shaped like the models so that the same templates render it.
+
+    - refresh() rebuilds the given steps inside the write transaction (task status, comment count, step edit...)
+    - invalidate() drops the documents after bulk operations, they are rebuilt by the next read
+    Nothing is done for projects without document: nobody read them in read-only mode yet.
+
+    Deletions are refreshed explicitly rather than with post_delete receivers, which would make
+    fast_delete fall back to Django's collector.
+    """
+
+    @staticmethod
+    def get(project_id) -> dict:
+        """The read model of the project with its version, built on first access"""
+        row = ChecklistReadModel.objects.filter(pk=project_id).values_list("version", "data").first()
+        if row is None:
+            return ReadModelService.rebuild(project_id)
+        version, data = row
+        return ReadModelService._prepare(data, version)
+
+    @staticmethod
+    async def aget(project_id) -> dict:
+        """get() for the async views, the rebuild of a missing read model runs in a thread"""
+        row = await ChecklistReadModel.objects.filter(pk=project_id).values_list("version", "data").afirst()
+        if row is None:
+            return await sync_to_async(ReadModelService.rebuild)(project_id)
+        version, data = row
+        return ReadModelService._prepare(data, version)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(project_id) -> dict:
+        data = ReadModelService._build(project_id)
+        if data is None:
+            raise RecordNotFoundError("Project not found.")
+        read_model, created = ChecklistReadModel.objects.select_for_update().get_or_create(
+            pk=project_id, defaults={"data": data}
+        )
+        if not created:
+            read_model.data = data
+            read_model.version = F("version") + 1
+            read_model.save(update_fields=["data", "version", "updated_at"])
+            read_model.refresh_from_db(fields=["version"])
+        return ReadModelService._prepare(read_model.data, read_model.version)
+
+    @staticmethod
+    @transaction.atomic
+    def refresh(project_id, step_ids: Iterable[int] = ()):
+        """Rebuild the project header and the given steps (removed if they no longer exist) in the document"""
+        read_model = ChecklistReadModel.objects.select_for_update().filter(pk=project_id).first()
+        if read_model is None:
+            return
+
+        step_ids = set(step_ids)
+        data = ReadModelService._build(project_id, step_ids)
+        if data is None:
+            return  # Project being deleted
+
+        steps = {step["id"]: step for step in read_model.data["steps"] if step["id"] not in step_ids}
+        steps.update({step["id"]: step for step in data["steps"]})
+        data["steps"] = sorted(steps.values(), key=lambda step: step["order"])
+
+        read_model.data = data
+        read_model.version = F("version") + 1
+        read_model.save(update_fields=["data", "version", "updated_at"])
+
+    @staticmethod
+    def refresh_task(task_id):
+        """Refresh the step of a task changed with update(), e.g. its comment counter, its version and the live pages"""
+        ids = ProjectTask.objects.filter(pk=task_id).values_list("project_step__project_id", "project_step_id").first()
+        if ids:
+            bump_versions([ids[0]], step_ids=[ids[1]])
+            ReadModelService.refresh(ids[0], [ids[1]])
+            LiveService.publish(ids[0], f"task-{task_id}")
+
+    @staticmethod
+    def invalidate(project_ids: Iterable[int] | models.QuerySet):
+        ChecklistReadModel.objects.filter(pk__in=project_ids).delete()
+
+    @staticmethod
+    def _build(project_id, step_ids: set[int] | None = None) -> dict | None:
+        """The document of the project, with all the steps or only the given ones"""
+        from projects.models import Project  # projects.models imports the checklist models
+
+        project = Project.objects.filter(pk=project_id).values("id", "name", "description", "status", "archive").first()
+        if project is None:
+            return None
+
+        steps = ProjectStep.objects.filter(project_id=project_id).order_by("order")
+        if step_ids is not None:
+            steps = steps.filter(id__in=step_ids)
+        steps = list(steps.values("id", "title", "description", "icon", "order", "version"))
+
+        tasks = {}
+        for task in (
+            ProjectTask.objects.filter(project_step_id__in=[step["id"] for step in steps])
+            .order_by("order")
+            .values(*READ_MODEL_TASK_FIELDS, "project_step_id", "completed_by__username")
+        ):
+            username = task.pop("completed_by__username")
+            task["completed_by"] = {"username": username} if username else None
+            task["completed_at"] = task["completed_at"].isoformat() if task["completed_at"] else None
+            tasks.setdefault(task.pop("project_step_id"), []).append(task)
+
+        for step in steps:
+            step["tasks"] = tasks.get(step["id"], [])
+            total = len(step["tasks"])
+            completed = sum(task["status"] in ["done", "na"] for task in step["tasks"])
+            step["get_status"] = ProjectStep.status_from_counts(completed, total)
+            step["get_progress_text"] = ProjectStep.progress_text_from_counts(completed, total)
+            step["get_completion_percentage"] = ProjectStep.completion_percentage_from_counts(completed, total)
+
+        frozen = project.pop("archive") is not None
+        return {"project": project, "frozen": frozen, "steps": steps}
+
+    @staticmethod
+    def _prepare(data: dict, version: int) -> dict:
+        """Restore the dates stored as strings in the JSON document"""
+        for step in data["steps"]:
+            for task in step["tasks"]:
+                task["completed_at"] = parse_datetime(task["completed_at"]) if task["completed_at"] else None
+        data["version"] = version
+        return data
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from live.services import LiveService
+from projects.models import Project
+from projects.versions import bump_versions
+
+from .models import ProjectStep, ProjectTask
+from .services import ReadModelService
+
+"""
+Keep the versions and the read model of the checklists in sync on save, and notify the live pages.
+The versions are bumped first, the read model copies the version of the steps.
+Deletions and writes done with bulk_create/update refresh them explicitly (see ReadModelService).
+"""
+
+
+@receiver(post_save, sender=Project)
+def refresh_project_read_model(sender, instance: Project, raw=False, **kwargs):
+    if not raw:
+        bump_versions([instance.pk])
+        ReadModelService.refresh(instance.pk)
+
+
+@receiver(post_save, sender=ProjectStep)
+def refresh_step_read_model(sender, instance: ProjectStep, raw=False, **kwargs):
+    if not raw:
+        bump_versions([instance.project_id], step_ids=[instance.pk])
+        ReadModelService.refresh(instance.project_id, [instance.pk])
+        LiveService.publish(instance.project_id, "steps", f"step-{instance.pk}")
+
+
+@receiver(post_save, sender=ProjectTask)
+def refresh_task_read_model(sender, instance: ProjectTask, raw=False, created=False, **kwargs):
+    if not raw:
+        project_id = instance.project_step.project_id
+        bump_versions([project_id], step_ids=[instance.project_step_id])
+        ReadModelService.refresh(project_id, [instance.project_step_id])
+        events = [f"tasks-{instance.project_step_id}"] if created else [f"task-{instance.pk}"]
+        LiveService.publish(project_id, *events, f"step-{instance.project_step_id}")
@@ -310,6 +310,25 @@ def test_task_comment_soft_delete(project, user):
     assert comment.is_deleted is True
 
 
+@pytest.mark.django_db
+def test_task_comment_soft_delete_decrements_comment_count(project, user):
+    """Test soft deleting a comment decrements the task comment counter only once"""
+    step = ProjectStep.objects.create(project=project, title="Test Step", icon="📝", order=1)
+
+    task = ProjectTask.objects.create(project_step=step, title="Test Task", order=1, comment_count=2)
+
+    comment = TaskComment.objects.create(project_task=task, user=user, comment_text="This is a test comment")
+
+    comment.soft_delete()
+    task.refresh_from_db()
+    assert task.comment_count == 1
+
+    # Deleting twice must not decrement again
+    comment.soft_delete()
+    task.refresh_from_db()
+    assert task.comment_count == 1
+
+
 @pytest.mark.django_db
 def test_task_comment_is_deleted_property(project, user):
     """Test is_deleted property"""
@@ -0,0 +1,88 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from checklist.models import ChecklistReadModel, ProjectStep, ProjectTask, TaskComment
+from checklist.services import ChecklistService, CommentService, ReadModelService, TaskService
+
+
+@pytest.fixture
+def project_step(project):
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    ProjectTask.objects.create(project_step=step, title="Tag", order=1)
+    ProjectTask.objects.create(project_step=step, title="Release", order=2, status="done")
+    return step
+
+
+@pytest.mark.django_db
+def test_read_model_built_on_first_access(project, project_step):
+    """The document mirrors the models, with the counts computed once"""
+    read_model = ReadModelService.get(project.pk)
+
+    step = read_model["steps"][0]
+    assert read_model["project"]["name"] == project.name
+    assert read_model["frozen"] is False
+    assert [task["title"] for task in step["tasks"]] == ["Tag", "Release"]
+    assert step["get_status"] == project_step.get_status() == "In Progress"
+    assert step["get_progress_text"] == project_step.get_progress_text() == "1 of 2 tasks"
+    assert step["get_completion_percentage"] == project_step.get_completion_percentage() == "50%"
+
+    with CaptureQueriesContext(connection) as queries:
+        ReadModelService.get(project.pk)
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_read_model_refreshed_on_writes(user, project, project_step):
+    """Task status, comment counters, new and deleted steps are reflected with a new version"""
+    version = ReadModelService.get(project.pk)["version"]
+    task = project_step.tasks.get(title="Tag")
+
+    TaskService.update_task_status(project.pk, project_step.pk, task.pk, "done", user)
+    read_model = ReadModelService.get(project.pk)
+    assert read_model["version"] > version
+    assert read_model["steps"][0]["get_status"] == "Completed"
+    assert read_model["steps"][0]["tasks"][0]["completed_by"] == {"username": user.username}
+    assert read_model["steps"][0]["tasks"][0]["completed_at"] == ProjectTask.objects.get(pk=task.pk).completed_at
+    assert read_model["project"]["status"] == "completed"
+
+    TaskComment.objects.create(project_task=task, user=user, comment_text="Done")
+    CommentService.increment_comment_count(task.pk)
+    assert ReadModelService.get(project.pk)["steps"][0]["tasks"][0]["comment_count"] == 1
+
+    second = ProjectStep.objects.create(project=project, title="Check", icon="📝", order=2)
+    assert [step["title"] for step in ReadModelService.get(project.pk)["steps"]] == ["Deploy", "Check"]
+
+    ChecklistService.reorder_inventory(project, [second.pk, project_step.pk])
+    assert [step["title"] for step in ReadModelService.get(project.pk)["steps"]] == ["Check", "Deploy"]
+
+    ChecklistService.delete_step(project.pk, second.pk)
+    assert [step["title"] for step in ReadModelService.get(project.pk)["steps"]] == ["Deploy"]
+
+
+@pytest.mark.django_db
+def test_read_model_invalidate(project, project_step):
+    ReadModelService.get(project.pk)
+
+    ReadModelService.invalidate([project.pk])
+
+    assert not ChecklistReadModel.objects.exists()
+    assert ReadModelService.get(project.pk)["steps"][0]["title"] == "Deploy"
+
+
+@pytest.mark.django_db
+def test_read_only_step_detail_served_from_read_model(client, user, project, permission, project_step):
+    """Viewers get the same page from the read model, without counting the tasks"""
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.pk, "step_id": project_step.pk})
+    assert client.get(url).status_code == 200  # Full page, builds the read model
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, headers={"HX-Request": "true"})
+
+    content = response.content.decode()
+    assert response.status_code == 200
+    assert "Release" in content and "1 of 2 tasks" in content
+    assert not any("checklist_projecttask" in query["sql"] for query in queries.captured_queries)
+    assert sum("checklist_checklistreadmodel" in query["sql"] for query in queries.captured_queries) == 1
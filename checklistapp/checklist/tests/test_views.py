@@ -1,9 +1,15 @@
 import pytest
 from accounts.models import UserProjectPermissions
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from projects.services import ArchiveService
 from templates_management.models import StepTemplate, TaskTemplate
 
 from checklist.models import ProjectStep, ProjectTask, TaskComment
+from checklist.services import TaskService
 
 
 @pytest.fixture
@@ -81,7 +87,7 @@ def test_project_step_detail_with_step_id(client, user, project, permission, pro
 
     assert response.status_code == 200
     assert "active_step" in response.context
-    assert response.context["active_step"] == project_step
+    assert response.context["active_step"]["id"] == project_step.id  # Viewers are served from the read model
     assert "tasks" in response.context
 
 
@@ -178,6 +184,47 @@ def test_add_project_step_invalid_template(client, admin_user, project, admin_pe
     assert ProjectStep.objects.filter(project=project).count() == 0
 
 
+@pytest.mark.django_db
+def test_add_project_steps_batch(
+    client, admin_user, project, admin_permission, step_template, task_template, django_assert_max_num_queries
+):
+    """Test adding several steps in one request renders all the rows"""
+    other = StepTemplate.objects.create(title="Release", icon="🚀", default_order=2)
+    ProjectStep.objects.create(project=project, title="Existing", icon="📝", order=4)
+    client.login(username=admin_user.username, password="password")
+
+    url = reverse("projects:checklist:step_add", kwargs={"project_id": project.id})
+    data = {"step_template_id": [step_template.id, other.id], "count": ["3", "1"], "override_name": ["Region", ""]}
+    response = client.post(url, data)
+
+    assert response.status_code == 200
+    steps = list(ProjectStep.objects.filter(project=project).order_by("order").values_list("title", "order"))
+    assert steps == [("Existing", 4), ("Region", 5), ("Region", 6), ("Region", 7), ("Release", 8)]
+    assert ProjectTask.objects.filter(project_step__project=project).count() == 3
+    content = response.content.decode()
+    assert content.count('draggable="true"') == 4
+    assert "5 steps" in content  # OOB counter
+    assert "HX-Reswap" not in response
+
+    # The number of queries does not depend on the number of steps
+    data["count"] = ["20", "20"]
+    with django_assert_max_num_queries(25):
+        client.post(url, data)
+
+
+@pytest.mark.django_db
+def test_add_project_steps_batch_invalid(client, admin_user, project, admin_permission, step_template):
+    """Test a batch with an invalid count or an unknown template adds nothing"""
+    client.login(username=admin_user.username, password="password")
+    url = reverse("projects:checklist:step_add", kwargs={"project_id": project.id})
+
+    client.post(url, {"step_template_id": [step_template.id], "count": ["0"]})
+    client.post(url, {"step_template_id": [step_template.id, 99999], "count": ["1", "1"]})
+    client.post(url, {"step_template_id": [step_template.id], "count": ["1", "2"]})
+
+    assert ProjectStep.objects.filter(project=project).count() == 0
+
+
 # RemoveProjectStepView Tests
 
 
@@ -206,6 +253,22 @@ def test_remove_project_step_success(client, admin_user, project, admin_permissi
     assert not ProjectStep.objects.filter(id=project_step.id).exists()
 
 
+@pytest.mark.django_db
+def test_remove_project_step_updates_project_status(client, admin_user, project, admin_permission, project_step):
+    """Removing the only pending tasks completes the project"""
+    done_step = ProjectStep.objects.create(project=project, title="Done", icon="📝", order=2)
+    ProjectTask.objects.create(project_step=done_step, title="Done", order=1, status="done")
+    ProjectTask.objects.create(project_step=project_step, title="Pending", order=1)
+    client.login(username=admin_user.username, password="password")
+
+    url = reverse("projects:checklist:step_delete", kwargs={"project_id": project.id, "step_id": project_step.id})
+    client.delete(url)
+
+    project.refresh_from_db()
+    assert project.status == "completed"
+    assert not ProjectTask.objects.filter(title="Pending").exists()
+
+
 # ReorderProjectStepsView Tests
 
 
@@ -491,7 +554,7 @@ def test_task_comment_list_view(client, user, project, project_step, project_tas
 
     assert response.status_code == 200
     assert "comments" in response.context
-    assert response.context["comments"].count() == 2
+    assert len(response.context["comments"]) == 2
 
 
 @pytest.mark.django_db
@@ -512,7 +575,7 @@ def test_task_comment_list_excludes_deleted(client, user, project, project_step,
     response = client.get(url)
 
     assert response.status_code == 200
-    assert response.context["comments"].count() == 1
+    assert len(response.context["comments"]) == 1
 
 
 # TaskCommentCreateView Tests
@@ -554,6 +617,11 @@ def test_task_comment_create_success(client, user, project, project_step, projec
     assert comment.comment_text == "New comment"
     assert comment.user == user
 
+    # Check the counter was incremented and returned out-of-band
+    project_task.refresh_from_db()
+    assert project_task.comment_count == 1
+    assert f'id="comment-count-{project_task.id}"' in response.content.decode()
+
 
 # TaskCommentUpdateView Tests
 
@@ -623,6 +691,34 @@ def test_task_comment_delete_own_comment(client, user, project, project_step, pr
     assert comment.is_deleted is True
 
 
+@pytest.mark.django_db
+def test_task_comment_delete_updates_comment_count(client, user, project, project_step, project_task):
+    """Test deleting a comment decrements the counter and returns the updated badge"""
+    UserProjectPermissions.objects.create(user=user, project=project, can_view=True, can_edit=True)
+
+    client.login(username=user.username, password="password")
+
+    create_url = reverse(
+        "projects:checklist:comment_create",
+        kwargs={"project_id": project.id, "step_id": project_step.id, "task_id": project_task.id},
+    )
+    client.post(create_url, {"comment_text": "First"})
+    client.post(create_url, {"comment_text": "Second"})
+
+    comment = TaskComment.objects.filter(project_task=project_task).first()
+    url = reverse(
+        "projects:checklist:comment_delete",
+        kwargs={"project_id": project.id, "step_id": project_step.id, "task_id": project_task.id, "comment_id": comment.id},
+    )
+    response = client.delete(url)
+
+    assert response.status_code == 200
+    assert 'hx-swap-oob="true"' in response.content.decode()
+
+    project_task.refresh_from_db()
+    assert project_task.comment_count == 1
+
+
 @pytest.mark.django_db
 def test_task_comment_admin_can_delete_any_comment(
     client, user, admin_user, project, admin_permission, project_step, project_task
@@ -669,4 +765,212 @@ def test_list_step_view(client, user, project, permission, project_step):
 
     assert response.status_code == 200
     assert "steps" in response.context
-    assert project_step in response.context["steps"]
+    assert project_step.id in [step["id"] for step in response.context["steps"]]  # Served from the read model
+
+
+# Conditional GET
+
+
+@pytest.mark.django_db
+def test_step_detail_partial_answers_not_modified(client, user, project, permission, project_step, project_task):
+    """An unchanged step is answered with 304 without rendering"""
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+
+    response = client.get(url, HTTP_HX_REQUEST="true")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert "no-cache" in response.headers["Cache-Control"]
+
+    response = client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_step_detail_etag_changes_on_task_update(client, user, project, project_step, project_task):
+    """Updating a task changes the ETag of its step and of the step list"""
+    UserProjectPermissions.objects.create(user=user, project=project, can_view=True, can_edit=True)
+    client.login(username=user.username, password="password")
+    step_url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+    list_url = reverse("projects:checklist:list_steps", kwargs={"project_id": project.id})
+    step_etag = client.get(step_url, HTTP_HX_REQUEST="true").headers["ETag"]
+    list_etag = client.get(list_url, HTTP_HX_REQUEST="true").headers["ETag"]
+
+    client.post(
+        reverse(
+            "projects:checklist:task_status_update",
+            kwargs={"project_id": project.id, "step_id": project_step.id, "task_id": project_task.id},
+        ),
+        {"status": "done"},
+    )
+
+    response = client.get(step_url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=step_etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != step_etag
+    assert client.get(list_url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=list_etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_step_detail_etag_depends_on_roles(client, user, project, permission, project_step):
+    """An admin and a viewer do not share the ETag of a step, the rendered actions differ"""
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+    etag = client.get(url, HTTP_HX_REQUEST="true").headers["ETag"]
+
+    permission.is_admin = True
+    permission.save()
+
+    assert client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_step_detail_full_page_has_no_etag(client, user, project, permission, project_step):
+    """Full pages render the messages and the navigation, they are never answered with 304"""
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+# Cached step cards
+
+
+@pytest.mark.django_db
+def test_step_cards_are_served_from_the_fragment_cache(client, user, project, permission, project_step, project_task):
+    """The cards are rendered once per version, the tasks are not counted again"""
+    caches["fragments"].clear()
+    permission.can_edit = True
+    permission.save()
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:list_steps", kwargs={"project_id": project.id})
+
+    with CaptureQueriesContext(connection) as first:
+        assert b"0 of 1 task" in client.get(url).content
+    with CaptureQueriesContext(connection) as second:
+        assert b"0 of 1 task" in client.get(url).content
+    assert len(second) < len(first)
+
+    TaskService.update_task_status(project.id, project_step.id, project_task.id, "done", user)
+
+    assert b"1 of 1 task" in client.get(url).content
+
+
+@pytest.mark.django_db
+def test_step_cards_fragment_cache_follows_the_release(client, settings, user, project, permission, project_step, project_task):
+    """A new release renders the cards again with its templates"""
+    caches["fragments"].clear()
+    permission.can_edit = True
+    permission.save()
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:list_steps", kwargs={"project_id": project.id})
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as cached:
+        client.get(url)
+    settings.RELEASE = "next"
+    with CaptureQueriesContext(connection) as released:
+        client.get(url)
+
+    assert len(released) > len(cached)
+
+
+# Live fragments
+
+
+@pytest.mark.django_db
+def test_task_row_view(client, user, project, permission, project_step, project_task):
+    """The row of a single task is served for the live pages, also to viewers"""
+    client.login(username=user.username, password="password")
+    url = reverse(
+        "projects:checklist:task_row",
+        kwargs={"project_id": project.id, "step_id": project_step.id, "task_id": project_task.id},
+    )
+
+    response = client.get(url, HTTP_HX_REQUEST="true")
+
+    assert response.status_code == 200
+    assert f'id="task-{project_task.id}"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_step_card_view_keeps_the_active_step(client, user, project, permission, project_step):
+    """The card is rendered highlighted when the page shows its step"""
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_card", kwargs={"project_id": project.id, "step_id": project_step.id})
+
+    response = client.get(url, {"active": project_step.id}, HTTP_HX_REQUEST="true")
+
+    assert response.status_code == 200
+    assert 'active-step"' in response.content.decode()
+    assert 'active-step"' not in client.get(url, HTTP_HX_REQUEST="true").content.decode()
+
+
+# Async read endpoints
+
+
+@pytest.mark.django_db
+def test_step_detail_partial_for_editor(client, user, project, project_step, project_task):
+    """The tasks of a step are loaded with the async ORM for the editors"""
+    UserProjectPermissions.objects.create(user=user, project=project, can_view=True, can_edit=True)
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+
+    response = client.get(url, HTTP_HX_REQUEST="true")
+
+    assert response.status_code == 200
+    assert [task.id for task in response.context["tasks"]] == [project_task.id]
+    assert response.context["can_edit"] is True
+    assert 'id="task-list"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_step_detail_partial_redirects_frozen_project(client, user, project, project_step):
+    """The async path sends the editors of a frozen project to its archive, like the full page"""
+    UserProjectPermissions.objects.create(user=user, project=project, can_view=True, can_edit=True)
+    project.status = "archived"
+    project.save()
+    ArchiveService.freeze(project)
+    client.login(username=user.username, password="password")
+    url = reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id})
+
+    response = client.get(url, HTTP_HX_REQUEST="true")
+
+    assert response.status_code == 302
+    assert response.url == reverse("projects:project_archive", kwargs={"project_id": project.id})
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_endpoints_with_async_client(async_client, user, project, permission, project_step, project_task):
+    """The read endpoints are served on the event loop, as under ASGI"""
+    async_to_sync(async_client.aforce_login)(user)
+    urls = [
+        reverse("projects:checklist:list_steps", kwargs={"project_id": project.id}),
+        reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": project_step.id}),
+        reverse(
+            "projects:checklist:comment_list",
+            kwargs={"project_id": project.id, "step_id": project_step.id, "task_id": project_task.id},
+        ),
+        reverse("projects:inventory:list_inventory", kwargs={"project_id": project.id}),
+    ]
+
+    for url in urls:
+        response = async_to_sync(async_client.get)(url, headers={"HX-Request": "true"})
+        assert response.status_code == 200, url
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_read_endpoints_check_permission(async_client, user, project, project_step):
+    """The async access mixins redirect the anonymous users and refuse the users without permission"""
+    url = reverse("projects:checklist:list_steps", kwargs={"project_id": project.id})
+
+    response = async_to_sync(async_client.get)(url)
+    assert response.status_code == 302
+    assert "/login" in response.url
+
+    async_to_sync(async_client.aforce_login)(user)
+    assert async_to_sync(async_client.get)(url).status_code == 403
@@ -38,6 +38,8 @@ urlpatterns = [
         name="step_reorder",
     ),
     # Task URLs
+    path("<int:step_id>/card/", views.StepCardView.as_view(), name="step_card"),
+    path("<int:step_id>/tasks/<int:task_id>/", views.TaskRowView.as_view(), name="task_row"),
     path(
         "<int:step_id>/tasks/task_create/",
         views.AddProjectTaskView.as_view(),
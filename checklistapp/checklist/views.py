@@ -1,18 +1,25 @@
 import logging
 
 from accounts.services import AccountService
+from asgiref.sync import sync_to_async
 from common.views import editable_header_view
-from core.exceptions import InvalidParameterError
+from core.exceptions import InvalidParameterError, RecordNotFoundError
 from core.mixins import (
+    AsyncConditionalGetMixin,
+    AsyncProjectReadRequiredMixin,
     CommonContextMixin,
+    ConditionalGetMixin,
     OwnerOrAdminMixin,
     ProjectAdminRequiredMixin,
     ProjectEditRequiredMixin,
     ProjectReadRequiredMixin,
 )
+from core.utils import arender
 from django.contrib import messages
-from django.http import HttpResponse
-from django.shortcuts import render
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponse
+from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.views import View
@@ -20,16 +27,15 @@ from django.views.generic import (
     CreateView,
     DeleteView,
     DetailView,
-    ListView,
     UpdateView,
 )
 from django.views.generic.base import ContextMixin
 from django_htmx.http import reswap
 from projects.models import Project
-from projects.services import ProjectService
+from projects.services import ArchiveService, ProjectService
 
-from .models import ProjectStep, TaskComment
-from .services import ChecklistService, CommentService, TaskService
+from .models import ProjectStep, ProjectTask, TaskComment
+from .services import ChecklistService, CommentService, ReadModelService, TaskService
 
 logger = logging.getLogger(__name__)
 
@@ -48,15 +54,17 @@ class ListProjectStepView(ProjectAdminRequiredMixin, CommonContextMixin, DetailV
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        context["available_templates"] = ChecklistService.get_template(load_tasks=True)
+        context["available_templates"] = ChecklistService.get_template_catalog()
         context["project_steps"] = ChecklistService.get_steps_for_project(self.object)
         return context
 
 
-class ProjectStepDetailView(ProjectReadRequiredMixin, CommonContextMixin, DetailView):
+class ProjectStepDetailView(AsyncProjectReadRequiredMixin, AsyncConditionalGetMixin, CommonContextMixin, DetailView):
     """
     View to display project details, including steps and tasks.
     Supports HTMX requests to load tasks for a specific step.
+
+    The HTMX requests of a step are served with the async ORM, the full page runs in a thread.
     """
 
     model = Project
@@ -66,7 +74,7 @@ class ProjectStepDetailView(ProjectReadRequiredMixin, CommonContextMixin, Detail
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["steps"] = ChecklistService.get_steps_for_project(self.object)
+        context["steps"] = ChecklistService.get_steps(self.object.id)  # Cards are cached, tasks are only counted on a miss
         context["completion"] = self.object.get_completion_percentage()
 
         # Si un step_id est dans l'URL, on charge ce step
@@ -83,6 +91,87 @@ class ProjectStepDetailView(ProjectReadRequiredMixin, CommonContextMixin, Detail
 
         return context
 
+    async def get_etag_version(self):
+        if step_id := self.kwargs.get("step_id"):
+            return (
+                await ProjectStep.objects.filter(pk=step_id, project_id=self.kwargs["project_id"])
+                .values_list("version", flat=True)
+                .afirst()
+            )
+        return await Project.objects.filter(pk=self.kwargs["project_id"]).values_list("version", flat=True).afirst()
+
+    async def get(self, request, *args, **kwargs):
+        if request.htmx and kwargs.get("step_id"):
+            return await self.get_tasks(request, kwargs["project_id"], kwargs["step_id"])
+        return await sync_to_async(self.get_page)(request, *args, **kwargs)
+
+    def get_page(self, request, *args, **kwargs):
+        if not self.user_permission.can_edit and not self.user_permission.is_admin:
+            read_model = ReadModelService.get(kwargs["project_id"])
+            if read_model["frozen"]:
+                return redirect("projects:project_archive", project_id=kwargs["project_id"])
+            context = self.get_read_only_context(read_model, kwargs["project_id"], kwargs.get("step_id"))
+            return self.render_to_response(context)
+
+        # Projects in cold storage have no steps anymore, their content is read from the snapshot
+        if ArchiveService.is_frozen(kwargs["project_id"]):
+            return redirect("projects:project_archive", project_id=kwargs["project_id"])
+        return super().get(request, *args, **kwargs)
+
+    async def get_tasks(self, request, project_id, step_id):
+        """The tasks of a step swapped in the page, without the project and the other steps"""
+        if not self.user_permission.can_edit and not self.user_permission.is_admin:
+            read_model = await ReadModelService.aget(project_id)
+            if read_model["frozen"]:
+                return redirect("projects:project_archive", project_id=project_id)
+            context = self.get_read_only_context(read_model, project_id, step_id)
+            return await arender(request, "checklist/partials/tasks_page.html", context)
+
+        if await ArchiveService.ais_frozen(project_id):
+            return redirect("projects:project_archive", project_id=project_id)
+
+        step = await ChecklistService.aget_step(
+            project_id, step_id, prefetch_related=[Prefetch("tasks", ProjectTask.objects.select_related("completed_by"))]
+        )
+        roles = AccountService.permission_to_list(self.user_permission)
+        context = {
+            "project_id": project_id,
+            "step_id": step_id,
+            "roles": roles,
+            "active_step": step,
+            "active_step_id": step_id,
+            "tasks": step.tasks.all(),
+            "can_edit": "edit" in roles,
+            "edit_endpoint_base": reverse(
+                "projects:checklist:step_header_edit", kwargs={"project_id": project_id, "step_id": step_id}
+            ),
+        }
+        return await arender(request, "checklist/partials/tasks_page.html", context)
+
+    def get_read_only_context(self, read_model, project_id, step_id=None) -> dict:
+        """Viewers are served from the read model of the project: a single primary-key lookup"""
+        context = {
+            "project": read_model["project"],
+            "project_id": project_id,
+            "step_id": step_id,
+            "steps": read_model["steps"],
+            "roles": AccountService.permission_to_list(self.user_permission),
+        }
+        if step_id:
+            step = next((step for step in read_model["steps"] if step["id"] == step_id), None)
+            if step is None:
+                raise Http404("Step not found.")
+            context.update(
+                active_step=step,
+                active_step_id=step_id,
+                tasks=step["tasks"],
+                can_edit=False,
+                edit_endpoint_base=reverse(
+                    "projects:checklist:step_header_edit", kwargs={"project_id": project_id, "step_id": step_id}
+                ),
+            )
+        return context
+
     def render_to_response(self, context, **response_kwargs):
         # Si c'est une requête HTMX, retourne seulement le partial des tâches
         if self.request.headers.get("HX-Request"):
@@ -94,40 +183,46 @@ class ProjectStepDetailView(ProjectReadRequiredMixin, CommonContextMixin, Detail
 
 class AddProjectStepView(ProjectAdminRequiredMixin, View):
     """
-    View to handle adding a new step to a project via HTMX.
-    Expects POST data with 'step_template_id' and optional 'override_name'.
-    Returns HTML fragment for the new step card that will be inserted via HTMX.
-    If it's the first step, also returns the empty state replacement.
+    View to handle adding one or several steps to a project via HTMX.
+    Expects POST data with aligned lists of 'step_template_id', optional 'count' (default 1)
+    and optional 'override_name', all the steps are created in a single transaction.
+    Returns HTML fragment for the new step cards that will be inserted via HTMX.
+    If they are the first steps, also returns the empty state replacement.
     """
 
+    MAX_STEPS = 200
+
     def post(self, request, project_id):
         try:
             project = ProjectService.get(project_id)
 
-            step_template_id = request.POST.get("step_template_id")
-            override_name = request.POST.get("override_name", "").strip()
+            items = self._parse_items(request.POST)
+            result = ChecklistService.add_steps_to_project(project=project, items=items)
 
-            result = ChecklistService.add_step_to_project(
-                project=project, template_id=step_template_id, custom_title=override_name
-            )
-
-            project_step = result["project_step"]
+            project_steps = result["project_steps"]
             count_step = result["count_step"]
 
             # Compute new step counter HTML that will be updated OOB
             step_counter = render_to_string(
                 "checklist/partials/project_step_form.html#counter_step",
-                {"count": count_step + 1, "oob": True},
+                {"count": count_step + len(project_steps), "oob": True},
             )
 
-            # If it's the first step, change the hx-swap to replace the empty state div
-            step_content = render_to_string(
-                "checklist/partials/project_step_form.html#step_row",
-                {"step": project_step, "project": project},
-                request=request,
+            # Reload the new steps with their tasks prefetched to render all the rows with 2 queries
+            new_steps = ChecklistService.get_steps_for_project(project).filter(id__in=[step.id for step in project_steps])
+            step_content = "".join(
+                render_to_string(
+                    "checklist/partials/project_step_form.html#step_row",
+                    {"step": project_step, "project": project},
+                    request=request,
+                )
+                for project_step in new_steps
             )
 
-            messages.success(request, "Step added successfully.")
+            messages.success(
+                request,
+                "Step added successfully." if len(project_steps) == 1 else f"{len(project_steps)} steps added successfully.",
+            )
 
             response = HttpResponse(step_counter + step_content)
 
@@ -142,6 +237,27 @@ class AddProjectStepView(ProjectAdminRequiredMixin, View):
                 messages.error(request, "Something went wrong when adding the step to the project.")
             return reswap(HttpResponse(status=200), "none")
 
+    def _parse_items(self, data) -> list[tuple[int, int, str]]:
+        """Zip the posted lists into (template_id, count, title), the single template form only posts an id and a name"""
+        template_ids = data.getlist("step_template_id")
+        counts = data.getlist("count") or ["1"] * len(template_ids)
+        titles = data.getlist("override_name") or [""] * len(template_ids)
+
+        if not template_ids or len(counts) != len(template_ids) or len(titles) != len(template_ids):
+            raise InvalidParameterError("Invalid step templates selection.")
+
+        try:
+            items = [
+                (int(template_id), int(count), title.strip()) for template_id, count, title in zip(template_ids, counts, titles)
+            ]
+        except ValueError:
+            raise InvalidParameterError("Invalid step templates selection.")
+
+        if any(count < 1 for _, count, _ in items) or sum(count for _, count, _ in items) > self.MAX_STEPS:
+            raise InvalidParameterError(f"Between 1 and {self.MAX_STEPS} steps can be added at once.")
+
+        return items
+
 
 class ReorderProjectStepsView(ProjectAdminRequiredMixin, View):
     """
@@ -179,7 +295,7 @@ class RemoveProjectStepView(ProjectAdminRequiredMixin, View):
             ChecklistService.delete_step(project_id, step_id)
 
             # Check if there are any steps left
-            remaining_steps = ChecklistService.get_step(project_id).count()
+            remaining_steps = ChecklistService.get_steps(project_id).count()
 
             # Compute new step counter HTML that will be updated OOB
             step_counter = render_to_string(
@@ -309,39 +425,114 @@ def toggle_task_form(request, project_id, step_id):
     )
 
 
-class ListStepView(ProjectReadRequiredMixin, CommonContextMixin, ListView):
+class ListStepView(AsyncProjectReadRequiredMixin, AsyncConditionalGetMixin, CommonContextMixin, ContextMixin, View):
     """
     View to display project details, including steps and tasks.
     Supports HTMX requests to load tasks for a specific step.
     """
 
-    model = ProjectStep
     template_name = "checklist/partials/step_cards.html"
-    context_object_name = "steps"
-    pk_url_kwarg = "project_id"
 
-    def get_queryset(self):
-        project_id = self.kwargs.get(self.pk_url_kwarg)
-        return ChecklistService.get_step(project_id)
+    async def get_etag_version(self):
+        return await Project.objects.filter(pk=self.kwargs["project_id"]).values_list("version", flat=True).afirst()
 
+    async def get(self, request, project_id):
+        if not self.user_permission.can_edit and not self.user_permission.is_admin:
+            steps = (await ReadModelService.aget(project_id))["steps"]  # Viewers are served from the read model
+        else:
+            steps = [step async for step in ChecklistService.get_steps(project_id)]
 
-class TaskCommentListView(ProjectReadRequiredMixin, CommonContextMixin, ListView):
-    model = TaskComment
-    template_name = "checklist/partials/comment_list.html"
-    context_object_name = "comments"
+        context = self.get_context_data(steps=steps, active_step_id=_active_step_id(request))
+        return await arender(request, self.template_name, context)
 
-    def get_queryset(self):
-        project_id = self.kwargs.get("project_id")
-        step_id = self.kwargs.get("step_id")
-        task_id = self.kwargs.get("task_id")
 
-        result = CommentService.get_comments_on_task(project_id, step_id, task_id)
-        return result
+def _active_step_id(request) -> int | None:
+    """Step highlighted in the sidebar of the page re-fetching a card or the list (see static/js/live.js)"""
+    active = request.GET.get("active", "")
+    return int(active) if active.isdigit() else None
+
+
+class StepCardView(ProjectReadRequiredMixin, ConditionalGetMixin, CommonContextMixin, ContextMixin, View):
+    """Card of a step in the sidebar, re-fetched by the live pages when the step changes"""
+
+    def get_etag_version(self):
+        return (
+            ProjectStep.objects.filter(pk=self.kwargs["step_id"], project_id=self.kwargs["project_id"])
+            .values_list("version", flat=True)
+            .first()
+        )
+
+    def get(self, request, project_id, step_id):
+        try:
+            context = self.get_context_data()
+            if not self.user_permission.can_edit and not self.user_permission.is_admin:
+                step = _read_model_step(project_id, step_id)
+            else:
+                step = ChecklistService.get_step(project_id, step_id)
+            context.update(step=step, active_step_id=_active_step_id(request))
+            return render(request, "checklist/partials/step_cards.html#step_item", context)
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(request, str(e))
+            else:
+                messages.error(request, "Something went wrong when loading the step.")
+            return reswap(HttpResponse(status=200), "none")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context["task"] = TaskService.get_task(context.get("project_id"), context.get("step_id"), context.get("task_id"))
-        return context
+
+class TaskRowView(ProjectReadRequiredMixin, ConditionalGetMixin, CommonContextMixin, ContextMixin, View):
+    """Row of a task, re-fetched by the live pages when the task changes"""
+
+    def get_etag_version(self):
+        return (
+            ProjectStep.objects.filter(pk=self.kwargs["step_id"], project_id=self.kwargs["project_id"])
+            .values_list("version", flat=True)
+            .first()
+        )
+
+    def get(self, request, project_id, step_id, task_id):
+        try:
+            context = self.get_context_data()
+            if not self.user_permission.can_edit and not self.user_permission.is_admin:
+                tasks = _read_model_step(project_id, step_id)["tasks"]
+                task = next((task for task in tasks if task["id"] == task_id), None)
+                if task is None:
+                    raise RecordNotFoundError("Task not found.")
+            else:
+                task = TaskService.get_task(project_id, step_id, task_id)
+            context["task"] = task
+            return render(request, "checklist/partials/task_row.html", context)
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(request, str(e))
+            else:
+                messages.error(request, "Something went wrong when loading the task.")
+            return reswap(HttpResponse(status=200), "none")
+
+
+def _read_model_step(project_id, step_id) -> dict:
+    step = next((step for step in ReadModelService.get(project_id)["steps"] if step["id"] == step_id), None)
+    if step is None:
+        raise RecordNotFoundError(f"Step {step_id} not found in project {project_id}.")
+    return step
+
+
+def _render_comment_counter(task_id):
+    """Render the comment counter badge of a task, swapped out-of-band in the task row"""
+    task = ProjectTask.objects.only("id", "comment_count").get(pk=task_id)
+    return render_to_string("checklist/partials/task_row.html#comment_counter", {"task": task, "oob": True})
+
+
+class TaskCommentListView(AsyncProjectReadRequiredMixin, CommonContextMixin, ContextMixin, View):
+    template_name = "checklist/partials/comment_list.html"
+
+    async def get(self, request, project_id, step_id, task_id):
+        comments = [comment async for comment in CommentService.get_comments_on_task(project_id, step_id, task_id)]
+        task = await TaskService.aget_task(project_id, step_id, task_id)
+
+        context = self.get_context_data(comments=comments, task=task)
+        return await arender(request, self.template_name, context)
 
 
 class TaskCommentCreateView(ProjectEditRequiredMixin, CommonContextMixin, CreateView):
@@ -358,13 +549,16 @@ class TaskCommentCreateView(ProjectEditRequiredMixin, CommonContextMixin, Create
 
         form.instance.user = self.request.user
         form.instance.project_task_id = context.get("task_id")
-        self.object = form.save()
+        with transaction.atomic():
+            self.object = form.save()
+            CommentService.increment_comment_count(self.object.project_task_id)
 
         context["comment"] = self.object
         context["user"] = self.request.user
 
         html = render_to_string("checklist/partials/comment_item.html", context)
-        return HttpResponse(html)
+        counter_html = _render_comment_counter(self.object.project_task_id)
+        return HttpResponse(html + counter_html)
 
 
 class TaskCommentUpdateView(OwnerOrAdminMixin, CommonContextMixin, UpdateView):
@@ -418,7 +612,8 @@ class TaskCommentDeleteView(ProjectEditRequiredMixin, DeleteView):
     def delete(self, request, *args, **kwargs):
         self.object = self.get_object()
         self.object.soft_delete()
-        return HttpResponse("")
+        ReadModelService.refresh_task(self.object.project_task_id)
+        return HttpResponse(_render_comment_counter(self.object.project_task_id))
 
 
 class StepHeaderEditView(
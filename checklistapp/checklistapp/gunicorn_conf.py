@@ -0,0 +1,61 @@
+"""
+Gunicorn configuration of the production server: gunicorn --config python:checklistapp.gunicorn_conf <app>
+
+The application is loaded and warmed up once in the master (see core.warmup), the workers are forked
+from it ready to serve. The workers are recycled after a number of requests to bound their memory.
+"""
+
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 3))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")  # uvicorn_worker.UvicornWorker for ASGI
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+
+preload_app = True
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))  # Do not restart all workers at once
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    """Called in the master once the application is loaded, before the workers are forked"""
+    if os.environ.get("GUNICORN_WARM_UP", "on").lower() in ("off", "false", "0"):
+        return
+
+    from core.warmup import warm_up
+
+    stats = warm_up()
+    server.log.info(
+        f"Warmed up in {stats['seconds']}s: {stats['templates']} templates, {stats['urls']} URL names, "
+        f"{stats['catalog']} catalog templates"
+    )
+
+
+def post_worker_init(worker):
+    """
+    Called in each worker before it serves. The ASGI requests run their queries in short-lived threads,
+    a persistent connection would outlive its thread: the uvicorn workers close them after each request,
+    unless DB_CONN_MAX_AGE is set. The worker class is read here as it may come from the command line.
+    """
+    if "uvicorn" not in worker.cfg.worker_class_str or "DB_CONN_MAX_AGE" in os.environ:
+        return
+
+    from django.db import connections
+
+    for database in connections.settings.values():  # Shared by the connections of every thread
+        database["CONN_MAX_AGE"] = 0
+
+
+def worker_exit(server, worker):
+    """Log the cache hit rates of the worker when it stops, e.g. when recycled after max_requests"""
+    from core.cache import cache_metrics
+
+    for namespace, metrics in cache_metrics().items():
+        server.log.info(
+            f"Worker {worker.pid} cache {namespace}: {metrics['hits']} hits, {metrics['misses']} misses "
+            f"({metrics['hit_rate']:.0%})"
+        )
@@ -36,8 +36,13 @@ SALT_KEY = env("FERNET_KEY")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = env("DEBUG")
 
+TESTING = "test" in sys.argv or "PYTEST_VERSION" in os.environ
+
 ALLOWED_HOSTS = os.environ.get("DJANGO_ALLOWED_HOSTS", "127.0.0.1").split(",")
 
+# Identifier of the deployed version, part of the ETags so that the browsers do not reuse partials of a previous release
+RELEASE = env("RELEASE", default="")
+
 
 # Application definition
 
@@ -62,10 +67,15 @@ INSTALLED_APPS = [
     "checklist",
     "inventory",
     "common",
+    "search",
+    "jobs",
+    "live",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.InvalidationMiddleware",
+    "core.middleware.ReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,6 +113,41 @@ DATABASES = {
     "default": env.db(),
 }
 
+# Persistent connections: each worker thread keeps its connection for DB_CONN_MAX_AGE seconds instead of opening
+# one per request, and checks it is still usable before reusing it. 0 closes it after each request, as needed
+# under ASGI where the requests run in short-lived threads (see checklistapp/gunicorn_conf.py).
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("DB_CONN_HEALTH_CHECKS", default=True)
+
+# Optional read replica of the primary, the reads of the services marked with read_intent go to it (see core/routers.py).
+# A browser which wrote reads from the primary for REPLICA_PIN_SECONDS, longer than the expected replication lag.
+if env("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = env.db("DATABASE_REPLICA_URL")
+    DATABASES["replica"]["CONN_MAX_AGE"] = DATABASES["default"]["CONN_MAX_AGE"]
+    DATABASES["replica"]["CONN_HEALTH_CHECKS"] = DATABASES["default"]["CONN_HEALTH_CHECKS"]
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+DATABASE_ROUTERS = ["core.routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = env.int("REPLICA_PIN_SECONDS", default=5)
+
+
+# Cache
+# The default cache holds the sessions and the computed data (see core/cache.py), it must be shared by the workers
+# in production: a directory common to every process (filecache://) or a memcached server (pymemcache://host:11211).
+# The rendered step and inventory cards are keyed on the version of the objects, a write never needs to delete them
+
+CACHES = {
+    "default": env.cache(
+        "CACHE_URL",
+        default="locmemcache://" if DEBUG or TESTING else "filecache:///tmp/checklist-cache?max_entries=20000",
+    ),
+    "fragments": env.cache("FRAGMENT_CACHE_URL", default="locmemcache://fragments"),
+}
+
+# Sessions are read from the cache and written to both, the database stays the reference
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+# The flash messages travel in a signed cookie, adding one does not write the session
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -155,7 +200,22 @@ TAILWIND_APP_NAME = "theme"
 CRISPY_ALLOWED_TEMPLATE_PACKS = "tailwind"
 CRISPY_TEMPLATE_PACK = "tailwind"
 
-TESTING = "test" in sys.argv or "PYTEST_VERSION" in os.environ
+# The in-process caches are invalidated by LISTEN/NOTIFY on PostgreSQL, otherwise by a query per request.
+# Off in the tests: the listening connection would prevent the test database from being dropped.
+INVALIDATION_LISTEN = env.bool("INVALIDATION_LISTEN", default=not TESTING)
+
+# Run the background jobs inline when there is no worker (tests, quick local runs)
+JOBS_EAGER = env.bool("JOBS_EAGER", default=TESTING)
+
+# Static files are collected under hashed names with compressed copies, served by nginx (see core/storage.py)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        if DEBUG or TESTING
+        else "core.storage.PrecompressedManifestStaticFilesStorage"
+    },
+}
 
 if DEBUG and not TESTING:
     NPM_BIN_PATH = env("NPM_BIN_PATH")
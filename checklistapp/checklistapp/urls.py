@@ -24,6 +24,8 @@ urlpatterns = [
     path("", include("home.urls")),
     path("projects/", include("projects.urls")),
     path("accounts/", include("accounts.urls")),  # include("django.contrib.auth.urls")
+    path("search/", include("search.urls")),
+    path("jobs/", include("jobs.urls")),
 ]
 
 if settings.DEBUG:
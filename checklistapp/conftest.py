@@ -1,12 +1,22 @@
 import pytest
 from accounts.models import User, UserProjectPermissions
 from checklist.models import ProjectStep
+from core.invalidation import InvalidationBus
+from django.core.cache import cache
 from freezegun import freeze_time
 from inventory.models import InventoryField, ProjectInventory
 from projects.models import Project
 from templates_management.models import InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """The test databases are rolled back, the ids are reused: nothing cached may outlive its test"""
+    yield
+    cache.clear()
+    InvalidationBus.clear()
+
+
 @pytest.fixture
 def user(db):
     return User.objects.create_user(
@@ -0,0 +1,67 @@
+import time
+import urllib.error
+import urllib.request
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.db import connection, connections
+
+"""
+Helpers of the benchmark commands (benchmark_views, benchmark_startup), which send real HTTP requests
+to a server started on the same database.
+"""
+
+
+def create_session(user) -> str:
+    """Key of a logged-in session for the user, like Client.force_login()"""
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return session.session_key
+
+
+def session_headers(user, htmx: bool = False) -> dict:
+    headers = {"Cookie": f"{settings.SESSION_COOKIE_NAME}={create_session(user)}"}
+    if htmx:
+        headers["HX-Request"] = "true"
+    return headers
+
+
+def fetch(url: str, headers: dict, timeout: float = 30) -> tuple[bool, float]:
+    """GET the url, return whether it answered 200 and the duration in seconds"""
+    request = urllib.request.Request(url, headers=headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            ok = response.status == 200
+    except (urllib.error.URLError, ConnectionError, TimeoutError):
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def database_sessions() -> int | None:
+    """Number of connections ever opened to the PostgreSQL database, None on the other databases"""
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_stat_clear_snapshot()")  # Read the current statistics, not a cached snapshot
+        cursor.execute("SELECT sessions FROM pg_stat_database WHERE datname = current_database()")
+        return cursor.fetchone()[0]
+
+
+def connection_setup_ms(samples: int = 10) -> float | None:
+    """Average time to open a new connection to the PostgreSQL database, what a request pays without persistent ones"""
+    if connection.vendor != "postgresql":
+        return None
+    durations = []
+    for _ in range(samples):
+        new_connection = connections.create_connection("default")
+        start = time.perf_counter()
+        new_connection.ensure_connection()
+        durations.append(time.perf_counter() - start)
+        new_connection.close()
+    return sum(durations) / samples * 1000
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+"""
+Cache of computed data shared by the workers, on top of the CACHES setting.
+
+Each feature uses its own CacheNamespace. The keys carry the namespace name and two versions:
+- the version given in the code, to bump when the shape of the cached values changes
+- the generation of the namespace, stored in the cache itself: invalidate() increments it and every
+  entry of the namespace is ignored at once, the stale entries expire on their own
+
+The hits and misses are counted per namespace in each process, see cache_metrics().
+"""
+
+_MISSING = object()
+
+_metrics = Counter()
+_metrics_lock = threading.Lock()
+
+
+class CacheNamespace:
+    def __init__(self, name: str, version: int = 1, timeout: float | None = DEFAULT_TIMEOUT, alias: str = DEFAULT_CACHE_ALIAS):
+        self.name = name
+        self.version = version
+        self.timeout = timeout
+        self.alias = alias
+
+    def __repr__(self):
+        return f"<CacheNamespace {self.name} v{self.version}>"
+
+    @property
+    def cache(self):
+        return caches[self.alias]  # One connection per thread
+
+    def generation(self) -> int:
+        key = self._generation_key()
+        generation = self.cache.get(key)
+        if generation is None:
+            # Lost or never set: start from the clock, older generations may still have entries
+            self.cache.add(key, time.time_ns() // 1000, timeout=None)
+            generation = self.cache.get(key, 0)
+        return generation
+
+    def make_key(self, key) -> str:
+        return f"{self.name}:v{self.version}:g{self.generation()}:{key}"
+
+    def get(self, key, default=None):
+        value = self.cache.get(self.make_key(key), _MISSING)
+        _record(self.name, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def get_or_set(self, key, compute: Callable[[], Any], timeout: float | None = DEFAULT_TIMEOUT):
+        """Return the cached value, or compute and store it. None values are not cached."""
+        cache_key = self.make_key(key)
+        value = self.cache.get(cache_key, _MISSING)
+        _record(self.name, value is not _MISSING)
+        if value is _MISSING:
+            value = compute()
+            if value is not None:
+                self.cache.set(cache_key, value, self._timeout(timeout))
+        return value
+
+    def set(self, key, value, timeout: float | None = DEFAULT_TIMEOUT):
+        self.cache.set(self.make_key(key), value, self._timeout(timeout))
+
+    def delete(self, key):
+        self.cache.delete(self.make_key(key))
+
+    def invalidate(self):
+        """Drop every entry of the namespace"""
+        try:
+            self.cache.incr(self._generation_key())
+        except ValueError:
+            self.cache.add(self._generation_key(), time.time_ns() // 1000, timeout=None)
+
+    def _generation_key(self) -> str:
+        return f"{self.name}:generation"
+
+    def _timeout(self, timeout):
+        return self.timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+
+def _record(namespace: str, hit: bool):
+    with _metrics_lock:
+        _metrics[namespace, "hits" if hit else "misses"] += 1
+
+
+def cache_metrics() -> dict[str, dict[str, int | float]]:
+    """Hits, misses and hit rate of each namespace since the start of the process"""
+    with _metrics_lock:
+        namespaces = sorted({namespace for namespace, _ in _metrics})
+        metrics = {
+            namespace: {"hits": _metrics[namespace, "hits"], "misses": _metrics[namespace, "misses"]}
+            for namespace in namespaces
+        }
+    for values in metrics.values():
+        values["hit_rate"] = round(values["hits"] / (values["hits"] + values["misses"]), 3)
+    return metrics
+
+
+def reset_cache_metrics():
+    with _metrics_lock:
+        _metrics.clear()
@@ -0,0 +1,67 @@
+from collections import Counter
+
+from django.db import models, router
+from django.db.models import signals
+
+"""
+Set-based cascading deletion.
+
+Django's collector loads every dependent row (tasks, comments, fields, search entries...) in memory to
+delete them, which does not scale to big projects. fast_delete() walks the relations of the model instead
+and issues the DELETE statements itself, children first, for `batch_size` primary keys at a time:
+only the primary keys of the current batch are loaded.
+
+The rows are removed bottom-up so every statement leaves the database consistent, there is no need for a
+single big transaction. Models with pre_delete/post_delete receivers, or with PROTECT/RESTRICT relations,
+are still deleted by the collector so that the signals fire and the protections apply.
+"""
+
+DELETE_BATCH_SIZE = 5000
+
+
+def fast_delete(queryset: models.QuerySet, batch_size: int = DELETE_BATCH_SIZE) -> tuple[int, dict[str, int]]:
+    """
+    Delete the rows of the queryset and all the rows depending on them.
+    Returns the same (total, {model label: count}) tuple as QuerySet.delete().
+    """
+    counter = Counter()
+    using = router.db_for_write(queryset.model)
+    pks = queryset.order_by().values_list("pk", flat=True)
+
+    while batch := list(pks[:batch_size]):
+        _delete_batch(queryset.model, batch, using, batch_size, counter)
+
+    counter = +counter  # Drop the models without deleted rows, like the collector
+    return sum(counter.values()), dict(counter)
+
+
+def _delete_batch(model, pks: list, using: str, batch_size: int, counter: Counter):
+    if _needs_collector(model):
+        _, deleted = model._base_manager.using(using).filter(pk__in=pks).delete()
+        counter.update(deleted)
+        return
+
+    for relation in _relations(model):
+        related = relation.related_model._base_manager.using(using).filter(**{f"{relation.field.name}__in": pks})
+        if relation.on_delete is models.CASCADE:
+            _, deleted = fast_delete(related, batch_size)
+            counter.update(deleted)
+        elif relation.on_delete is models.SET_NULL:
+            related.update(**{relation.field.name: None})
+
+    counter[model._meta.label] += model._base_manager.using(using).filter(pk__in=pks)._raw_delete(using)
+
+
+def _relations(model):
+    """Reverse foreign keys (including the auto-created m2m tables) pointing to the model, as used by the collector"""
+    return [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created and not field.concrete and (field.one_to_one or field.one_to_many)
+    ]
+
+
+def _needs_collector(model) -> bool:
+    if signals.pre_delete.has_listeners(model) or signals.post_delete.has_listeners(model):
+        return True
+    return any(relation.on_delete not in (models.CASCADE, models.SET_NULL, models.DO_NOTHING) for relation in _relations(model))
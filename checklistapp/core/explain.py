@@ -0,0 +1,45 @@
+import json
+import re
+
+from django.db import connections
+from django.db.models import QuerySet
+
+"""
+Query plans of the querysets, used by the tests to check the service queries keep using their indexes.
+
+A table is read from start to end when no index serves the filters of the query:
+- SQLite (EXPLAIN QUERY PLAN): a "SCAN <table>" node, the lookups through an index are "SEARCH <table>" nodes
+- PostgreSQL (EXPLAIN): a "Seq Scan", or an index scan without "Index Cond" which reads the whole index.
+  On the small tables of the tests, reading a whole table is the cheapest plan even with a matching index:
+  the sequential scans, hash and merge joins are disabled while planning, every table must then be reached
+  through an index condition, like on a big database. The planner only falls back to them when no index can be used.
+"""
+
+SQLITE_SCAN_RE = re.compile(r"\bSCAN (?!CONSTANT ROW)(\w+)")
+POSTGRESQL_DISABLED_PLANS = ["enable_seqscan", "enable_hashjoin", "enable_mergejoin"]
+
+
+def sequential_scans(queryset: QuerySet) -> list[str]:
+    """Tables (or their alias) read from start to end by the queryset, empty on the other databases"""
+    connection = connections[queryset.db]
+    if connection.vendor == "sqlite":
+        return SQLITE_SCAN_RE.findall(queryset.explain())
+    if connection.vendor != "postgresql":
+        return []
+
+    with connection.cursor() as cursor:
+        for setting in POSTGRESQL_DISABLED_PLANS:
+            cursor.execute(f"SET {setting} = off")
+        try:
+            plan = json.loads(queryset.explain(format="json"))
+        finally:
+            for setting in POSTGRESQL_DISABLED_PLANS:
+                cursor.execute(f"RESET {setting}")
+    return list(_full_scans(plan[0]["Plan"]))
+
+
+def _full_scans(node: dict):
+    if node["Node Type"] == "Seq Scan" or (node["Node Type"] in ["Index Scan", "Index Only Scan"] and "Index Cond" not in node):
+        yield node["Alias"]
+    for child in node.get("Plans", []):
+        yield from _full_scans(child)
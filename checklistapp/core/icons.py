@@ -0,0 +1,73 @@
+import re
+
+from django.conf import settings
+
+from core.utils import project_template_dirs
+
+"""
+Tree-shaking of the lucide icons.
+
+The full lucide build (theme/static_src/vendor/lucide.js) holds every icon, the pages only use a few dozen.
+build_bundle() keeps the runtime of the library (createIcons, createElement) and the icons used by the
+templates, written to static/js/lucide-icons.js by "manage.py build_icons".
+"""
+
+LUCIDE_SOURCE = settings.BASE_DIR / "theme" / "static_src" / "vendor" / "lucide.js"
+LUCIDE_BUNDLE = settings.BASE_DIR / "static" / "js" / "lucide-icons.js"
+
+# data-lucide="name" and the icons given to the included templates, e.g. submit_icon="save"
+ICON_ATTRIBUTE_RE = re.compile(r'(?:data-lucide|\b\w+_icon)="([^"]*)"')
+ICON_NAME_RE = re.compile(r"^[a-z0-9-]+$")
+ICON_CONST_RE = re.compile(r"^  const ([A-Z]\w*) = (?:\[[^\n]*\];\n|\[\n.*?^  \];\n)", re.MULTILINE | re.DOTALL)
+ALIAS_RE = re.compile(r"^    (\w+): (\w+),?$", re.MULTILINE)
+
+BUNDLE_BANNER = '/* Generated by "manage.py build_icons" from theme/static_src/vendor/lucide.js, do not edit */\n'
+
+
+def used_icons() -> tuple[set[str], set[str]]:
+    """Icon names found in the project templates, and the references computed at render time"""
+    names, dynamic = set(), set()
+    for directory in project_template_dirs():
+        for path in directory.rglob("*.html"):
+            for value in ICON_ATTRIBUTE_RE.findall(path.read_text()):
+                (names if ICON_NAME_RE.match(value) else dynamic).add(value)
+    return names, dynamic
+
+
+def to_pascal_case(name: str) -> str:
+    """Same conversion as lucide: "trash-2" is the icon Trash2"""
+    return re.sub(r"(\w)(\w*)(_|-|\s*)", lambda match: match[1].upper() + match[2].lower(), name)
+
+
+def build_bundle(source: str, names: set[str]) -> tuple[str, list[str]]:
+    """Return the bundle with the given icons and the names which are not lucide icons"""
+    consts = {match[1]: match[0] for match in ICON_CONST_RE.finditer(source)}
+    aliases_start = source.index("  var iconAndAliases")
+    create_icons_start = source.index("  const createIcons = (")
+    aliases = dict(ALIAS_RE.findall(source[aliases_start:create_icons_start]))  # Exported name -> icon constant
+
+    selected, unknown = {}, []
+    for name in sorted(names):
+        key = to_pascal_case(name)
+        if key in aliases:
+            selected[key] = aliases[key]
+        else:
+            unknown.append(name)
+
+    runtime = source[: ICON_CONST_RE.search(source).start()]
+    icons = "\n".join(consts[const] for const in sorted(set(selected.values())))
+    icon_map = "".join(f"    {key}: {const},\n" for key, const in selected.items())
+    create_icons = source[create_icons_start : source.index("\n  exports.", create_icons_start) + 1]
+    bundle = (
+        BUNDLE_BANNER
+        + runtime
+        + icons
+        + "\n  var iconAndAliases = /*#__PURE__*/Object.freeze({\n    __proto__: null,\n"
+        + icon_map.removesuffix(",\n")
+        + "\n  });\n\n"
+        + create_icons
+        + "  exports.createElement = createElement;\n"
+        + "  exports.createIcons = createIcons;\n"
+        + "  exports.icons = iconAndAliases;\n\n}));\n"
+    )
+    return bundle, unknown
@@ -0,0 +1,168 @@
+import functools
+import logging
+import select
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+"""
+Invalidation of the in-process caches across the workers.
+
+Each process keeps data in memory with LocalCache, one namespace per kind of data (e.g. "permissions").
+The writes publish the namespaces they change with InvalidationBus.publish(): the namespace is dropped at once
+in the current process, and its CacheGeneration row is incremented when the transaction commits.
+The processes read the generations at the start of each request (InvalidationMiddleware, a single query on a
+table of a few rows) and a LocalCache drops its entries on its next access once the generation changed.
+
+On PostgreSQL, the bumps are also sent with NOTIFY: every process LISTENs on a connection of its own, reads the
+generations when notified and skips the query at the start of the requests while it is connected.
+"""
+
+INVALIDATION_CHANNEL = "checklist_invalidation"
+INVALIDATION_LISTEN_TIMEOUT = 5  # Seconds between two reads of the generations when nothing is notified
+
+
+class InvalidationBus:
+    _generations: dict[str, int] = {}  # Last generations read from the database
+    _published: dict[str, int] = {}  # Namespaces published by this process, invalidated without waiting for the commit
+    _epoch = 0
+    _listener: threading.Thread | None = None
+    _listening = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def generation(cls, namespace: str) -> tuple:
+        """Opaque value which changes whenever the namespace is invalidated, in this process or another one"""
+        return cls._epoch, cls._generations.get(namespace, 0), cls._published.get(namespace, 0)
+
+    @classmethod
+    def poll(cls):
+        """Read the generations of every namespace, unless they are received by LISTEN"""
+        if connection.in_atomic_block:
+            return  # Nothing is cached inside a transaction, see LocalCache.set()
+        if connection.vendor == "postgresql" and settings.INVALIDATION_LISTEN:
+            cls._start_listener()
+            if cls._listening:
+                return
+        cls._generations = dict(CacheGeneration.objects.values_list("namespace", "generation"))
+
+    @classmethod
+    def publish(cls, *namespaces: str):
+        """Invalidate the namespaces in this process now, and in every process once the transaction commits"""
+        with cls._lock:
+            cls._published = {**cls._published, **{namespace: cls._published.get(namespace, 0) + 1 for namespace in namespaces}}
+        transaction.on_commit(functools.partial(cls._bump, namespaces))
+
+    @classmethod
+    def clear(cls):
+        """Drop the entries of every LocalCache of the process"""
+        with cls._lock:
+            cls._epoch += 1
+
+    @classmethod
+    def _bump(cls, namespaces: tuple[str, ...]):
+        try:
+            for namespace in namespaces:
+                bumped = CacheGeneration.objects.filter(namespace=namespace)
+                if not bumped.update(generation=F("generation") + 1, updated_at=timezone.now()):
+                    _, created = CacheGeneration.objects.get_or_create(namespace=namespace, defaults={"generation": 1})
+                    if not created:  # Created by another process in the meantime
+                        bumped.update(generation=F("generation") + 1, updated_at=timezone.now())
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_notify(%s, '')", [INVALIDATION_CHANNEL])
+        except Exception as e:
+            logger.error(f"Invalidation of {', '.join(namespaces)} not published: {e}")
+
+    @classmethod
+    def _start_listener(cls):
+        # A thread of the parent process does not survive the fork of the gunicorn workers
+        if cls._listener is not None and cls._listener.is_alive():
+            return
+        with cls._lock:
+            if cls._listener is None or not cls._listener.is_alive():
+                cls._listening = False
+                cls._listener = threading.Thread(target=cls._listen, name="invalidation-listener", daemon=True)
+                cls._listener.start()
+
+    @classmethod
+    def _listen(cls):
+        """LISTEN on a connection of its own for the lifetime of the process, reconnecting on failure"""
+        while True:
+            listener = connections.create_connection(DEFAULT_DB_ALIAS)
+            try:
+                listener.ensure_connection()
+                raw = listener.connection  # psycopg2 connection, in autocommit like every Django connection
+                with raw.cursor() as cursor:
+                    cursor.execute(f"LISTEN {INVALIDATION_CHANNEL}")
+                while True:
+                    # Also read on timeout: catches up after a reconnection and checks the connection is alive
+                    with raw.cursor() as cursor:
+                        cursor.execute(f"SELECT namespace, generation FROM {CacheGeneration._meta.db_table}")
+                        cls._generations = dict(cursor.fetchall())
+                    cls._listening = True
+                    if select.select([raw], [], [], INVALIDATION_LISTEN_TIMEOUT)[0]:
+                        raw.poll()
+                        raw.notifies.clear()
+            except Exception as e:
+                logger.error(e)
+                cls._listening = False
+                listener.close()
+                time.sleep(1)
+
+
+class LocalCache:
+    """
+    Values of one namespace kept in the memory of the process, shared by its threads.
+    The entries are dropped on the next access once the namespace is invalidated (see InvalidationBus).
+    None is not cached, and neither are the values read inside a transaction, which may not be committed.
+    """
+
+    def __init__(self, namespace: str, max_entries: int = 10000):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._entries: dict = {}
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<LocalCache {self.namespace}>"
+
+    def generation(self) -> tuple:
+        """Read before computing a value, then given to set()"""
+        return InvalidationBus.generation(self.namespace)
+
+    def get(self, key, default=None):
+        if self._generation != self.generation():
+            return default
+        return self._entries.get(key, default)
+
+    def set(self, key, value, generation: tuple):
+        """Store a value computed from the data of the given generation, unless it was invalidated since"""
+        if value is None or connection.in_atomic_block:
+            return
+        with self._lock:
+            if generation != self.generation():
+                return
+            if generation != self._generation or len(self._entries) >= self.max_entries:
+                self._entries = {}
+                self._generation = generation
+            self._entries[key] = value
+
+    def get_or_set(self, key, compute: Callable[[], Any]):
+        generation = self.generation()
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value, generation)
+        return value
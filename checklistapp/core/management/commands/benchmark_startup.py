@@ -0,0 +1,97 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from checklist.models import ProjectStep
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from core.benchmarks import fetch, session_headers
+
+
+class Command(BaseCommand):
+    help = (
+        "Start the production server (checklistapp/gunicorn_conf.py) without then with the warm-up "
+        "and measure the time to its first fast response on a checklist page."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("--user", required=True, help="Username of a member of the project, requests are sent as them")
+        parser.add_argument("--port", type=int, default=8100, help="Port of the benchmarked server")
+        parser.add_argument("--workers", type=int, default=3)
+        parser.add_argument("--rounds", type=int, default=10, help="Rounds of one request per worker after the start")
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(username=options["user"]).first()
+        if user is None:
+            raise CommandError(f"User {options['user']} not found.")
+        step = ProjectStep.objects.filter(project_id=options["project_id"]).first()
+        if step is None:
+            raise CommandError(f"Project {options['project_id']} has no step to benchmark.")
+
+        path = reverse("projects:checklist:step_detail", kwargs={"project_id": step.project_id, "step_id": step.id})
+        url = f"http://127.0.0.1:{options['port']}{path}"
+        headers = session_headers(user)
+
+        self.stdout.write(f"{options['workers']} workers, {options['rounds']} rounds of requests on {path}")
+        self.stdout.write(
+            f"{'warm-up':<10}{'ready s':>10}{'first ms':>10}{'slowest ms':>12}{'steady ms':>11}{'fast after s':>14}"
+        )
+        for warm_up in ["off", "on"]:
+            result = self._run(url, headers, options, warm_up)
+            self.stdout.write(
+                f"{warm_up:<10}{result['ready']:>10.2f}{result['first']:>10.1f}{result['slowest']:>12.1f}"
+                f"{result['steady']:>11.1f}{result['fast_after']:>14.2f}"
+            )
+
+    def _run(self, url: str, headers: dict, options: dict, warm_up: str) -> dict:
+        env = {
+            **os.environ,
+            "GUNICORN_BIND": f"127.0.0.1:{options['port']}",
+            "GUNICORN_WORKERS": str(options["workers"]),
+            "GUNICORN_WARM_UP": warm_up,
+        }
+        command = [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config",
+            "python:checklistapp.gunicorn_conf",
+            "checklistapp.wsgi:application",
+        ]
+        start = time.perf_counter()
+        server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            # Time to the first response: poll until the server accepts the connections
+            while not (first := fetch(url, headers, timeout=60))[0]:
+                if server.poll() is not None:
+                    raise CommandError("The server exited, run it by hand to see the error.")
+                time.sleep(0.05)
+            ready = time.perf_counter() - start
+
+            # Then one request per worker at a time, each worker serves its first requests cold or warm
+            responses = []
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                for _ in range(options["rounds"]):
+                    batch = list(executor.map(lambda _: fetch(url, headers), range(options["workers"])))
+                    responses += [(duration, time.perf_counter() - start) for ok, duration in batch if ok]
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        durations = [duration for duration, _ in responses]
+        steady = statistics.median(durations[len(durations) // 2 :])
+        # Time to fast responses: from the start to the last response slower than 1.5x the steady state
+        slow = [elapsed for duration, elapsed in responses if duration > 1.5 * steady]
+        return {
+            "ready": ready,
+            "first": first[1] * 1000,
+            "slowest": max(durations) * 1000,
+            "steady": steady * 1000,
+            "fast_after": max(slow, default=ready),
+        }
@@ -0,0 +1,76 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from checklist.models import ProjectTask
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from core.benchmarks import connection_setup_ms, database_sessions, fetch, session_headers
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of the read-heavy HTMX endpoints of a project on a running server, "
+        "e.g. to compare the WSGI (gunicorn) and ASGI (uvicorn workers) deployments. On PostgreSQL, also counts "
+        "the database connections opened by the server (see DB_CONN_MAX_AGE)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("--user", required=True, help="Username of a member of the project, requests are sent as them")
+        parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of the server")
+        parser.add_argument("--clients", type=int, default=100, help="Number of concurrent clients")
+        parser.add_argument("--requests", type=int, default=2000, help="Number of requests per endpoint")
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(username=options["user"]).first()
+        if user is None:
+            raise CommandError(f"User {options['user']} not found.")
+        task = ProjectTask.objects.filter(project_step__project_id=options["project_id"]).select_related("project_step").first()
+        if task is None:
+            raise CommandError(f"Project {options['project_id']} has no task to benchmark.")
+
+        project_id, step_id = options["project_id"], task.project_step_id
+        endpoints = {
+            "list_steps": reverse("projects:checklist:list_steps", kwargs={"project_id": project_id}),
+            "step_detail": reverse("projects:checklist:step_detail", kwargs={"project_id": project_id, "step_id": step_id}),
+            "comment_list": reverse(
+                "projects:checklist:comment_list",
+                kwargs={"project_id": project_id, "step_id": step_id, "task_id": task.id},
+            ),
+            "list_inventory": reverse("projects:inventory:list_inventory", kwargs={"project_id": project_id}),
+        }
+        headers = session_headers(user, htmx=True)
+
+        self.stdout.write(f"{options['clients']} clients, {options['requests']} requests per endpoint on {options['url']}")
+        if (setup := connection_setup_ms()) is not None:
+            self.stdout.write(f"Opening a database connection takes {setup:.1f} ms")
+        self.stdout.write(f"{'endpoint':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}{'new conns':>11}")
+        for name, path in endpoints.items():
+            sessions = database_sessions()
+            result = self._run(options["url"] + path, headers, options["clients"], options["requests"])
+            new_connections = "-" if sessions is None else database_sessions() - sessions
+            self.stdout.write(
+                f"{name:<16}{result['rps']:>10.1f}{result['p50']:>10.1f}{result['p95']:>10.1f}{result['errors']:>8}"
+                f"{new_connections:>11}"
+            )
+
+    def _run(self, url: str, headers: dict, clients: int, count: int) -> dict:
+        def fetch_one(_):
+            return fetch(url, headers)
+
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            list(executor.map(fetch_one, range(clients)))  # Warm-up: connections, caches and read models
+            start = time.perf_counter()
+            results = list(executor.map(fetch_one, range(count)))
+            elapsed = time.perf_counter() - start
+
+        latencies = sorted(duration * 1000 for ok, duration in results if ok)
+        return {
+            "rps": len(latencies) / elapsed,
+            "p50": statistics.median(latencies) if latencies else 0,
+            "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0,
+            "errors": count - len(latencies),
+        }
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.icons import LUCIDE_BUNDLE, LUCIDE_SOURCE, build_bundle, used_icons
+
+
+class Command(BaseCommand):
+    help = "Build static/js/lucide-icons.js with only the lucide icons used by the templates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--icon", action="append", default=[], help="Extra icon to keep, e.g. set from Python code")
+        parser.add_argument("--check", action="store_true", help="Exit with an error if the bundle is not up to date")
+
+    def handle(self, *args, **options):
+        names, dynamic = used_icons()
+        names.update(options["icon"])
+        for reference in sorted(dynamic):
+            self.stderr.write(self.style.WARNING(f"Icon computed at render time, add it with --icon if needed: {reference}"))
+
+        source = LUCIDE_SOURCE.read_text()
+        bundle, unknown = build_bundle(source, names)
+        if unknown:
+            raise CommandError(f"Unknown lucide icons: {', '.join(unknown)}")
+
+        if options["check"]:
+            if not LUCIDE_BUNDLE.exists() or LUCIDE_BUNDLE.read_text() != bundle:
+                raise CommandError(f"{LUCIDE_BUNDLE.name} is not up to date, run manage.py build_icons.")
+            self.stdout.write(f"{LUCIDE_BUNDLE.name} is up to date.")
+            return
+
+        LUCIDE_BUNDLE.write_text(bundle)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(names)} icons written to {LUCIDE_BUNDLE.name}: {len(bundle) // 1024} KB instead of {len(source) // 1024} KB"
+            )
+        )
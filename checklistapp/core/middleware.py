@@ -1,6 +1,18 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
 from django.template.loader import render_to_string
 from django.utils.deprecation import MiddlewareMixin
 
+from .invalidation import InvalidationBus
+from .routers import REPLICA_PIN_COOKIE, end_request, has_replica, start_request
+
+
+class InvalidationMiddleware(MiddlewareMixin):
+    """Read the generations of the in-process caches at the start of each request (see core.invalidation)"""
+
+    def process_request(self, request):
+        InvalidationBus.poll()
+
 
 class HTMXMessagesMiddleware(MiddlewareMixin):
     """
@@ -21,3 +33,22 @@ class HTMXMessagesMiddleware(MiddlewareMixin):
                     response.content = response.content + messages_html.encode()
 
         return response
+
+
+class ReplicaMiddleware(MiddlewareMixin):
+    """Read-your-writes: once a browser wrote, its requests read from the primary for REPLICA_PIN_SECONDS"""
+
+    def __init__(self, get_response):
+        if not has_replica():
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def process_request(self, request):
+        request.database_state = start_request(pinned=REPLICA_PIN_COOKIE in request.COOKIES)
+
+    def process_response(self, request, response):
+        end_request()
+        state = getattr(request, "database_state", None)
+        if state is not None and state.wrote:
+            response.set_cookie(REPLICA_PIN_COOKIE, "1", max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite="Lax")
+        return response
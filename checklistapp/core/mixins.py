@@ -1,6 +1,14 @@
+import hashlib
+
 from accounts.services import AccountService
-from django.contrib.auth.mixins import LoginRequiredMixin
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
+from django.contrib.auth.views import redirect_to_login
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 
 
 class AbstractProjectAccessMixin(LoginRequiredMixin):
@@ -12,28 +20,59 @@ class AbstractProjectAccessMixin(LoginRequiredMixin):
         if not request.user.is_authenticated:
             return super().dispatch(request, *args, **kwargs)  # Redirige vers login
 
-        project_id = kwargs.get("project_id") or kwargs.get("pk")
-
-        if not project_id:
-            raise AttributeError("Le mixin ProjectAccessMixin requires a 'project_id' or 'pk' in URL parameters")
+        project_id = _get_project_id(kwargs)
 
         # 1. Fetch permission
         user_permission = AccountService.get_permission_for_user_project(request.user, project_id)
+        _check_permission(user_permission, self.required_permission)
 
-        if not user_permission:
-            raise PermissionDenied("Access denied.")
+        self.user_permission = user_permission  # Reused by the views, e.g. to pick the read-only path
+        return super().dispatch(request, *args, **kwargs)
 
-        if self.required_permission == "admin":
-            has_permission = user_permission.is_admin
-        elif self.required_permission == "write":
-            has_permission = user_permission.can_edit or user_permission.is_admin
-        elif self.required_permission == "read":
-            has_permission = user_permission.can_view or user_permission.can_edit or user_permission.is_admin
 
-        if not has_permission:
-            raise PermissionDenied("Access denied.")
+class AbstractAsyncProjectAccessMixin(AccessMixin):
+    """
+    Counterpart of AbstractProjectAccessMixin for the views with async handlers:
+    the user and the permission are loaded with the async ORM, without leaving the event loop.
+    """
 
-        return super().dispatch(request, *args, **kwargs)
+    required_permission = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path(), self.get_login_url(), self.get_redirect_field_name())
+
+        project_id = _get_project_id(kwargs)
+
+        user_permission = await AccountService.aget_permission_for_user_project(user, project_id)
+        _check_permission(user_permission, self.required_permission)
+
+        self.user_permission = user_permission
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def _get_project_id(kwargs):
+    project_id = kwargs.get("project_id") or kwargs.get("pk")
+
+    if not project_id:
+        raise AttributeError("Le mixin ProjectAccessMixin requires a 'project_id' or 'pk' in URL parameters")
+    return project_id
+
+
+def _check_permission(user_permission, required_permission):
+    if not user_permission:
+        raise PermissionDenied("Access denied.")
+
+    if required_permission == "admin":
+        has_permission = user_permission.is_admin
+    elif required_permission == "write":
+        has_permission = user_permission.can_edit or user_permission.is_admin
+    elif required_permission == "read":
+        has_permission = user_permission.can_view or user_permission.can_edit or user_permission.is_admin
+
+    if not has_permission:
+        raise PermissionDenied("Access denied.")
 
 
 class ProjectReadRequiredMixin(AbstractProjectAccessMixin):
@@ -48,6 +87,18 @@ class ProjectAdminRequiredMixin(AbstractProjectAccessMixin):
     required_permission = "admin"
 
 
+class AsyncProjectReadRequiredMixin(AbstractAsyncProjectAccessMixin):
+    required_permission = "read"
+
+
+class AsyncProjectEditRequiredMixin(AbstractAsyncProjectAccessMixin):
+    required_permission = "write"
+
+
+class AsyncProjectAdminRequiredMixin(AbstractAsyncProjectAccessMixin):
+    required_permission = "admin"
+
+
 class OwnerOrAdminMixin(LoginRequiredMixin):
     """
     Mixin to check if the user is the author or admin
@@ -114,9 +165,101 @@ class CommonContextMixin:
         """
         Return a list of roles like ["read", "edit"]
         """
+        if getattr(self, "user_permission", None) is not None:
+            return AccountService.permission_to_list(self.user_permission)  # Already loaded by the access mixin
+
         if not user.is_authenticated or not project_id:
             return []
 
         permission = AccountService.get_permission_for_user_project(user=user, project_id=project_id)
 
         return AccountService.permission_to_list(permission)
+
+
+class ConditionalGetMixin:
+    """
+    Give the HTMX partials a strong ETag built from the version of what they render (see projects.versions)
+    and answer a matching If-None-Match with 304 Not Modified before the view body runs.
+
+    Goes after the project access mixin: the permission is checked first and self.user_permission is set.
+    Full pages and responses carrying messages are left alone, the browser would replay a cached copy.
+    The partials must render the same bytes until their version changes: no relative dates, use the timestamp filter.
+    """
+
+    def get_etag_version(self) -> int | None:
+        """Version of the rendered objects, None when they do not exist"""
+        raise NotImplementedError
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self._is_conditional(request) or len(messages.get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+
+        version = self.get_etag_version()
+        if version is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        etag = self._build_etag(request, version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code != 200 or len(messages.get_messages(request)):
+                return response
+
+        return self._add_etag(response, etag)
+
+    def _is_conditional(self, request) -> bool:
+        return request.method in ("GET", "HEAD") and bool(request.htmx)
+
+    def _add_etag(self, response, etag: str):
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)  # Stored by the browser, revalidated on each use
+        patch_vary_headers(response, ["HX-Request"])
+        return response
+
+    def _build_etag(self, request, version: int) -> str:
+        # Same objects, same user and roles, same CSRF token in the forms and same release of the templates
+        get_token(request)  # Creates the CSRF secret on the first request, the rendered forms use it
+        key = "|".join(
+            str(part)
+            for part in [
+                type(self).__name__,
+                request.get_full_path(),
+                version,
+                self.user_permission.user_id,
+                AccountService.permission_to_list(self.user_permission),
+                request.META["CSRF_COOKIE"],
+                settings.RELEASE,
+            ]
+        )
+        return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """ConditionalGetMixin for the views with async handlers, goes after the async project access mixin"""
+
+    async def get_etag_version(self) -> int | None:
+        raise NotImplementedError
+
+    async def dispatch(self, request, *args, **kwargs):
+        # super(ConditionalGetMixin, self) skips the sync dispatch above, straight to the view
+        if not self._is_conditional(request) or await _has_messages(request):
+            return await super(ConditionalGetMixin, self).dispatch(request, *args, **kwargs)
+
+        version = await self.get_etag_version()
+        if version is None:
+            return await super(ConditionalGetMixin, self).dispatch(request, *args, **kwargs)
+
+        etag = self._build_etag(request, version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await super(ConditionalGetMixin, self).dispatch(request, *args, **kwargs)
+            if response.status_code != 200 or await _has_messages(request):
+                return response
+
+        return self._add_etag(response, etag)
+
+
+@sync_to_async
+def _has_messages(request) -> bool:
+    """The messages may be stored in the session, which is loaded synchronously"""
+    return bool(len(messages.get_messages(request)))
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class CacheGeneration(models.Model):
+    """
+    Counter of a namespace of the in-process caches, bumped when its data changes.
+    Each process compares it with the generation of its local entries (see core.invalidation).
+    """
+
+    namespace = models.CharField(max_length=100, unique=True)
+    generation = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Cache Generation"
+
+    def __str__(self):
+        return f"{self.namespace} g{self.generation}"
@@ -0,0 +1,134 @@
+import functools
+from contextvars import ContextVar
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import QuerySet
+
+"""
+Routing of the service reads to a read replica (the "replica" database, set with DATABASE_REPLICA_URL).
+
+Nothing goes to the replica unless asked: the service methods doing pure reads are marked with @read_intent,
+the ones writing with @write_intent. A read goes to the replica only when all of these hold:
+- it runs in a read intent, or on a queryset returned by one
+- it runs in a request (the jobs and commands read from the primary, they often follow a write)
+- the request did not write yet, and the browser did not write in the last REPLICA_PIN_SECONDS (read-your-writes,
+  see core.middleware.ReplicaMiddleware)
+- it is not inside a transaction, whose reads must see its own writes
+Writes always go to the primary.
+"""
+
+REPLICA_DATABASE = "replica"
+REPLICA_PIN_COOKIE = "pin_primary"
+READ_INTENT_HINT = "read_intent"
+
+READ, WRITE = "read", "write"
+
+
+@dataclass
+class RequestState:
+    pinned: bool  # The browser wrote recently
+    wrote: bool = False
+
+
+_intent: ContextVar[str | None] = ContextVar("database_intent", default=None)
+_request: ContextVar[RequestState | None] = ContextVar("database_request", default=None)
+
+
+def has_replica() -> bool:
+    return REPLICA_DATABASE in settings.DATABASES
+
+
+def start_request(pinned: bool) -> RequestState:
+    """Track the writes of the current request, called by ReplicaMiddleware"""
+    state = RequestState(pinned=pinned)
+    _request.set(state)
+    return state
+
+
+def end_request():
+    _request.set(None)
+
+
+def read_database() -> str:
+    """Database of the reads in a read intent"""
+    state = _request.get()
+    if state is None or state.pinned or state.wrote or not has_replica():
+        return DEFAULT_DB_ALIAS
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    return REPLICA_DATABASE
+
+
+def _mark_write():
+    if (state := _request.get()) is not None:
+        state.wrote = True
+
+
+def read_intent(func):
+    """The reads of the decorated function may go to the replica"""
+    return _with_intent(func, READ)
+
+
+def write_intent(func):
+    """The decorated function writes: its reads and the next ones of the request go to the primary"""
+    return _with_intent(func, WRITE)
+
+
+def _with_intent(func, intent: str):
+    def enter():
+        if intent == WRITE:
+            _mark_write()
+        return _intent.set(WRITE if WRITE in (intent, _intent.get()) else READ)
+
+    def leave(result, token):
+        # The returned querysets are evaluated later, outside of the intent: they carry it with them
+        if isinstance(result, QuerySet) and _intent.get() == READ:
+            result._hints = {**result._hints, READ_INTENT_HINT: True}
+        _intent.reset(token)
+        return result
+
+    if iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = enter()
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException:
+                _intent.reset(token)
+                raise
+            return leave(result, token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = enter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            _intent.reset(token)
+            raise
+        return leave(result, token)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _intent.get() == READ or (hints.get(READ_INTENT_HINT) and _intent.get() != WRITE):
+            return read_database()
+        return None  # The database of the related instance, if any, otherwise the primary
+
+    def db_for_write(self, model, **hints):
+        _mark_write()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA_DATABASE}
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA_DATABASE  # Replicated from the primary
@@ -0,0 +1,47 @@
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # Optional: nginx needs the ngx_brotli module to serve the .br files anyway
+    brotli = None
+
+COMPRESSED_EXTENSIONS = (".css", ".js", ".map", ".svg", ".txt", ".html", ".xml")
+COMPRESS_MIN_SIZE = 512  # Below one packet the compressed file saves nothing
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Static files under hashed names (cached forever by nginx), with a gzip copy of the text files
+    and a brotli one when the package is installed: nginx serves them with gzip_static instead of
+    compressing the same files on every request.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        # The original names are collected too, they are compressed for the templates using them
+        for name in sorted({*self.hashed_files, *self.hashed_files.values()}):
+            if name.endswith(COMPRESSED_EXTENSIONS):
+                self._compress(name)
+
+    def _compress(self, name):
+        with self.open(name) as file:
+            content = file.read()
+        if len(content) < COMPRESS_MIN_SIZE:
+            return
+
+        variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(content)
+
+        for extension, compressed in variants.items():
+            if len(compressed) >= len(content):
+                continue
+            if self.exists(name + extension):
+                self.delete(name + extension)
+            self._save(name + extension, ContentFile(compressed))
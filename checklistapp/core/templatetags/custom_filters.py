@@ -1,7 +1,9 @@
 from datetime import timedelta
 
 from django import template
+from django.conf import settings
 from django.utils import timezone
+from django.utils.html import format_html
 
 register = template.Library()
 
@@ -12,6 +14,12 @@ def get_item(dictionary, key):
     return dictionary.get(key)
 
 
+@register.filter
+def equals(value, other):
+    """Comparison usable as an argument of another tag, e.g. the vary_on of {% cache %}"""
+    return value == other
+
+
 @register.filter
 def smart_timesince(value):
     """
@@ -40,6 +48,12 @@ def smart_timesince(value):
         return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@register.simple_tag
+def release():
+    """settings.RELEASE, e.g. in the vary_on of {% cache %}: {% release as release %}"""
+    return settings.RELEASE
+
+
 @register.simple_tag
 def url_with_query(base_url, query_string):
     """
@@ -51,3 +65,14 @@ def url_with_query(base_url, query_string):
         separator = "&" if "?" in base_url else "?"
         return f"{base_url}{separator}{query_string}"
     return base_url
+
+
+@register.filter
+def timestamp(value):
+    """
+    Render the date in a <time> element, shown like smart_timesince by base.js in the browser.
+    The HTML does not depend on the current time: the partials sent with an ETag stay identical until their data changes.
+    """
+    if not value:
+        return ""
+    return format_html('<time datetime="{}" data-timesince>{}</time>', value.isoformat(), value.strftime("%Y-%m-%d %H:%M:%S"))
@@ -1,13 +1,49 @@
 import base64
+import gzip
+import os
+import runpy
+import subprocess
+import sys
+import time
 from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from accounts.models import User, UserProjectPermissions
+from accounts.services import AccountService
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from checklist.services import ChecklistService, CommentService
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.models.signals import post_delete
+from django.http import HttpResponse
 from django.template import Context, Template
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-
+from inventory.models import InventoryField
+from jobs.models import Job
+from projects.models import Project
+from projects.services import ProjectService
+from search.models import SearchEntry
+from templates_management.models import StepTemplate
+
+from .cache import CacheNamespace, cache_metrics, reset_cache_metrics
+from .deletion import fast_delete
+from .explain import sequential_scans
 from .forms import Base64FileField  # Adaptez l'import
+from .icons import LUCIDE_SOURCE, build_bundle
+from .invalidation import InvalidationBus, LocalCache
+from .middleware import ReplicaMiddleware
+from .models import CacheGeneration
+from .routers import REPLICA_PIN_COOKIE, ReplicaRouter, end_request, read_intent, start_request, write_intent
+from .warmup import warm_up
 
 """
 Test templatetags
@@ -47,6 +83,14 @@ def test_smart_timesince_old(render_template):
     assert rendered == expected_format
 
 
+def test_timestamp(render_template):
+    """The date is rendered absolute, the browser shows it relative (see base.js)"""
+    date = timezone.now() - timedelta(hours=2)
+    rendered = render_template("{{ date|timestamp }}", {"date": date})
+    assert rendered == f'<time datetime="{date.isoformat()}" data-timesince>{date.strftime("%Y-%m-%d %H:%M:%S")}</time>'
+    assert render_template("{{ date|timestamp }}", {"date": None}) == ""
+
+
 def test_url_with_query_tag(render_template):
     # Test ajout premier paramètre
     res1 = render_template("{% url_with_query '/home' 'tab=1' %}")
@@ -100,3 +144,520 @@ def test_base64_file_field_empty():
     field = Base64FileField(required=False)
 
     assert field.clean(None) is None
+
+
+"""
+Test fast_delete
+"""
+
+
+def _fill_project(project, user, steps=2, tasks=3):
+    for i in range(steps):
+        step = ProjectStep.objects.create(project=project, title=f"Step {i}", order=i + 1)
+        for j in range(tasks):
+            task = ProjectTask.objects.create(project_step=step, title=f"Task {j}", order=j + 1)
+            TaskComment.objects.create(project_task=task, user=user, comment_text="Done")
+
+
+@pytest.mark.django_db
+def test_fast_delete_project(user, project, permission, project_inventory, inventory_field_text):
+    """The project and all the rows depending on it are deleted, the nullable links are cleared"""
+    _fill_project(project, user)
+    job = Job.objects.create(kind="projects.clone", project=project)
+
+    total, deleted = fast_delete(Project.objects.filter(pk=project.pk))
+
+    assert deleted["projects.Project"] == 1
+    assert deleted["checklist.ProjectTask"] == 6
+    assert deleted["checklist.TaskComment"] == 6
+    assert deleted["inventory.InventoryField"] == 1
+    assert deleted["accounts.UserProjectPermissions"] == 1
+    assert total == sum(deleted.values())
+    assert not SearchEntry.objects.exists()
+    assert not InventoryField.objects.exists()
+    assert not UserProjectPermissions.objects.exists()
+    job.refresh_from_db()
+    assert job.project_id is None
+
+
+@pytest.mark.django_db
+def test_fast_delete_keeps_other_projects(user, project, project2):
+    _fill_project(project, user)
+    _fill_project(project2, user)
+
+    fast_delete(Project.objects.filter(pk=project.pk))
+
+    assert ProjectTask.objects.filter(project_step__project=project2).count() == 6
+    assert SearchEntry.objects.filter(project=project2).exists()
+
+
+@pytest.mark.django_db
+def test_fast_delete_queries_do_not_depend_on_size(user, project, project2):
+    """Rows are deleted with set-based statements, not one by one"""
+    _fill_project(project, user, steps=1, tasks=1)
+    _fill_project(project2, user, steps=3, tasks=10)
+
+    with CaptureQueriesContext(connection) as small:
+        fast_delete(Project.objects.filter(pk=project.pk))
+    with CaptureQueriesContext(connection) as big:
+        fast_delete(Project.objects.filter(pk=project2.pk))
+
+    assert len(big) == len(small)
+
+
+@pytest.mark.django_db
+def test_fast_delete_in_batches(user, project):
+    _fill_project(project, user, steps=1, tasks=5)
+
+    total, deleted = fast_delete(ProjectTask.objects.all(), batch_size=2)
+
+    assert deleted["checklist.ProjectTask"] == 5
+    assert not TaskComment.objects.exists()
+
+
+@pytest.mark.django_db
+def test_fast_delete_sends_signals_when_listened(user, project):
+    """Models with delete receivers go through the collector so the signals still fire"""
+    _fill_project(project, user, steps=1, tasks=2)
+    received = []
+
+    def receiver(sender, instance, **kwargs):
+        received.append(instance.pk)
+
+    post_delete.connect(receiver, sender=TaskComment)
+    try:
+        fast_delete(Project.objects.filter(pk=project.pk))
+    finally:
+        post_delete.disconnect(receiver, sender=TaskComment)
+
+    assert len(received) == 2
+    assert not TaskComment.objects.exists()
+
+
+# Warm-up
+
+
+@pytest.mark.django_db
+def test_warm_up_loads_templates_urls_and_catalog():
+    """The warm-up compiles the project templates, reverses the URL names and loads the catalog"""
+    StepTemplate.objects.create(title="Step", icon="x", default_order=1, is_active=True)
+
+    stats = warm_up()
+
+    assert stats["templates"] == len(list((settings.BASE_DIR / "templates").rglob("*.html"))) + 1  # + theme
+    assert stats["urls"] > 50
+    assert stats["catalog"] == 1
+
+
+@pytest.mark.django_db
+def test_warm_up_survives_a_failing_step(mocker):
+    """A failing step is logged, the server still starts"""
+    mocker.patch("core.warmup.TemplateCatalog.get", side_effect=Exception("database down"))
+
+    stats = warm_up()
+
+    assert stats["catalog"] == 0
+    assert stats["templates"] > 0
+
+
+@pytest.mark.parametrize(
+    "worker_class, environ, conn_max_age",
+    [
+        ("sync", {}, 60),
+        ("uvicorn_worker.UvicornWorker", {}, 0),
+        ("uvicorn_worker.UvicornWorker", {"DB_CONN_MAX_AGE": "30"}, 60),
+    ],
+)
+def test_gunicorn_keeps_database_connections_of_sync_workers_only(monkeypatch, worker_class, environ, conn_max_age):
+    """The ASGI workers close the connections after each request, unless DB_CONN_MAX_AGE is set"""
+    monkeypatch.setattr(os, "environ", environ)
+    monkeypatch.setitem(connections.settings["default"], "CONN_MAX_AGE", 60)
+    config = runpy.run_path(str(settings.BASE_DIR / "checklistapp" / "gunicorn_conf.py"))
+
+    # The worker class given on the command line is only known once gunicorn parsed it
+    config["post_worker_init"](SimpleNamespace(cfg=SimpleNamespace(worker_class_str=worker_class)))
+
+    assert connection.settings_dict["CONN_MAX_AGE"] == conn_max_age
+
+
+# Cache
+
+
+def test_cache_namespace_get_or_set_counts_hits_and_misses():
+    """The value is computed once, the metrics count the miss then the hit"""
+    reset_cache_metrics()
+    namespace = CacheNamespace("test")
+    compute = Mock(return_value={"total": 3})
+
+    assert namespace.get_or_set(1, compute) == {"total": 3}
+    assert namespace.get_or_set(1, compute) == {"total": 3}
+
+    compute.assert_called_once()
+    assert cache_metrics()["test"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_cache_namespace_invalidate_drops_every_entry():
+    """A new generation hides the entries of the namespace, the other namespaces keep theirs"""
+    namespace, other = CacheNamespace("test"), CacheNamespace("other")
+    namespace.set("a", 1)
+    namespace.set("b", 2)
+    other.set("a", 1)
+
+    namespace.invalidate()
+
+    assert namespace.get("a") is None
+    assert namespace.get("b") is None
+    assert other.get("a") == 1
+
+
+def test_cache_namespace_version_separates_the_value_formats():
+    """Values cached by a previous version of the code are not read"""
+    CacheNamespace("test", version=1).set("a", [1, 2])
+
+    assert CacheNamespace("test", version=2).get("a", "missing") == "missing"
+    assert CacheNamespace("test", version=1).get("a") == [1, 2]
+
+
+def test_cache_namespace_survives_a_lost_generation():
+    """The generation restarts from the clock when evicted, the old entries are not reused"""
+    namespace = CacheNamespace("test")
+    namespace.set("a", 1)
+    namespace.cache.delete("test:generation")
+
+    assert namespace.get("a") is None
+
+
+# Invalidation bus
+
+# Process holding a LocalCache, driven line by line from the tests: "read <key> <value>" returns the cached value
+# or caches the given one, "poll" reads the generations like the middleware and "publish <namespace>" invalidates
+BUS_PROCESS = """
+import sys
+
+import django
+
+django.setup()
+
+from django.db import connection, connections
+from core.invalidation import InvalidationBus, LocalCache
+from core.models import CacheGeneration
+
+if sys.argv[1] == "create":
+    with connection.schema_editor() as editor:
+        editor.create_model(CacheGeneration)
+local = LocalCache("test")
+print("ready", flush=True)
+for line in sys.stdin:
+    command, *args = line.split()
+    if command == "read":
+        print(local.get_or_set(args[0], lambda: args[1]), flush=True)
+        continue
+    if command == "poll":
+        InvalidationBus.poll()
+    elif command == "publish":
+        InvalidationBus.publish(args[0])
+    print("ok", flush=True)
+"""
+
+
+def _send(process, command: str) -> str:
+    process.stdin.write(command + "\n")
+    process.stdin.flush()
+    return process.stdout.readline().strip()
+
+
+@pytest.fixture
+def bus_processes(tmp_path):
+    """Start two processes sharing the database of the test, an SQLite file when not on PostgreSQL"""
+    processes = []
+
+    def start(listen: str):
+        if connection.vendor == "postgresql":
+            db = connection.settings_dict
+            url, create = f"postgres://{db['USER']}:{db['PASSWORD']}@{db['HOST']}:{db['PORT']}/{db['NAME']}", False
+        else:
+            url, create = f"sqlite:///{tmp_path / 'bus.sqlite3'}", True
+        env = {
+            **os.environ,
+            "DATABASE_URL": url,
+            "INVALIDATION_LISTEN": listen,
+            "DJANGO_SETTINGS_MODULE": "checklistapp.settings",
+        }
+        for action in ["create" if create else "run", "run"]:
+            process = subprocess.Popen(
+                [sys.executable, "-c", BUS_PROCESS, action],
+                cwd=settings.BASE_DIR,
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            processes.append(process)
+            assert process.stdout.readline().strip() == "ready"
+        return processes
+
+    yield start
+    for process in processes:
+        process.stdin.close()
+        process.wait(timeout=10)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_cache_is_dropped_when_published():
+    """The process publishing the invalidation drops its entries at once"""
+    local = LocalCache("test")
+    assert local.get_or_set("a", lambda: 1) == 1
+    assert local.get_or_set("a", lambda: 2) == 1
+
+    InvalidationBus.publish("test")
+
+    assert local.get_or_set("a", lambda: 3) == 3
+    assert CacheGeneration.objects.get(namespace="test").generation == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_cache_ignores_values_computed_before_an_invalidation():
+    """A value read from the data of a previous generation is not stored"""
+    local = LocalCache("test")
+    generation = local.generation()
+    InvalidationBus.publish("test")
+
+    local.set("a", 1, generation)
+
+    assert local.get("a") is None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("listen", ["off", "on"])
+def test_invalidation_reaches_another_process(bus_processes, listen):
+    """The other process keeps its entry until the generation it polls, or is notified of, changes"""
+    if listen == "on" and connection.vendor != "postgresql":
+        pytest.skip("LISTEN/NOTIFY requires PostgreSQL")
+    writer, reader = bus_processes(listen)
+    _send(reader, "poll")
+    assert _send(reader, "read a 1") == "1"
+    assert _send(reader, "read a 2") == "1"
+
+    _send(writer, "publish test")
+
+    deadline = time.monotonic() + 5  # NOTIFY is delivered asynchronously
+    while _send(reader, "poll") and _send(reader, "read a 3") != "3":
+        assert time.monotonic() < deadline, "The invalidation did not reach the other process"
+        time.sleep(0.05)
+
+
+# Read replica
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """A replica alias for the routing decisions, the tests do not query it"""
+    monkeypatch.setitem(settings.DATABASES, "replica", settings.DATABASES["default"])
+    yield
+    end_request()
+
+
+def test_read_intent_goes_to_the_replica_in_a_request(replica):
+    """The querysets returned by a read intent keep it when evaluated later"""
+    assert ChecklistService.get_steps_for_project(1).db == "default"
+
+    start_request(pinned=False)
+
+    assert ChecklistService.get_steps_for_project(1).db == "replica"
+    assert ProjectStep.objects.filter(project_id=1).db == "default"
+
+
+def test_reads_go_to_the_primary_after_a_write(replica):
+    """Read-your-writes: after a write in the request, or in a recent one of the same browser"""
+    start_request(pinned=False)
+    ReplicaRouter().db_for_write(Project)
+    assert ChecklistService.get_steps_for_project(1).db == "default"
+
+    start_request(pinned=True)
+    assert ChecklistService.get_steps_for_project(1).db == "default"
+
+
+def test_write_intent_reads_from_the_primary(replica):
+    """The reads of a write intent, nested read intents included, go to the primary"""
+
+    @write_intent
+    def update():
+        return ChecklistService.get_steps_for_project(1).db, ProjectStep.objects.filter(project_id=1).db
+
+    @read_intent
+    def read():
+        return ProjectStep.objects.filter(project_id=1).db
+
+    start_request(pinned=False)
+    assert read() == "replica"
+    assert update() == ("default", "default")
+    assert read() == "default"
+
+
+def test_replica_middleware_pins_the_browser_after_a_write(replica):
+    """A request which wrote sets the cookie sending the next ones to the primary"""
+
+    def write(request):
+        ReplicaRouter().db_for_write(Project)
+        return HttpResponse()
+
+    response = ReplicaMiddleware(write)(RequestFactory().post("/"))
+    assert response.cookies[REPLICA_PIN_COOKIE]["max-age"] == settings.REPLICA_PIN_SECONDS
+
+    response = ReplicaMiddleware(lambda request: HttpResponse())(RequestFactory().get("/"))
+    assert REPLICA_PIN_COOKIE not in response.cookies
+
+
+# Migrates a primary SQLite file, copies it as the replica, then writes to the primary only: the replica lags behind
+REPLICA_PROCESS = """
+import shutil
+import sys
+
+import django
+
+django.setup()
+
+from accounts.models import User, UserProjectPermissions
+from core.routers import end_request, start_request
+from django.core.management import call_command
+from projects.models import Project
+from projects.services import ProjectService
+from projects.services import ProjectService
+
+call_command("migrate", verbosity=0)
+user = User.objects.create_user("user")
+shutil.copy(sys.argv[1], sys.argv[2])
+project = Project.objects.create(name="New")
+UserProjectPermissions.objects.create(user=user, project=project, can_view=True)
+
+
+def projects():
+    return ",".join(project.name for project in ProjectService.get_projects_for_user(user)) or "-"
+
+
+start_request(pinned=False)
+print("replica", projects())
+Project.objects.filter(pk=project.pk).update(name="Renamed")
+print("after a write", projects())
+start_request(pinned=True)
+print("pinned", projects())
+start_request(pinned=False)
+print("next request", projects())
+end_request()
+print("outside a request", projects())
+"""
+
+
+def test_read_replica_with_two_sqlite_files(tmp_path):
+    """The reads follow the replica until the request writes or the browser is pinned to the primary"""
+    primary, replica = tmp_path / "primary.sqlite3", tmp_path / "replica.sqlite3"
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{primary}", "DATABASE_REPLICA_URL": f"sqlite:///{replica}"}
+
+    result = subprocess.run(
+        [sys.executable, "-c", REPLICA_PROCESS, str(primary), str(replica)],
+        cwd=settings.BASE_DIR,
+        env={**env, "DJANGO_SETTINGS_MODULE": "checklistapp.settings"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.stdout.splitlines() == [
+        "replica -",
+        "after a write Renamed",
+        "pinned Renamed",
+        "next request -",
+        "outside a request Renamed",
+    ], result.stderr
+
+
+# Query plans
+
+
+@pytest.fixture
+def seeded_database(db, step_template):
+    """
+    Statistics close to a real database: 500 projects of 2 steps of 3 tasks with a comment each, one project in 50
+    built from the template, and 50 users seeing 8 of their 10 projects. Refreshed like autovacuum would do.
+    """
+    users = User.objects.bulk_create(User(username=f"user{i}", email=f"user{i}@test.com") for i in range(50))
+    projects = Project.objects.bulk_create(
+        Project(name=f"Project {i}", status=["active", "completed", "archived"][i % 3]) for i in range(500)
+    )
+    steps = ProjectStep.objects.bulk_create(
+        ProjectStep(project=project, step_template=step_template if i % 50 == 0 else None, title="Step", icon="📋", order=order)
+        for i, project in enumerate(projects)
+        for order in range(2)
+    )
+    tasks = ProjectTask.objects.bulk_create(
+        ProjectTask(project_step=step, title="Task", order=order, status=["pending", "done", "na"][order])
+        for step in steps
+        for order in range(3)
+    )
+    TaskComment.objects.bulk_create(TaskComment(project_task=task, user=users[0], comment_text="Comment") for task in tasks)
+    UserProjectPermissions.objects.bulk_create(
+        UserProjectPermissions(user=user, project=projects[(i * 10 + j) % 500], can_view=j < 8)
+        for i, user in enumerate(users)
+        for j in range(10)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return users[0], steps[0], tasks[0]
+
+
+def test_service_queries_use_the_indexes(seeded_database, step_template):
+    """The hot queries of the services must not read whole tables, see the indexes of the models"""
+    user, step, task = seeded_database
+    queries = {
+        "progress": step.tasks.filter(status__in=["done", "na"]),
+        "comments": CommentService.get_comments_on_task(step.project_id, step.id, task.id),
+        "permissions": AccountService.get_all_permissions_for_user(user),
+        "projects": ProjectService.get_projects_for_user(user, "active"),
+        "template propagation": ProjectStep.objects.filter(step_template_id__in=[step_template.id], project__status="active"),
+    }
+
+    for name, queryset in queries.items():
+        assert sequential_scans(queryset) == [], f"{name}:\n{queryset.explain()}"
+
+
+def test_sequential_scans_are_detected(seeded_database):
+    """Without an index on the filtered column the whole table is read"""
+    scans = sequential_scans(TaskComment.objects.filter(comment_text="Comment"))
+
+    assert scans == ["checklist_taskcomment"]
+
+
+# Static files
+
+
+def test_icon_bundle_is_up_to_date():
+    """static/js/lucide-icons.js has every icon used by the templates, rebuild it with manage.py build_icons"""
+    call_command("build_icons", "--check", stdout=StringIO(), stderr=StringIO())
+
+
+def test_icon_bundle_keeps_only_the_used_icons():
+    """The bundle holds the runtime and the requested icons, unknown names are reported"""
+    bundle, unknown = build_bundle(LUCIDE_SOURCE.read_text(), {"check", "trash-2", "not-an-icon"})
+
+    assert "const Check = " in bundle
+    assert "Trash2: Trash2" in bundle
+    assert "const ZoomOut = " not in bundle
+    assert "const createIcons = " in bundle
+    assert unknown == ["not-an-icon"]
+
+
+def test_collectstatic_writes_hashed_and_compressed_files(settings, tmp_path):
+    """The static files are stored under hashed names with a gzip copy for nginx"""
+    settings.STATIC_ROOT = tmp_path
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "core.storage.PrecompressedManifestStaticFilesStorage"},
+    }
+
+    call_command("collectstatic", "--noinput", verbosity=0)
+
+    hashed_name = staticfiles_storage.stored_name("js/lucide-icons.js")
+    assert hashed_name != "js/lucide-icons.js"
+    compressed = (tmp_path / f"{hashed_name}.gz").read_bytes()
+    assert gzip.decompress(compressed) == (tmp_path / hashed_name).read_bytes()
+    assert not (tmp_path / "images/favicon.png.gz").exists()  # Already compressed
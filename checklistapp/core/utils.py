@@ -1,8 +1,32 @@
+import secrets
 from datetime import datetime, time
+from pathlib import Path
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.shortcuts import render
+from django.template.utils import get_app_template_dirs
 from django.utils import timezone
 
 
 def default_midnight():
     # minuit dans la timezone Django
     return timezone.make_aware(datetime.combine(timezone.localdate(), time(0, 0, 0)))
+
+
+def new_version() -> int:
+    """Random version token, see projects.versions"""
+    return secrets.randbits(62)
+
+
+async def arender(request, template_name, context=None):
+    """render() for the async views: the templates may still query the database (lazy relations, cache misses)"""
+    return await sync_to_async(render)(request, template_name, context)
+
+
+def project_template_dirs() -> list[Path]:
+    """Template directories of the project (templates/ and the apps), without Django admin and third party ones"""
+    dirs = [Path(d) for template in settings.TEMPLATES for d in template.get("DIRS", [])] + list(
+        get_app_template_dirs("templates")
+    )
+    return [directory for directory in dirs if directory.is_relative_to(settings.BASE_DIR)]
@@ -0,0 +1,78 @@
+import logging
+import time
+
+from django.db import connections
+from django.template import engines
+from django.urls import NoReverseMatch, URLResolver, get_resolver, reverse
+from django.urls.converters import IntConverter
+from templates_management.catalog import TemplateCatalog
+
+from core.utils import project_template_dirs
+
+logger = logging.getLogger(__name__)
+
+"""
+Warm-up of a freshly loaded application, run once by the gunicorn master before it forks the workers
+(see checklistapp/gunicorn_conf.py): the forked workers inherit the compiled templates, the populated
+URL resolvers and the template catalog instead of paying for them on their first requests.
+"""
+
+
+def warm_up() -> dict[str, int | float]:
+    """Run every step of the warm-up, a failing step is logged and does not prevent the server from starting"""
+    stats = {}
+    start = time.perf_counter()
+    for name, step in [("templates", compile_templates), ("urls", resolve_urls), ("catalog", prime_catalog)]:
+        try:
+            stats[name] = step()
+        except Exception as e:
+            logger.warning(f"Warm-up of the {name} failed: {e}")
+            stats[name] = 0
+
+    connections.close_all()  # The forked workers must not share the sockets of the master
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+def compile_templates() -> int:
+    """Load the templates of the project through the cached loaders, the {% partialdef %} included"""
+    count = 0
+    for engine in engines.all():
+        for directory in project_template_dirs():
+            for path in sorted(directory.rglob("*.html")):
+                try:
+                    engine.get_template(path.relative_to(directory).as_posix())
+                    count += 1
+                except Exception as e:
+                    logger.warning(f"Template {path} not compiled: {e}")
+    return count
+
+
+def resolve_urls() -> int:
+    """Reverse every named URL pattern, which populates the resolvers and compiles their patterns"""
+    count = 0
+    for name, converters in _url_names(get_resolver().url_patterns):
+        kwargs = {key: 1 if isinstance(converter, IntConverter) else "x" for key, converter in converters.items()}
+        try:
+            reverse(name, kwargs=kwargs)
+            count += 1
+        except NoReverseMatch:
+            pass  # Regex patterns with positional groups, the resolver is populated anyway
+    return count
+
+
+def _url_names(patterns, namespace: str = "", converters: dict | None = None):
+    converters = converters or {}
+    for pattern in patterns:
+        pattern_converters = {**converters, **getattr(pattern.pattern, "converters", {})}
+        if isinstance(pattern, URLResolver):
+            child_namespace = f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            yield from _url_names(pattern.url_patterns, child_namespace, pattern_converters)
+        elif pattern.name:
+            yield f"{namespace}{pattern.name}", pattern_converters
+
+
+def prime_catalog() -> int:
+    """Load the active template catalog, the workers then only check its version"""
+    catalog = TemplateCatalog.get()
+    return len(catalog.step_templates) + len(catalog.inventory_templates)
@@ -2,6 +2,7 @@ from core.forms import Base64FileField
 from django import forms
 from django.conf import settings
 from django.urls import reverse
+from projects.versions import bump_versions
 
 
 class DynamicInventoryForm(forms.Form):
@@ -177,3 +178,6 @@ class DynamicInventoryForm(forms.Form):
                     inst_field.datetime_value = new_value
 
             inst_field.save()
+
+        # InventoryField has no post_save receiver, a single bump covers all the fields of the form
+        bump_versions([self.instance.project_id], inventory_ids=[self.instance.pk])
@@ -0,0 +1,69 @@
+# Generated by Django 6.0 on 2026-10-19 09:21
+
+from django.db import migrations, models
+
+from inventory.utils import hash_file_value, normalize_lookup_value
+
+
+def backfill_lookup_values(apps, schema_editor):
+    InventoryField = apps.get_model("inventory", "InventoryField")
+
+    fields = (
+        InventoryField.objects.filter(field_type__in=["text", "url", "file"])
+        .exclude(field_template__is_secret=True)
+        .only("id", "field_type", "text_value", "file_value")
+    )
+
+    batch = []
+    for field in fields.iterator(chunk_size=1000):
+        if field.field_type == "file":
+            field.file_hash = hash_file_value(field.file_value)
+        else:
+            field.lookup_value = normalize_lookup_value(field.text_value)
+        batch.append(field)
+
+        if len(batch) == 1000:
+            InventoryField.objects.bulk_update(batch, ["lookup_value", "file_hash"])
+            batch = []
+
+    InventoryField.objects.bulk_update(batch, ["lookup_value", "file_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0005_alter_projectinventory_description"),
+        ("templates_management", "0005_rename_name_inventorytemplate_title_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventoryfield",
+            name="file_hash",
+            field=models.CharField(
+                blank=True, editable=False, help_text="sha256 of the file content", max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="inventoryfield",
+            name="lookup_value",
+            field=models.CharField(
+                blank=True, editable=False, help_text="Normalized text/url value used for lookup", max_length=500, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventoryfield",
+            index=models.Index(
+                condition=models.Q(("lookup_value__isnull", False)),
+                fields=["lookup_value"],
+                name="inventory_lookup_value_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventoryfield",
+            index=models.Index(
+                condition=models.Q(("file_hash__isnull", False)), fields=["file_hash"], name="inventory_file_hash_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_lookup_values, migrations.RunPython.noop),
+    ]
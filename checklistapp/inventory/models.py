@@ -1,7 +1,10 @@
+from core.utils import new_version
 from django.db import models
 from encrypted_fields.fields import EncryptedTextField
 from templates_management.models import InventoryTemplate, TemplateField
 
+from .utils import hash_file_value, normalize_lookup_value
+
 
 class ProjectInventory(models.Model):
     project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="inventories")
@@ -18,6 +21,7 @@ class ProjectInventory(models.Model):
     order = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    version = models.BigIntegerField(default=new_version, editable=False, help_text="Changed on every write, used as ETag")
 
     class Meta:
         ordering = ["order"]
@@ -61,6 +65,49 @@ class InventoryField(models.Model):
     password_value = EncryptedTextField(max_length=500, null=True, blank=True)
     datetime_value = models.DateTimeField(null=True, blank=True)
 
+    # Cross-project lookup, always null for secret and password fields so they never enter the indexes
+    lookup_value = models.CharField(
+        max_length=500, null=True, blank=True, editable=False, help_text="Normalized text/url value used for lookup"
+    )
+    file_hash = models.CharField(max_length=64, null=True, blank=True, editable=False, help_text="sha256 of the file content")
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["lookup_value"],
+                name="inventory_lookup_value_idx",
+                opclasses=["varchar_pattern_ops"],  # Prefix search (LIKE 'value%') on PostgreSQL, ignored elsewhere
+                condition=models.Q(lookup_value__isnull=False),
+            ),
+            models.Index(fields=["file_hash"], name="inventory_file_hash_idx", condition=models.Q(file_hash__isnull=False)),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.refresh_lookup_values()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "lookup_value", "file_hash"}
+        super().save(*args, **kwargs)
+
+    @property
+    def is_secret(self) -> bool:
+        return self.field_type == "password" or bool(self.field_template and self.field_template.is_secret)
+
+    def refresh_lookup_values(self):
+        """
+        Compute the lookup columns from the current value.
+        Must be called explicitly before bulk_create / bulk_update.
+        """
+        self.lookup_value = None
+        self.file_hash = None
+
+        if self.is_secret:
+            return
+
+        if self.field_type in ["text", "url"]:
+            self.lookup_value = normalize_lookup_value(self.text_value)
+        elif self.field_type == "file":
+            self.file_hash = hash_file_value(self.file_value)
+
     def get_value(self):
         """
         Return the proper value based on type
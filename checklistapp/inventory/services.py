@@ -1,13 +1,22 @@
-from core.exceptions import RecordNotFoundError
+from accounts.services import AccountService
+from core.deletion import fast_delete
+from core.exceptions import InvalidParameterError, RecordNotFoundError
+from core.routers import read_intent, write_intent
 from django.db import transaction
 from django.db.models import Count, Max, Prefetch
+from projects.versions import bump_versions
+from templates_management.catalog import InventoryTemplateSnapshot, TemplateCatalog
 from templates_management.models import InventoryTemplate, TemplateField
 
 from .models import InventoryField, ProjectInventory
+from .utils import normalize_lookup_value
+
+BULK_BATCH_SIZE = 1000
 
 
 class InventoryService:
     @staticmethod
+    @read_intent
     def get_template(template_id: int | None = None, load_fields=False):
         qs = InventoryTemplate.objects.filter(is_active=True).order_by("default_order")
         if load_fields:
@@ -20,6 +29,12 @@ class InventoryService:
         return qs
 
     @staticmethod
+    def get_template_catalog() -> tuple[InventoryTemplateSnapshot, ...]:
+        """Active inventory templates with their fields, from the in-memory catalog (read only)"""
+        return TemplateCatalog.get().inventory_templates
+
+    @staticmethod
+    @read_intent
     def get_inventory(project_id, inventory_id: int | None = None, prefetch_related: list[str] | None = None):
         qs = ProjectInventory.objects.filter(project__id=project_id)
 
@@ -34,6 +49,7 @@ class InventoryService:
         return qs
 
     @staticmethod
+    @read_intent
     def get_inventory_for_project(project):
         return (
             ProjectInventory.objects.filter(project=project)  # i need the project Id that is in url
@@ -43,6 +59,33 @@ class InventoryService:
         )
 
     @staticmethod
+    @read_intent
+    def lookup_values(user, value: str | None = None, file_hash: str | None = None):
+        """
+        Find the inventory fields referencing a value (host, url, ...) or a file, across all projects visible by the user.
+        Values are matched by prefix after normalization, files by their sha256 (see hash_file_content).
+        Secret and password fields are never returned.
+        """
+        qs = InventoryField.objects.filter(
+            inventory__project__in=AccountService.get_all_permissions_for_user(user, True, False, False).values("project_id")
+        )
+
+        if file_hash:
+            qs = qs.filter(file_hash=file_hash.lower())
+        else:
+            normalized = normalize_lookup_value(value)
+            if not normalized:
+                raise InvalidParameterError("Please provide a value or a file to look up.")
+            qs = qs.filter(lookup_value__startswith=normalized)
+
+        return (
+            qs.exclude(field_template__is_secret=True)
+            .select_related("inventory__project")
+            .order_by("inventory__project__name", "inventory__order", "group_order", "field_order")
+        )
+
+    @staticmethod
+    @read_intent
     def get_fields(project_id, inventory_id, field_id: int | None = None):
         qs = InventoryField.objects.filter(inventory__project__id=project_id, inventory__id=inventory_id)
         if field_id:
@@ -53,8 +96,14 @@ class InventoryService:
         return qs
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def add_inventory_to_project(project, template_id, custom_title: str | None = None) -> int:
+        from projects.services import ArchiveService  # projects.services imports this module
+
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError("The project is in cold storage, restore it before changing it.")
+
         inventory_template = InventoryService.get_template(template_id, load_fields=True)
 
         # Determine inventory order and count
@@ -91,10 +140,71 @@ class InventoryService:
 
         if fields_to_create:
             InventoryField.objects.bulk_create(fields_to_create)
+            bump_versions([project.pk], inventory_ids=[inventory.pk])
 
         return {"inventory": inventory, "count_step": count_step}
 
     @staticmethod
+    @write_intent
+    @transaction.atomic
+    def add_inventories_to_project(project, items: list[tuple[int, str | None]]) -> dict:
+        """
+        Append several inventories at once from a list of (template_id, custom_title).
+        Whatever the number of inventories: 2 queries for the templates, 1 for the order and 1 bulk insert for inventories and for fields.
+        """
+        from projects.services import ArchiveService  # projects.services imports this module
+
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError("The project is in cold storage, restore it before changing it.")
+
+        templates = {
+            template.id: template
+            for template in InventoryService.get_template(load_fields=True).filter(id__in={item[0] for item in items})
+        }
+        missing = {item[0] for item in items} - set(templates)
+        if missing:
+            raise RecordNotFoundError("Inventory template not found.")
+
+        # Determine inventory order and count in a single query
+        result = ProjectInventory.objects.filter(project=project).aggregate(max_order=Max("order"), total=Count("id"))
+        current_max_order = result["max_order"] or 0
+
+        inventories = []
+        for template_id, custom_title in items:
+            inventory_template = templates[template_id]
+            current_max_order += 1
+            inventories.append(
+                ProjectInventory(
+                    project=project,
+                    inventory_template=inventory_template,
+                    title=custom_title or inventory_template.title,
+                    description=inventory_template.description,
+                    icon=inventory_template.icon,
+                    order=current_max_order,
+                )
+            )
+        ProjectInventory.objects.bulk_create(inventories, batch_size=BULK_BATCH_SIZE)
+
+        fields = [
+            InventoryField(
+                inventory=inventory,
+                field_template=field_template,
+                group_name=field_template.group_name,
+                group_order=field_template.group_order,
+                field_name=field_template.field_name,
+                field_order=field_template.field_order,
+                field_type=field_template.field_type,
+            )
+            for inventory in inventories
+            for field_template in inventory.inventory_template.fields.all()
+        ]
+        InventoryField.objects.bulk_create(fields, batch_size=BULK_BATCH_SIZE)
+        bump_versions([project.pk])
+
+        return {"inventories": inventories, "count_step": result["total"]}
+
+    @staticmethod
+    @write_intent
     @transaction.atomic
     def reorder_inventory(project, ids: list[int]):
         """
@@ -115,10 +225,14 @@ class InventoryService:
             steps[step_id].order = index
 
         ProjectInventory.objects.bulk_update(steps.values(), ["order"])
+        bump_versions([project.pk])
 
     @staticmethod
+    @write_intent
     @transaction.atomic
     def delete_inventory(project_id, inventory_id):
+        """Delete the inventory with its fields using set-based DELETEs (no row loaded in memory)"""
         inventory = InventoryService.get_inventory(project_id, inventory_id)
 
-        inventory.delete()
+        fast_delete(ProjectInventory.objects.filter(pk=inventory.pk))
+        bump_versions([project_id])
@@ -1,3 +1,6 @@
+import base64
+import hashlib
+
 import pytest
 from django.utils import timezone
 
@@ -185,3 +188,61 @@ def test_inventory_cascade_delete(project, inventory_template):
     inventory.delete()
 
     assert not InventoryField.objects.filter(id=field_id).exists()
+
+
+@pytest.mark.django_db
+def test_inventory_field_lookup_value_normalized(project_inventory):
+    field = InventoryField.objects.create(
+        inventory=project_inventory,
+        group_name="Links",
+        field_name="Server",
+        field_type="url",
+        text_value="  HTTPS://Host.Example.com/ ",
+    )
+
+    assert field.lookup_value == "host.example.com"
+    assert field.file_hash is None
+
+
+@pytest.mark.django_db
+def test_inventory_field_file_hash(project_inventory):
+    field = InventoryField.objects.create(
+        inventory=project_inventory,
+        group_name="Files",
+        field_name="Certificate",
+        field_type="file",
+        file_value=base64.b64encode(b"certificate").decode(),
+        text_value="cert.pem",
+    )
+
+    assert field.file_hash == hashlib.sha256(b"certificate").hexdigest()
+    assert field.lookup_value is None
+
+
+@pytest.mark.django_db
+def test_inventory_field_secret_not_in_lookup(inventory_field_text, template_field_text):
+    """Test that marking a template field as secret removes its values from the lookup columns"""
+    assert inventory_field_text.lookup_value == "test value"
+
+    template_field_text.is_secret = True
+    template_field_text.save()
+
+    inventory_field_text.refresh_from_db()
+    assert inventory_field_text.lookup_value is None
+
+    # And it stays out of the lookup on the next save
+    inventory_field_text.save()
+    assert inventory_field_text.lookup_value is None
+
+
+@pytest.mark.django_db
+def test_inventory_field_back_in_lookup_when_no_longer_secret(inventory_field_text, template_field_text):
+    """Test that un-marking a secret template field fills the lookup columns again"""
+    template_field_text.is_secret = True
+    template_field_text.save()
+
+    template_field_text.is_secret = False
+    template_field_text.save()
+
+    inventory_field_text.refresh_from_db()
+    assert inventory_field_text.lookup_value == "test value"
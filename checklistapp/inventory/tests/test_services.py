@@ -0,0 +1,62 @@
+import hashlib
+
+import pytest
+from core.exceptions import InvalidParameterError
+
+from inventory.models import InventoryField, ProjectInventory
+from inventory.services import InventoryService
+
+
+@pytest.fixture
+def other_inventory(project2, inventory_template):
+    return ProjectInventory.objects.create(project=project2, inventory_template=inventory_template, title="Other", order=1)
+
+
+def _create_field(inventory, field_type="url", **kwargs):
+    return InventoryField.objects.create(
+        inventory=inventory, group_name="General", field_name="Field", field_type=field_type, **kwargs
+    )
+
+
+@pytest.mark.django_db
+def test_lookup_values_by_prefix(user, permission, project_inventory):
+    field = _create_field(project_inventory, text_value="https://vpn.example.com/login")
+    _create_field(project_inventory, text_value="https://git.example.com")
+
+    results = list(InventoryService.lookup_values(user, value="VPN.example.com"))
+
+    assert results == [field]
+
+
+@pytest.mark.django_db
+def test_lookup_values_restricted_to_visible_projects(user, permission, project_inventory, other_inventory):
+    field = _create_field(project_inventory, text_value="db01.internal")
+    _create_field(other_inventory, text_value="db01.internal")
+
+    results = list(InventoryService.lookup_values(user, value="db01"))
+
+    assert results == [field]
+
+
+@pytest.mark.django_db
+def test_lookup_values_by_file_hash(user, permission, project_inventory):
+    field = _create_field(project_inventory, field_type="file", file_value="Y2VydA==", text_value="cert.pem")
+
+    results = list(InventoryService.lookup_values(user, file_hash=hashlib.sha256(b"cert").hexdigest()))
+
+    assert results == [field]
+
+
+@pytest.mark.django_db
+def test_lookup_values_excludes_secret_fields(user, permission, project_inventory, template_field_password):
+    template_field_password.field_type = "text"
+    template_field_password.save()
+    _create_field(project_inventory, field_type="text", field_template=template_field_password, text_value="hidden.host")
+
+    assert list(InventoryService.lookup_values(user, value="hidden")) == []
+
+
+@pytest.mark.django_db
+def test_lookup_values_requires_value(user):
+    with pytest.raises(InvalidParameterError):
+        InventoryService.lookup_values(user, value="  ")
@@ -504,3 +504,42 @@ def test_upload_document_override_previous(client, user, project, project_invent
 
     assert inventory_field_file.text_value == "second.txt"
     assert inventory_field_file.file_value == base64.b64encode(content_2).decode()
+
+
+@pytest.mark.django_db
+def test_inventory_detail_conditional_get(client, user, project, project_inventory, inventory_field_text):
+    """The inventory partial is answered with 304 until one of its fields is saved"""
+    UserProjectPermissions.objects.create(user=user, project=project, can_view=True, can_edit=True)
+    client.login(username=user.username, password="password")
+    url = reverse(
+        "projects:inventory:inventory_detail", kwargs={"project_id": project.id, "inventory_id": project_inventory.id}
+    )
+    etag = client.get(url, HTTP_HX_REQUEST="true").headers["ETag"]
+    assert client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    client.post(
+        url, {"inventory_id": project_inventory.id, f"field_{inventory_field_text.id}": "Updated Value"}, HTTP_HX_REQUEST="true"
+    )
+
+    response = client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert b"Updated Value" in response.content
+
+
+@pytest.mark.django_db
+def test_inventory_detail_etag_changes_with_template_field(
+    client, user, project, permission, project_inventory, inventory_field_text, template_field_text
+):
+    """A field made secret leaves the inventory of the viewers at once"""
+    client.login(username=user.username, password="password")
+    url = reverse(
+        "projects:inventory:inventory_detail", kwargs={"project_id": project.id, "inventory_id": project_inventory.id}
+    )
+    etag = client.get(url, HTTP_HX_REQUEST="true").headers["ETag"]
+
+    template_field_text.is_secret = True
+    template_field_text.save()
+
+    response = client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert b"Test Value" not in response.content
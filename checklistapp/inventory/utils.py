@@ -0,0 +1,38 @@
+import base64
+import binascii
+import hashlib
+
+LOOKUP_VALUE_MAX_LENGTH = 500
+
+
+def normalize_lookup_value(value: str | None) -> str | None:
+    """
+    Normalize a text/url value for cross-project lookup.
+    "https://Host.example.com/" and "host.example.com" both become "host.example.com"
+    """
+    if not value:
+        return None
+
+    value = value.strip().lower()
+    if "://" in value:
+        value = value.split("://", 1)[1]
+    value = value.rstrip("/")
+
+    return value[:LOOKUP_VALUE_MAX_LENGTH] or None
+
+
+def hash_file_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file_value(b64_value: str | None) -> str | None:
+    """Return the sha256 of a file stored in base64, or None if there is no valid file"""
+    if not b64_value:
+        return None
+
+    try:
+        content = base64.b64decode(b64_value, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+
+    return hash_file_content(content)
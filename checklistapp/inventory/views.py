@@ -4,17 +4,21 @@ import logging
 from common.views import editable_header_view
 from core.exceptions import InvalidParameterError
 from core.mixins import (
+    AsyncConditionalGetMixin,
+    AsyncProjectReadRequiredMixin,
     CommonContextMixin,
+    ConditionalGetMixin,
     ProjectAdminRequiredMixin,
     ProjectReadRequiredMixin,
 )
+from core.utils import arender
 from django.contrib import messages
 from django.http import HttpResponse
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.views import View
-from django.views.generic import DetailView, ListView
+from django.views.generic import DetailView
 from django.views.generic.base import ContextMixin
 from django_htmx.http import reswap
 from projects.models import Project
@@ -152,7 +156,7 @@ class ListProjectInventoryView(ProjectAdminRequiredMixin, CommonContextMixin, De
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        context["inventory_templates"] = InventoryService.get_template(load_fields=True)
+        context["inventory_templates"] = InventoryService.get_template_catalog()
         context["project_inventory"] = InventoryService.get_inventory_for_project(self.object)
         return context
 
@@ -195,20 +199,20 @@ def download_inventory_file(request, project_id, inventory_id, field_id):
             return HttpResponse("Something went wrong when downloading the file.", status=500)
 
 
-class InventoryList(ProjectReadRequiredMixin, CommonContextMixin, ListView):
-    model = ProjectInventory
+class InventoryList(AsyncProjectReadRequiredMixin, AsyncConditionalGetMixin, CommonContextMixin, ContextMixin, View):
     template_name = "inventory/partials/inventory_cards.html"
-    context_object_name = "inventories"
-    pk_url_kwarg = "project_id"
 
-    def get_queryset(self):
-        # Retrieve the project_id from the URL keyword arguments
-        project_id = self.kwargs.get(self.pk_url_kwarg)
+    async def get_etag_version(self):
+        return await Project.objects.filter(pk=self.kwargs["project_id"]).values_list("version", flat=True).afirst()
+
+    async def get(self, request, project_id):
+        inventories = [inventory async for inventory in InventoryService.get_inventory(project_id)]
 
-        return InventoryService.get_inventory(project_id)
+        context = self.get_context_data(inventories=inventories)
+        return await arender(request, self.template_name, context)
 
 
-class InventoryDetail(ProjectReadRequiredMixin, CommonContextMixin, ContextMixin, View):
+class InventoryDetail(ProjectReadRequiredMixin, ConditionalGetMixin, CommonContextMixin, ContextMixin, View):
     """
     View to display project details, including steps and tasks.
     Supports HTMX requests to load tasks for a specific step.
@@ -216,6 +220,15 @@ class InventoryDetail(ProjectReadRequiredMixin, CommonContextMixin, ContextMixin
 
     template_name = "inventory/partials/inventory_right_side.html"
 
+    def get_etag_version(self):
+        if inventory_id := self.kwargs.get("inventory_id"):
+            return (
+                ProjectInventory.objects.filter(pk=inventory_id, project_id=self.kwargs["project_id"])
+                .values_list("version", flat=True)
+                .first()
+            )
+        return Project.objects.filter(pk=self.kwargs["project_id"]).values_list("version", flat=True).first()
+
     def get(self, request, *args, **kwargs):
         try:
             context = self.get_context_data()
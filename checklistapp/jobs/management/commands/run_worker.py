@@ -0,0 +1,59 @@
+import signal
+import time
+from datetime import timedelta
+
+from core.invalidation import InvalidationBus
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.services import JobService
+
+
+class Command(BaseCommand):
+    help = "Run the background jobs stored in the database. Several workers can run in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=120,
+            help="Seconds without heartbeat after which a running job is considered abandoned",
+        )
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        worker = JobService.worker_id()
+        stale_after = timedelta(seconds=options["stale_after"])
+        self.stdout.write(f"Worker {worker} started")
+
+        last_requeue = 0
+        while not self.stopping:
+            close_old_connections()
+            InvalidationBus.poll()
+
+            if time.monotonic() - last_requeue > 60:
+                if requeued := JobService.requeue_stale(stale_after):
+                    self.stdout.write(f"{requeued} abandoned job(s) requeued or failed")
+                last_requeue = time.monotonic()
+
+            job = JobService.claim(worker)
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+                continue
+
+            self.stdout.write(f"Running {job}")
+            job = JobService.run(job)
+            self.stdout.write(f"Finished {job}")
+
+        self.stdout.write(f"Worker {worker} stopped")
+
+    def stop(self, signum, frame):
+        """Finish the current job then exit"""
+        self.stopping = True
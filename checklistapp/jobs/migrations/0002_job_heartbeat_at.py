@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 11:57
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def running_jobs_heartbeat(apps, schema_editor):
+    # The running jobs are judged stale from their start, like before
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.filter(status="running").update(heartbeat_at=F("started_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, help_text="Last sign of life of the worker running the job", null=True),
+        ),
+        migrations.RunPython(running_jobs_heartbeat, migrations.RunPython.noop),
+    ]
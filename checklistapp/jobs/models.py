@@ -0,0 +1,74 @@
+from django.db import models
+from django.urls import reverse
+from django.utils import timezone
+
+"""
+Background jobs stored in the main database, no external broker.
+A job is enqueued by a view, claimed and executed by a `manage.py run_worker` process,
+and its status and progress are polled by the browser (see views.py).
+"""
+
+
+class Job(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    kind = models.CharField(max_length=100, help_text="Name of the registered handler")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    progress = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(null=True, blank=True)
+    message = models.TextField(blank=True, default="")
+    result = models.JSONField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    created_by = models.ForeignKey("accounts.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    project = models.ForeignKey("projects.Project", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True, default="", help_text="Worker running the job")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, help_text="Last sign of life of the worker running the job")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    # Set by JobService.run() in the workers: the progress is then written by the heartbeat thread
+    heartbeat = None
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # Only the queue is scanned by the workers
+            models.Index(fields=["run_after", "id"], name="jobs_pending_idx", condition=models.Q(status="pending")),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+    def get_absolute_url(self):
+        return reverse("jobs:job_detail", kwargs={"job_id": self.pk})
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ["done", "failed"]
+
+    @property
+    def percent(self) -> int | None:
+        if not self.total:
+            return None
+        return min(100, round(100 * self.progress / self.total))
+
+    def set_progress(self, progress: int, total: int | None = None, message: str | None = None):
+        """Called by the handlers to report their progress"""
+        self.progress = progress
+        self.total = total if total is not None else self.total
+        values = {"progress": self.progress, "total": self.total}
+        if message is not None:
+            self.message = values["message"] = message
+        if self.heartbeat is not None:
+            return  # Written with the next heartbeat, outside of the transaction of the handler
+        Job.objects.filter(pk=self.pk).update(**values)
@@ -0,0 +1,186 @@
+import logging
+import os
+import socket
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+
+from core.exceptions import InvalidParameterError, RecordNotFoundError
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# kind -> handler(job, **payload), filled by the @register decorators of the <app>/jobs.py modules
+JOB_HANDLERS: dict[str, Callable] = {}
+# kind -> title shown on the job page
+JOB_LABELS: dict[str, str] = {}
+# Kinds which must not run twice, e.g. creating a project: failed instead of requeued when their worker died
+NON_RETRYABLE_JOBS: set[str] = set()
+
+MAX_ATTEMPTS = 3
+HEARTBEAT_SECONDS = 10
+
+
+def register(kind: str, label: str = "", retry: bool = True):
+    """
+    Register a job handler. The handler receives the job and its payload as keyword arguments,
+    it can report its progress with job.set_progress() and return a JSON result, e.g. {"url": ...}.
+    A job whose worker died is run again, unless retry is False: the handler may have committed its work
+    before the worker stopped.
+    """
+
+    def decorator(handler):
+        JOB_HANDLERS[kind] = handler
+        JOB_LABELS[kind] = label or kind
+        if not retry:
+            NON_RETRYABLE_JOBS.add(kind)
+        return handler
+
+    return decorator
+
+
+class JobHeartbeat(threading.Thread):
+    """
+    Signs of life of a job run by a worker, written every HEARTBEAT_SECONDS on a connection of the thread:
+    heartbeat_at and the progress reported by the handler meanwhile. The handlers holding a long transaction
+    keep beating, and their progress is visible before the commit.
+    """
+
+    def __init__(self, job: Job):
+        super().__init__(name=f"job-heartbeat-{job.pk}", daemon=True)
+        self.job = job
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(HEARTBEAT_SECONDS):
+                self.beat()
+        finally:
+            connection.close()
+
+    def beat(self):
+        job = self.job
+        try:
+            Job.objects.filter(pk=job.pk, status="running").update(
+                heartbeat_at=timezone.now(), progress=job.progress, total=job.total, message=job.message
+            )
+        except Exception as e:
+            logger.error(f"Heartbeat of job {job} failed: {e}")
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class JobService:
+    @staticmethod
+    def enqueue(kind: str, payload: dict | None = None, user=None, project=None) -> Job:
+        """
+        Store a job to be executed by a worker.
+        With settings.JOBS_EAGER (tests, no worker), the job is executed immediately.
+        """
+        if kind not in JOB_HANDLERS:
+            raise InvalidParameterError(f"Unknown job '{kind}'.")
+
+        job = Job.objects.create(kind=kind, payload=payload or {}, created_by=user, project=project)
+
+        if settings.JOBS_EAGER:
+            job = JobService.claim(job_id=job.pk)
+            JobService.run(job)
+        return job
+
+    @staticmethod
+    def get_job_for_user(user, job_id) -> Job:
+        job = Job.objects.filter(pk=job_id, created_by=user).first()
+        if job is None:
+            raise RecordNotFoundError("Job not found.")
+        return job
+
+    @staticmethod
+    def worker_id() -> str:
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @staticmethod
+    @transaction.atomic
+    def claim(worker: str | None = None, job_id: int | None = None) -> Job | None:
+        """
+        Take the oldest pending job (or the given one) and mark it as running.
+        PostgreSQL skips the rows locked by other workers (FOR UPDATE SKIP LOCKED). Without row locks (SQLite),
+        the conditional UPDATE guarantees that a single worker wins, the loser returns None and tries again.
+        """
+        qs = Job.objects.filter(status="pending", run_after__lte=timezone.now()).order_by("run_after", "id")
+        if job_id is not None:
+            qs = Job.objects.filter(pk=job_id, status="pending")
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+
+        job = qs.first()
+        if job is None:
+            return None
+
+        now = timezone.now()
+        claimed = Job.objects.filter(pk=job.pk, status="pending").update(
+            status="running",
+            locked_by=worker or JobService.worker_id(),
+            started_at=now,
+            heartbeat_at=now,
+            attempts=F("attempts") + 1,
+        )
+        if not claimed:
+            return None
+
+        job.refresh_from_db()
+        return job
+
+    @staticmethod
+    def run(job: Job) -> Job:
+        """Execute a claimed job and store its outcome, the exceptions never reach the worker loop"""
+        handler = JOB_HANDLERS[job.kind]
+        try:
+            if connection.in_atomic_block:
+                # Eager job inside a request: a failure must not break the transaction of the request
+                with transaction.atomic():
+                    result = handler(job, **job.payload)
+            else:
+                # Worker: autocommit, the heartbeat shows the job is alive and writes its progress for the polling page
+                job.heartbeat = JobHeartbeat(job)
+                job.heartbeat.start()
+                result = handler(job, **job.payload)
+            job.status, job.result = "done", result
+            if job.total:
+                job.progress = job.total
+        except Exception as e:
+            logger.exception(f"Job {job} failed")
+            job.status = "failed"
+            job.message = str(e) if hasattr(e, "custom") else "Something went wrong when running the job."
+        finally:
+            if job.heartbeat is not None:
+                job.heartbeat.stop()
+                job.heartbeat = None
+
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "result", "progress", "total", "message", "finished_at"])
+        return job
+
+    @staticmethod
+    def requeue_stale(timeout: timedelta) -> int:
+        """
+        Running jobs without heartbeat for the timeout belong to a dead worker: put them back in the queue,
+        or fail them after MAX_ATTEMPTS or when they must not run twice.
+        """
+        stale = Job.objects.filter(status="running", heartbeat_at__lt=timezone.now() - timeout)
+        interrupted = stale.filter(kind__in=NON_RETRYABLE_JOBS).update(
+            status="failed",
+            message="The job was interrupted, check whether its work was done before running it again.",
+            finished_at=timezone.now(),
+        )
+        failed = stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+            status="failed", message="The job was interrupted too many times.", finished_at=timezone.now()
+        )
+        requeued = stale.update(status="pending", locked_by="")
+        return interrupted + failed + requeued
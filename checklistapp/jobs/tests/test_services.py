@@ -0,0 +1,199 @@
+import time
+from datetime import timedelta
+
+import pytest
+from core.exceptions import InvalidParameterError, RecordNotFoundError
+from django.core.management import call_command
+from django.utils import timezone
+from projects.models import Project
+
+from jobs.models import Job
+from jobs.services import JOB_HANDLERS, JobService, register
+
+
+@pytest.fixture
+def queue(settings):
+    settings.JOBS_EAGER = False
+
+
+@pytest.fixture
+def failing_handler():
+    @register("tests.fail")
+    def fail(job, **payload):
+        raise ValueError("boom")
+
+    yield fail
+    del JOB_HANDLERS["tests.fail"]
+
+
+@pytest.mark.django_db
+def test_enqueue_unknown_kind():
+    """Only the registered handlers can be enqueued"""
+    with pytest.raises(InvalidParameterError):
+        JobService.enqueue("unknown")
+
+
+@pytest.mark.django_db
+def test_enqueue_eager_runs_the_job(admin_user, project, admin_permission):
+    """In eager mode (tests) the job is run immediately"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"}, user=admin_user)
+
+    clone = Project.objects.get(name="Copy")
+    assert job.status == "done"
+    assert job.attempts == 1
+    assert job.result["url"] == f"/projects/{clone.pk}/edit/"
+
+
+@pytest.mark.django_db
+def test_enqueue_queue_mode(queue, admin_user, project):
+    """Without eager mode the job waits for a worker"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"}, user=admin_user)
+
+    assert job.status == "pending"
+    assert not Project.objects.filter(name="Copy").exists()
+
+
+@pytest.mark.django_db
+def test_claim_takes_oldest_due_job(queue, project):
+    """Jobs are claimed in order, the future ones are left in the queue"""
+    later = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "A"})
+    Job.objects.filter(pk=later.pk).update(run_after=timezone.now() + timedelta(hours=1))
+    first = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "B"})
+
+    job = JobService.claim("worker-1")
+
+    assert job.pk == first.pk
+    assert job.status == "running"
+    assert job.locked_by == "worker-1"
+    assert JobService.claim("worker-2") is None
+
+
+@pytest.mark.django_db
+def test_run_failure_is_stored(queue, failing_handler):
+    """An exception in the handler fails the job without reaching the worker"""
+    JobService.enqueue("tests.fail")
+
+    job = JobService.run(JobService.claim())
+
+    assert job.status == "failed"
+    assert job.message == "Something went wrong when running the job."
+    assert job.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_run_failure_custom_message(queue, project):
+    """Custom exceptions are shown to the user"""
+    JobService.enqueue("projects.clone", {"project_id": project.pk + 1000, "name": "Copy"})
+
+    job = JobService.run(JobService.claim())
+
+    assert job.status == "failed"
+    assert "not found" in job.message.lower()
+
+
+@pytest.mark.django_db
+def test_requeue_stale(queue, project):
+    """Running jobs of a dead worker are requeued, then failed after too many attempts"""
+    job = JobService.enqueue("projects.delete", {"project_id": project.pk})
+    JobService.claim("dead-worker")
+    Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(minutes=5))
+
+    assert JobService.requeue_stale(timedelta(minutes=2)) == 1
+    job.refresh_from_db()
+    assert job.status == "pending"
+
+    Job.objects.filter(pk=job.pk).update(status="running", attempts=3, heartbeat_at=timezone.now() - timedelta(minutes=5))
+    JobService.requeue_stale(timedelta(minutes=2))
+    job.refresh_from_db()
+    assert job.status == "failed"
+
+
+@pytest.mark.django_db
+def test_requeue_stale_follows_the_heartbeat(queue, project):
+    """A long job is not stale while its worker beats, a project creation is never run twice"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"})
+    JobService.claim("worker-1")
+    Job.objects.filter(pk=job.pk).update(started_at=timezone.now() - timedelta(hours=2))
+
+    assert JobService.requeue_stale(timedelta(minutes=2)) == 0
+
+    Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(minutes=5))
+    assert JobService.requeue_stale(timedelta(minutes=2)) == 1
+    job.refresh_from_db()
+    assert job.status == "failed"
+    assert "interrupted" in job.message
+
+
+@pytest.mark.django_db(transaction=True)  # The heartbeat writes on a connection of its own
+def test_heartbeat_writes_the_progress(queue, project, mocker):
+    """The worker heartbeat writes heartbeat_at and the progress reported by the handler"""
+    mocker.patch("jobs.services.HEARTBEAT_SECONDS", 0.01)
+    beats = []
+
+    @register("tests.slow")
+    def slow(job, **payload):
+        job.set_progress(3, 10, "Working")
+        while len(beats) < 2:
+            beats.append(Job.objects.values_list("heartbeat_at", "progress", "message").get(pk=job.pk))
+            time.sleep(0.05)
+
+    try:
+        JobService.enqueue("tests.slow")
+        job = JobService.run(JobService.claim("worker-1"))
+    finally:
+        del JOB_HANDLERS["tests.slow"]
+
+    assert job.status == "done"
+    assert beats[-1][1:] == (3, "Working")
+    assert beats[-1][0] > job.started_at
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_done_before_the_first_heartbeat_keeps_its_progress(queue, project):
+    """The progress left to the heartbeat is written when the job ends"""
+
+    @register("tests.quick")
+    def quick(job, **payload):
+        job.set_progress(4, 4, "Copied")
+
+    try:
+        JobService.enqueue("tests.quick")
+        job = JobService.run(JobService.claim("worker-1"))
+    finally:
+        del JOB_HANDLERS["tests.quick"]
+
+    job.refresh_from_db()
+    assert (job.status, job.progress, job.total) == ("done", 4, 4)
+
+
+@pytest.mark.django_db
+def test_get_job_for_user(queue, user, admin_user, project):
+    """A job is only visible to its creator"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"}, user=admin_user)
+
+    assert JobService.get_job_for_user(admin_user, job.pk) == job
+    with pytest.raises(RecordNotFoundError):
+        JobService.get_job_for_user(user, job.pk)
+
+
+@pytest.mark.django_db
+def test_set_progress(queue, project):
+    """Progress is written without saving the other fields"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"})
+
+    job.set_progress(5, 20, "Copying tasks")
+    job.refresh_from_db()
+
+    assert (job.progress, job.total, job.message, job.percent) == (5, 20, "Copying tasks", 25)
+
+
+@pytest.mark.django_db(transaction=True)  # The worker closes the connections left in a transaction
+def test_run_worker_once(queue, admin_user, project, admin_permission):
+    """The worker command executes the pending jobs"""
+    job = JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"}, user=admin_user)
+
+    call_command("run_worker", "--once")
+
+    job.refresh_from_db()
+    assert job.status == "done"
+    assert Project.objects.filter(name="Copy").exists()
@@ -0,0 +1,54 @@
+import pytest
+from django.urls import reverse
+
+from jobs.services import JobService
+
+
+@pytest.fixture
+def job(settings, admin_user, project):
+    settings.JOBS_EAGER = False
+    return JobService.enqueue("projects.clone", {"project_id": project.pk, "name": "Copy"}, user=admin_user)
+
+
+@pytest.mark.django_db
+def test_job_detail(client, admin_user, job):
+    client.login(username=admin_user.username, password="password")
+
+    response = client.get(reverse("jobs:job_detail", kwargs={"job_id": job.pk}))
+
+    assert response.status_code == 200
+    assert "Cloning the project" in response.content.decode()
+    assert 'hx-trigger="every 1s"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_job_detail_other_user(client, user, job):
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("jobs:job_detail", kwargs={"job_id": job.pk}))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_job_status_redirects_when_done(client, admin_user, admin_permission, job):
+    client.login(username=admin_user.username, password="password")
+    JobService.run(JobService.claim(job_id=job.pk))
+
+    response = client.get(reverse("jobs:job_status", kwargs={"job_id": job.pk}), headers={"HX-Request": "true"})
+
+    job.refresh_from_db()
+    assert response.headers["HX-Redirect"] == job.result["url"]
+
+
+@pytest.mark.django_db
+def test_job_status_failed(client, admin_user, job):
+    client.login(username=admin_user.username, password="password")
+    job.status, job.message = "failed", "Project not found."
+    job.save()
+
+    response = client.get(reverse("jobs:job_status", kwargs={"job_id": job.pk}), headers={"HX-Request": "true"})
+
+    assert response.status_code == 200
+    assert "Project not found." in response.content.decode()
+    assert "hx-trigger" not in response.content.decode()
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = "jobs"
+
+urlpatterns = [
+    path("<int:job_id>/", views.JobDetailView.as_view(), name="job_detail"),
+    path("<int:job_id>/status/", views.JobStatusView.as_view(), name="job_status"),
+]
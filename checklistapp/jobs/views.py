@@ -0,0 +1,63 @@
+import logging
+
+from core.exceptions import RecordNotFoundError
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.shortcuts import redirect
+from django.views.generic import DetailView
+from django_htmx.http import HttpResponseClientRedirect
+
+from .models import Job
+from .services import JOB_LABELS, JobService
+
+logger = logging.getLogger(__name__)
+
+
+def redirect_to_job(request, job: Job):
+    """
+    Redirect to the result of a finished job (eager mode), otherwise to the page following its progress.
+    """
+    if job.status == "done" and job.result and job.result.get("url"):
+        if job.result.get("message"):
+            messages.success(request, job.result["message"])
+        return redirect(job.result["url"])
+    return redirect(job)
+
+
+class JobDetailView(LoginRequiredMixin, DetailView):
+    """
+    Page following a background job, polled with HTMX until the job is finished.
+    Only the user who started the job can see it.
+    """
+
+    model = Job
+    template_name = "jobs/job_detail.html"
+    context_object_name = "job"
+
+    def get_object(self, queryset=None):
+        try:
+            return JobService.get_job_for_user(self.request.user, self.kwargs["job_id"])
+        except RecordNotFoundError as e:
+            raise Http404(str(e))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["label"] = JOB_LABELS.get(self.object.kind, self.object.kind)
+        return context
+
+
+class JobStatusView(JobDetailView):
+    """
+    HTMX fragment with the status of the job, the client is redirected to the result once done.
+    """
+
+    template_name = "jobs/job_detail.html#job_status"
+
+    def get(self, request, *args, **kwargs):
+        job = self.get_object()
+        if job.status == "done" and job.result and job.result.get("url"):
+            if job.result.get("message"):
+                messages.success(request, job.result["message"])
+            return HttpResponseClientRedirect(job.result["url"])
+        return super().get(request, *args, **kwargs)
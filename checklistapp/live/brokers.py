@@ -0,0 +1,99 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+
+logger = logging.getLogger(__name__)
+
+"""
+Fan-out of the live events to the SSE streams opened on the projects (see live.views.ProjectEventsView).
+
+LocalBroker delivers the events to the streams of the current process only, which is enough for a single
+server process (development, SQLite). PostgresBroker sends them with NOTIFY: every process LISTENs on a
+dedicated connection and delivers them to its own streams, so the streams of all the workers receive them.
+"""
+
+LIVE_CHANNEL = "checklist_live"
+LIVE_QUEUE_SIZE = 100  # Events kept for a stream that does not read, the next ones are dropped
+LIVE_LISTEN_TIMEOUT = 5
+
+
+class LocalBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams: dict[int, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def subscribe(self, project_id: int) -> asyncio.Queue:
+        """Queue receiving the lists of event names of the project, must be called from the loop of the stream"""
+        queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+        with self._lock:
+            self._streams.setdefault(project_id, []).append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, project_id: int, queue: asyncio.Queue):
+        with self._lock:
+            streams = [stream for stream in self._streams.get(project_id, []) if stream[1] is not queue]
+            if streams:
+                self._streams[project_id] = streams
+            else:
+                self._streams.pop(project_id, None)
+
+    def send(self, project_id: int, names: list[str]):
+        self.deliver(project_id, names)
+
+    def deliver(self, project_id: int, names: list[str]):
+        """Hand the event names to the streams of this process, from any thread"""
+        with self._lock:
+            streams = list(self._streams.get(project_id, []))
+        for loop, queue in streams:
+            try:
+                loop.call_soon_threadsafe(_put, queue, names)
+            except RuntimeError:  # The loop of the stream is closed, it unsubscribes on its way out
+                pass
+
+
+class PostgresBroker(LocalBroker):
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+
+    def send(self, project_id: int, names: list[str]):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [LIVE_CHANNEL, json.dumps([project_id, names])])
+
+    def subscribe(self, project_id: int) -> asyncio.Queue:
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="live-listener", daemon=True)
+                self._listener.start()
+        return super().subscribe(project_id)
+
+    def _listen(self):
+        """LISTEN on a connection of its own for the lifetime of the process, reconnecting on failure"""
+        while True:
+            listener = connections.create_connection(DEFAULT_DB_ALIAS)
+            try:
+                listener.ensure_connection()
+                raw = listener.connection  # psycopg2 connection, in autocommit like every Django connection
+                with raw.cursor() as cursor:
+                    cursor.execute(f"LISTEN {LIVE_CHANNEL}")
+                while True:
+                    if select.select([raw], [], [], LIVE_LISTEN_TIMEOUT)[0]:
+                        raw.poll()
+                        while raw.notifies:
+                            self.deliver(*json.loads(raw.notifies.pop(0).payload))
+            except Exception as e:
+                logger.error(e)
+                listener.close()
+                time.sleep(1)
+
+
+def _put(queue: asyncio.Queue, names: list[str]):
+    try:
+        queue.put_nowait(names)
+    except asyncio.QueueFull:
+        pass
@@ -0,0 +1,37 @@
+import functools
+import logging
+
+from django.db import connection, transaction
+
+from .brokers import LocalBroker, PostgresBroker
+
+logger = logging.getLogger(__name__)
+
+
+class LiveService:
+    """
+    Live events of the projects, pushed to the pages by server-sent events.
+
+    An event is a short name telling the open pages what to fetch again:
+    - "task-<id>": the row of the task (status, comment counter)
+    - "step-<id>": the card and the progress bar of the step
+    - "tasks-<step id>": the list of tasks of the step (task added or deleted)
+    - "steps": the list of steps of the project (step added, deleted, renamed or reordered)
+    """
+
+    @staticmethod
+    @functools.cache
+    def get_broker() -> LocalBroker:
+        return PostgresBroker() if connection.vendor == "postgresql" else LocalBroker()
+
+    @staticmethod
+    def publish(project_id: int, *names: str):
+        """Send the events once the transaction commits, so that the pages fetch the new content"""
+        transaction.on_commit(functools.partial(LiveService._send, project_id, list(names)))
+
+    @staticmethod
+    def _send(project_id: int, names: list[str]):
+        try:
+            LiveService.get_broker().send(project_id, names)
+        except Exception as e:
+            logger.error(e)  # A lost live update must not fail the write
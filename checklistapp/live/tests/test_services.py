@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from checklist.models import ProjectStep, ProjectTask
+from checklist.services import TaskService
+
+from live.brokers import LocalBroker
+from live.services import LiveService
+
+
+@pytest.fixture
+def sent(mocker):
+    return mocker.patch.object(LiveService.get_broker(), "send")
+
+
+def test_local_broker_delivers_to_the_streams_of_the_project():
+    """Only the streams of the project receive its events, until they unsubscribe"""
+
+    async def scenario():
+        broker = LocalBroker()
+        queue, other = broker.subscribe(1), broker.subscribe(2)
+        broker.deliver(1, ["steps"])
+        received = await asyncio.wait_for(queue.get(), 1)
+        broker.unsubscribe(1, queue)
+        broker.deliver(1, ["steps"])
+        await asyncio.sleep(0)
+        return received, queue.empty(), other.empty()
+
+    assert asyncio.run(scenario()) == (["steps"], True, True)
+
+
+@pytest.mark.django_db
+def test_publish_waits_for_the_commit(project, sent, django_capture_on_commit_callbacks):
+    """The pages are notified once the new content can be read"""
+    with django_capture_on_commit_callbacks() as callbacks:
+        LiveService.publish(project.id, "steps")
+        sent.assert_not_called()
+
+    callbacks[0]()
+
+    sent.assert_called_once_with(project.id, ["steps"])
+
+
+@pytest.mark.django_db
+def test_task_status_change_publishes_row_and_step(user, project, sent, django_capture_on_commit_callbacks):
+    """A Done/N/A click refreshes the task row and the card of its step"""
+    step = ProjectStep.objects.create(project=project, title="Step", icon="📋", order=1)
+    task = ProjectTask.objects.create(project_step=step, title="Task", order=1)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TaskService.update_task_status(project.id, step.id, task.id, "done", user)
+
+    sent.assert_any_call(project.id, [f"task-{task.id}", f"step-{step.id}"])
+
+
+@pytest.mark.django_db
+def test_task_creation_publishes_the_task_list(project, sent, django_capture_on_commit_callbacks):
+    """A new task refreshes the list of tasks of its step"""
+    step = ProjectStep.objects.create(project=project, title="Step", icon="📋", order=1)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TaskService.add_task_to_step(project.id, step.id, "New task")
+
+    sent.assert_any_call(project.id, [f"tasks-{step.id}", f"step-{step.id}"])
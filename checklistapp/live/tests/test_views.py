@@ -0,0 +1,48 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+
+from live.services import LiveService
+
+
+@pytest.mark.django_db
+def test_project_events_requires_permission(client, user, project):
+    """Users without access to the project cannot listen to it"""
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("projects:live:project_events", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_project_events_requires_login(client, project):
+    response = client.get(reverse("projects:live:project_events", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_project_events_streams_the_events(user, project, permission):
+    """The stream sends the reconnection delay, then one line per write with the merged event names"""
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        response = await client.get(reverse("projects:live:project_events", kwargs={"project_id": project.id}))
+        stream = aiter(response.streaming_content)
+        first = await anext(stream)
+
+        broker = LiveService.get_broker()
+        broker.deliver(project.id, ["task-1", "step-1"])
+        broker.deliver(project.id, ["step-1", "steps"])
+        second = await anext(stream)
+        await stream.aclose()
+        return response, first, second
+
+    response, first, second = async_to_sync(scenario)()
+
+    assert response.headers["Content-Type"] == "text/event-stream"
+    assert first == b"retry: 3000\n\n"
+    assert second == b"data: task-1 step-1 steps\n\n"
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+app_name = "live"
+
+urlpatterns = [
+    path("", views.ProjectEventsView.as_view(), name="project_events"),
+]
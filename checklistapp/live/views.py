@@ -0,0 +1,58 @@
+import asyncio
+
+from accounts.services import AccountService
+from asgiref.sync import sync_to_async
+from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
+from django.views import View
+
+from .services import LiveService
+
+LIVE_RETRY_MS = 3000  # Delay before the browser reconnects
+LIVE_KEEPALIVE = 15  # Comment line sent on idle streams so that proxies keep them open
+LIVE_STREAM_MAX_AGE = 600  # The browser reconnects after that, and the permission is checked again
+
+
+class ProjectEventsView(View):
+    """
+    Server-sent events of a project: a "data:" line with the names of the events (see LiveService) per write.
+
+    The stream is held open for minutes, it must be served by ASGI: a WSGI worker would be busy for its whole
+    duration (and Django buffers asynchronous streams under WSGI).
+    """
+
+    async def get(self, request, project_id):
+        user = await request.auser()
+        if not user.is_authenticated:
+            raise PermissionDenied("Access denied.")
+
+        permission = await sync_to_async(AccountService.get_permission_for_user_project)(user, project_id)
+        if not permission or not (permission.can_view or permission.can_edit or permission.is_admin):
+            raise PermissionDenied("Access denied.")
+
+        response = StreamingHttpResponse(self._stream(project_id), content_type="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"  # nginx must not buffer the events
+        return response
+
+    @staticmethod
+    async def _stream(project_id):
+        broker = LiveService.get_broker()
+        queue = broker.subscribe(project_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LIVE_STREAM_MAX_AGE
+        try:
+            yield f"retry: {LIVE_RETRY_MS}\n\n"
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    names = await asyncio.wait_for(queue.get(), min(LIVE_KEEPALIVE, remaining))
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                # Merge the events already waiting, a page fetches each element once
+                while not queue.empty():
+                    names = names + queue.get_nowait()
+                yield f"data: {' '.join(dict.fromkeys(names))}\n\n"
+        finally:
+            broker.unsubscribe(project_id, queue)
@@ -2,6 +2,7 @@
 
 from django import forms
 from django.core.exceptions import ValidationError
+from templates_management.models import ProjectBlueprint
 
 from .models import Project
 
@@ -61,3 +62,91 @@ class ProjectCreationForm(forms.ModelForm):
             if duplicated_name.exists():
                 raise ValidationError("Project name already used")
         return name
+
+
+class ProjectBlueprintCreationForm(ProjectCreationForm):
+    """
+    ProjectCreationForm with an optional blueprint whose steps and inventories are added at creation.
+    """
+
+    blueprint = forms.ModelChoiceField(
+        queryset=ProjectBlueprint.objects.filter(is_active=True).order_by("default_order"),
+        required=False,
+        empty_label="Empty project",
+        label="Blueprint",
+        help_text="Optional: Start with the steps and inventories of a blueprint",
+    )
+
+    def clean_blueprint(self):
+        """The templates of a blueprint may have been deactivated since it was defined"""
+        blueprint = self.cleaned_data["blueprint"]
+        if blueprint is None:
+            return blueprint
+
+        inactive = [
+            *blueprint.steps.filter(step_template__is_active=False).values_list("step_template__title", flat=True),
+            *blueprint.inventories.filter(inventory_template__is_active=False).values_list(
+                "inventory_template__title", flat=True
+            ),
+        ]
+        if inactive:
+            raise ValidationError(f"This blueprint uses inactive templates: {', '.join(sorted(set(inactive)))}")
+        return blueprint
+
+
+class ProjectImportForm(forms.Form):
+    """
+    Form used to import a project with its steps, tasks and inventories from a file.
+    The content itself is validated by ImportService.
+    """
+
+    file = forms.FileField(
+        label="File",
+        help_text="YAML file describing the whole project, or CSV file with one row per task",
+        widget=forms.ClearableFileInput(attrs={"accept": ".yaml,.yml,.csv"}),
+    )
+    name = forms.CharField(
+        label="Project Name",
+        max_length=200,
+        required=False,
+        help_text="Required for CSV files, overrides the name of a YAML file",
+    )
+
+    def clean_file(self):
+        """Deduce the format from the file extension"""
+        file = self.cleaned_data["file"]
+        extension = file.name.rsplit(".", 1)[-1].lower()
+        if extension not in ["yaml", "yml", "csv"]:
+            raise ValidationError("Only .yaml, .yml and .csv files are supported")
+        if file.size > 5 * 1024 * 1024:
+            raise ValidationError("The file must be smaller than 5 MB")
+        return file
+
+    def get_format(self) -> str:
+        return "csv" if self.cleaned_data["file"].name.lower().endswith(".csv") else "yaml"
+
+
+class ProjectCloneForm(forms.Form):
+    """
+    Form used to copy a project with its steps and tasks under a new name.
+    """
+
+    name = forms.CharField(label="Project Name", max_length=200, help_text="Name of the new project")
+    reset_status = forms.BooleanField(
+        label="Reset tasks", required=False, initial=True, help_text="All tasks of the new project are pending"
+    )
+    include_inventory = forms.BooleanField(
+        label="Copy inventories", required=False, initial=True, help_text="Copy the inventories with their values"
+    )
+    include_comments = forms.BooleanField(
+        label="Copy comments", required=False, initial=False, help_text="Copy the comments of the tasks"
+    )
+
+    def clean_name(self):
+        """Validate project name, same rules as the creation"""
+        name = self.cleaned_data.get("name").strip()
+        if len(name) < 3:
+            raise ValidationError("Project name must be at least 3 characters")
+        if Project.objects.filter(name__iexact=name).exists():
+            raise ValidationError("Project name already used")
+        return name
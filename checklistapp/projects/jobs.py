@@ -0,0 +1,47 @@
+from core.deletion import fast_delete
+from core.exceptions import RecordNotFoundError
+from django.urls import reverse
+from jobs.services import register
+
+from projects.services import ImportService, ProjectService
+
+from .models import Project
+
+
+@register("projects.clone", "Cloning the project", retry=False)
+def clone_project(job, project_id, name, reset_status=True, include_inventory=True, include_comments=False):
+    project = ProjectService.get(project_id)
+    if project is None:
+        raise RecordNotFoundError("Project not found.")
+    clone = ProjectService.clone(
+        project,
+        name,
+        reset_status=reset_status,
+        include_inventory=include_inventory,
+        include_comments=include_comments,
+        user=job.created_by,
+    )
+    return {
+        "url": reverse("projects:project_edit", kwargs={"project_id": clone.pk}),
+        "message": f'Project "{clone.name}" created from "{project.name}"!',
+    }
+
+
+@register("projects.import", "Importing the project", retry=False)
+def import_project(job, content, file_format, name=""):
+    # The file is parsed again here: the parsed YAML may hold dates which are not JSON serializable
+    data = ImportService.load(content, file_format)
+    if name:
+        data["name"] = name
+    project: Project = ImportService.import_project(data, job.created_by, progress=job.set_progress)
+    return {
+        "url": reverse("projects:project_edit", kwargs={"project_id": project.pk}),
+        "message": f'Project "{project.name}" imported successfully!',
+    }
+
+
+@register("projects.delete", "Deleting the project")
+def delete_project(job, project_id):
+    # The project is already hidden (no permission left), a missing project was deleted by a previous attempt
+    _, deleted = fast_delete(Project.objects.filter(pk=project_id))
+    return {"url": reverse("projects:project_list"), "message": "Project deleted successfully.", "deleted": deleted}
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+from projects.services import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, ExportService
+
+
+class Command(BaseCommand):
+    help = "Export the checklist (steps, tasks, comments) and non-secret inventory of projects as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--output", "-o", help="Output file, defaults to stdout")
+        parser.add_argument("--project", type=int, action="append", dest="project_ids", help="Project id, repeatable")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        projects = Project.objects.order_by("id")
+        if options["project_ids"]:
+            projects = projects.filter(id__in=options["project_ids"])
+
+        # The content of the projects in cold storage is not in the live tables, they are restored to be exported
+        frozen = list(projects.filter(archive__isnull=False).values_list("id", flat=True))
+        if frozen and options["project_ids"]:
+            raise CommandError(f"Projects in cold storage, restore them before exporting them: {', '.join(map(str, frozen))}")
+        if frozen:
+            self.stderr.write(f"Skipped {len(frozen)} project(s) in cold storage: {', '.join(map(str, frozen))}")
+            projects = projects.filter(archive__isnull=True)
+
+        lines = ExportService.export(projects.iterator(), options["format"], options["chunk_size"])
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                for line in lines:
+                    output.write(line)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from core.exceptions import CustomExceptionError
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from projects.models import Project
+from projects.services import ArchiveService
+
+
+class Command(BaseCommand):
+    help = "Move the projects archived for a while to cold storage, or restore one of them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Only projects not updated for this number of days")
+        parser.add_argument("--dry-run", action="store_true", help="List the projects without moving them")
+        parser.add_argument("--restore", type=int, metavar="PROJECT_ID", help="Restore this project instead")
+
+    def handle(self, *args, **options):
+        if options["restore"]:
+            project = Project.objects.filter(pk=options["restore"]).first()
+            if project is None:
+                raise CommandError(f"Project {options['restore']} not found.")
+            try:
+                counts = ArchiveService.restore(project)
+            except CustomExceptionError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f'Project "{project.name}" restored: {counts}'))
+            return
+
+        projects = ArchiveService.get_projects_to_freeze(timedelta(days=options["days"]))
+        for project in list(projects):
+            if options["dry_run"]:
+                self.stdout.write(f'Would move "{project.name}" (#{project.pk})')
+                continue
+            archive = ArchiveService.freeze(project)
+            self.stdout.write(
+                f'Moved "{project.name}" (#{project.pk}): {archive.counts}, '
+                f"{filesizeformat(archive.size)} stored in {filesizeformat(len(archive.data))}"
+            )
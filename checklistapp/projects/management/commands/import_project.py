@@ -0,0 +1,37 @@
+from accounts.models import User
+from core.exceptions import CustomExceptionError
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.services import IMPORT_FORMATS, ImportService
+
+
+class Command(BaseCommand):
+    help = "Create a project with its steps, tasks and inventories from a YAML or CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="YAML or CSV file to import")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the file extension")
+        parser.add_argument("--name", help="Project name, required for CSV files")
+        parser.add_argument("--user", required=True, help="Username of the project admin")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["user"]).first()
+        if user is None:
+            raise CommandError(f"User '{options['user']}' not found.")
+
+        file_format = options["format"] or ("csv" if options["file"].lower().endswith(".csv") else "yaml")
+        with open(options["file"], "rb") as file:
+            content = file.read()
+
+        def progress(done, total):
+            self.stdout.write(f"{done}/{total} rows inserted")
+
+        try:
+            data = ImportService.load(content, file_format)
+            if options["name"]:
+                data["name"] = options["name"]
+            project = ImportService.import_project(data, user, progress=progress)
+        except CustomExceptionError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f'Project "{project.name}" imported with id {project.pk}.'))
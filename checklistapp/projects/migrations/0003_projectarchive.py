@@ -0,0 +1,42 @@
+# Generated by Django 6.0 on 2026-10-19 09:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0002_project_expected_completion_date"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectArchive",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("version", models.PositiveSmallIntegerField()),
+                ("data", models.BinaryField(help_text="gzip compressed JSON snapshot")),
+                ("size", models.PositiveIntegerField(help_text="Size of the uncompressed snapshot in bytes")),
+                ("counts", models.JSONField(default=dict, help_text="Number of rows stored per table")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="archive", to="projects.project"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 6.0 on 2026-10-19 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0004_project_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["status", "expected_completion_date"], name="projects_status_due_idx"),
+        ),
+    ]
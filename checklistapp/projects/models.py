@@ -1,4 +1,5 @@
 from checklist.models import ProjectTask
+from core.utils import new_version
 from django.db import models
 
 
@@ -15,9 +16,14 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     expected_completion_date = models.DateField(null=True, blank=True)
+    version = models.BigIntegerField(default=new_version, editable=False, help_text="Changed on every write, used as ETag")
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Project list filtered on the status and sorted by due date, active projects of the template propagation
+            models.Index(fields=["status", "expected_completion_date"], name="projects_status_due_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -53,3 +59,25 @@ class Project(models.Model):
         completed_tasks, total_tasks = self._get_count_tasks()
         self.status = "completed" if completed_tasks == total_tasks else "active"
         self.save()
+
+
+class ProjectArchive(models.Model):
+    """
+    Cold storage of an archived project: its steps, tasks, comments and inventories are serialized
+    into a single compressed JSON document and their rows are removed from the live tables.
+    See ArchiveService for the format.
+    """
+
+    project = models.OneToOneField(Project, on_delete=models.CASCADE, related_name="archive")
+    version = models.PositiveSmallIntegerField()
+    data = models.BinaryField(help_text="gzip compressed JSON snapshot")
+    size = models.PositiveIntegerField(help_text="Size of the uncompressed snapshot in bytes")
+    counts = models.JSONField(default=dict, help_text="Number of rows stored per table")
+    created_by = models.ForeignKey("accounts.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Archive of {self.project}"
+
+    def __repr__(self):
+        return f"ProjectArchive(id={self.id}, project_id={self.project_id})"
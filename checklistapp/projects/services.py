@@ -1,12 +1,69 @@
+import csv
+import gzip
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+
+import yaml
+from accounts.models import UserProjectPermissions
 from accounts.services import AccountService
-from core.exceptions import RecordNotFoundError
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from checklist.services import ChecklistService, ReadModelService
+from core.cache import CacheNamespace
+from core.deletion import fast_delete
+from core.exceptions import InvalidParameterError, RecordNotFoundError
+from core.routers import read_intent, write_intent
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.db.backends.base.operations import BaseDatabaseOperations
 from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from inventory.models import InventoryField, ProjectInventory
+from inventory.services import InventoryService
+from jobs.models import Job
+from jobs.services import JobService
+from live.services import LiveService
+from search.services import SearchService
+from templates_management.models import ProjectBlueprint, TemplateField
+
+from .forms import ProjectCreationForm
+from .models import Project, ProjectArchive
+from .versions import bump_versions
+
+EXPORT_FORMATS = ["csv", "ndjson"]
+EXPORT_CHUNK_SIZE = 2000
+
+CLONE_BATCH_SIZE = 1000
+
+ARCHIVE_VERSION = 1
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVE_CACHE_MAX_SIZE = 512 * 1024  # Decoded snapshots up to this size are cached for the next views
+ARCHIVE_CACHE = CacheNamespace("archives", version=ARCHIVE_VERSION, timeout=3600)
+# Tables stored in the snapshot of a project in cold storage, parents first
+ARCHIVE_TABLES = {
+    "steps": ProjectStep,
+    "tasks": ProjectTask,
+    "comments": TaskComment,
+    "inventories": ProjectInventory,
+    "fields": InventoryField,
+}
 
-from .models import Project
+DELETE_IN_BACKGROUND_FROM = 5000  # Number of tasks from which a project is deleted by a job
+
+IMPORT_FORMATS = ["csv", "yaml"]
+IMPORT_BATCH_SIZE = 1000
+IMPORT_CSV_COLUMNS = ["step", "template", "task", "info_text", "help_url", "work_url"]
+IMPORT_FIELD_TYPES = ["text", "url", "number", "datetime"]  # Files and passwords cannot be imported
+# Range of InventoryField.number_value on every database, SQLite would store what PostgreSQL rejects
+NUMBER_VALUE_RANGE = BaseDatabaseOperations.integer_field_ranges["IntegerField"]
 
 
 class ProjectService:
     @staticmethod
+    @read_intent
     def get(project_id, prefetch_related: list[str] | None = None):
         """Récupère un template d'inventaire actif."""
         try:
@@ -20,6 +77,7 @@ class ProjectService:
             raise RecordNotFoundError("project not found.")
 
     @staticmethod
+    @read_intent
     def get_projects_for_user(user, status: str = "all"):
         project_ids = AccountService.get_all_permissions_for_user(user, True, False, False).values_list("project_id", flat=True)
 
@@ -29,3 +87,871 @@ class ProjectService:
             qs = qs.filter(status=status)
 
         return qs.order_by(F("expected_completion_date").asc(nulls_first=True))
+
+    @staticmethod
+    @read_intent
+    def get_blueprints():
+        return ProjectBlueprint.objects.filter(is_active=True).order_by("default_order")
+
+    @staticmethod
+    @write_intent
+    @transaction.atomic
+    def apply_blueprint(project, blueprint: ProjectBlueprint) -> dict:
+        """
+        Add all the steps and inventories of a blueprint to the project.
+        The number of queries does not depend on the number of steps (bulk inserts).
+        """
+        steps = list(blueprint.steps.order_by("order", "id").values_list("step_template_id", "count", "title"))
+        inventories = list(blueprint.inventories.order_by("order", "id").values_list("inventory_template_id", "title"))
+
+        return {
+            "steps": ChecklistService.add_steps_to_project(project, steps)["project_steps"] if steps else [],
+            "inventories": InventoryService.add_inventories_to_project(project, inventories)["inventories"]
+            if inventories
+            else [],
+        }
+
+    @staticmethod
+    @write_intent
+    def delete(project, user=None, background: bool | None = None) -> Job | None:
+        """
+        Delete the project and all its content with set-based DELETEs (see core.deletion).
+        Big projects (or background=True) are deleted by a job: the permissions are removed first,
+        in the request, so the project disappears at once for every user. Returns the job if any.
+        """
+        if background is None:
+            background = ProjectTask.objects.filter(project_step__project=project).count() >= DELETE_IN_BACKGROUND_FROM
+
+        if not background:
+            fast_delete(Project.objects.filter(pk=project.pk))
+            return None
+
+        with transaction.atomic():
+            UserProjectPermissions.objects.filter(project=project).delete()
+            return JobService.enqueue("projects.delete", {"project_id": project.pk}, user=user)
+
+    @staticmethod
+    @write_intent
+    @transaction.atomic
+    def clone(
+        project,
+        name: str,
+        reset_status: bool = True,
+        include_inventory: bool = True,
+        include_comments: bool = False,
+        user=None,
+    ) -> Project:
+        """
+        Copy a project with its steps, tasks, permissions and optionally its inventories and comments.
+        Rows are read as tuples and inserted with chunked bulk_create, the new ids are remapped in memory:
+        a few queries per table whatever the size of the project.
+        With reset_status, every task is pending again. The user, if given, becomes admin of the clone.
+        """
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError("Restore the project from cold storage before cloning it.")
+
+        clone = Project.objects.create(
+            name=name,
+            description=project.description,
+            status="active" if reset_status else project.status,
+            expected_completion_date=project.expected_completion_date,
+        )
+
+        steps = ProjectService._copy_rows(
+            ProjectStep.objects.filter(project=project),
+            ["step_template_id", "title", "description", "icon", "order"],
+            project=clone,
+        )
+
+        task_fields = ["task_template_id", "title", "info_text", "help_url", "work_url", "order", "manually_created"]
+        if not reset_status:
+            task_fields += ["status", "completed_by_id", "completed_at"]
+        if include_comments:
+            task_fields += ["comment_count"]
+        tasks = ProjectService._copy_rows(
+            ProjectTask.objects.filter(project_step__project=project),
+            task_fields,
+            parents={"project_step": steps},
+        )
+
+        comments = {}
+        if include_comments:
+            comments = ProjectService._copy_rows(
+                TaskComment.objects.filter(project_task__project_step__project=project, deleted_at__isnull=True),
+                ["user_id", "comment_text"],
+                parents={"project_task": tasks},
+            )
+
+        fields = {}
+        if include_inventory:
+            inventories = ProjectService._copy_rows(
+                ProjectInventory.objects.filter(project=project),
+                ["inventory_template_id", "title", "description", "icon", "order"],
+                project=clone,
+            )
+            field_templates = TemplateField.objects.in_bulk(
+                InventoryField.objects.filter(inventory__project=project, field_template__isnull=False)
+                .values_list("field_template_id", flat=True)
+                .distinct()
+            )
+            fields = ProjectService._copy_rows(
+                InventoryField.objects.filter(inventory__project=project),
+                [
+                    "group_name",
+                    "group_order",
+                    "field_name",
+                    "field_order",
+                    "field_type",
+                    "text_value",
+                    "number_value",
+                    "file_value",
+                    "password_value",
+                    "datetime_value",
+                    "lookup_value",
+                    "file_hash",
+                ],
+                parents={"inventory": inventories, "field_template": field_templates},
+            )
+
+        ProjectService._copy_rows(
+            UserProjectPermissions.objects.filter(project=project).exclude(user=user),
+            ["user_id", "can_edit", "can_view", "is_admin"],
+            project=clone,
+        )
+        if user is not None:
+            AccountService.create_permission(clone, user, True, True, True)
+
+        # bulk_create does not send post_save, the parents are set as objects so no query is needed per row
+        SearchService.index_many([clone, *steps.values(), *tasks.values(), *comments.values(), *fields.values()])
+
+        return clone
+
+    @staticmethod
+    def _copy_rows(queryset, fields: list[str], parents: dict[str, dict] | None = None, **values) -> dict:
+        """
+        Insert a copy of each row of the queryset with the given field values.
+        parents maps a foreign key name to {old id: new object}, it replaces the original parent by its copy.
+        Returns {old id: new object}.
+        """
+        model = queryset.model
+        parents = parents or {}
+        rows = list(queryset.order_by("id").values_list("id", *fields, *[f"{name}_id" for name in parents]))
+
+        copies = {}
+        for row in rows:
+            data = dict(zip(["id", *fields, *parents], row))
+            old_id = data.pop("id")
+            for name, mapping in parents.items():
+                data[name] = mapping.get(data[name]) if data[name] is not None else None
+            copies[old_id] = model(**data, **values)
+
+        model.objects.bulk_create(copies.values(), batch_size=CLONE_BATCH_SIZE)
+        return copies
+
+
+def _json_default(value):
+    """Keep the full precision of dates (DjangoJSONEncoder truncates to milliseconds)"""
+    if hasattr(value, "isoformat"):  # datetime, date, time
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class ArchiveService:
+    """
+    Move archived projects to cold storage and back.
+
+    The snapshot is a JSON document {"version": 1, "tables": {name: {"columns": [...], "rows": [[...], ...]}}}
+    holding every column of the steps, tasks, comments, inventories and inventory fields of the project.
+    Values are stored as in the database: passwords stay encrypted, dates are ISO strings.
+    Restoring puts the rows back with their original ids, so the links (search, bookmarks) keep working.
+    """
+
+    @staticmethod
+    def is_frozen(project) -> bool:
+        """True when the content of the project (or project id) is in cold storage, the single check of every caller"""
+        return ProjectArchive.objects.filter(project=project).exists()
+
+    @staticmethod
+    async def ais_frozen(project) -> bool:
+        return await ProjectArchive.objects.filter(project=project).aexists()
+
+    @staticmethod
+    def get_archive(project) -> ProjectArchive:
+        """The archive without its data, which is only loaded when the snapshot is not cached"""
+        archive = ProjectArchive.objects.filter(project=project).select_related("project").defer("data").first()
+        if archive is None:
+            raise RecordNotFoundError("The project is not in cold storage.")
+        return archive
+
+    @staticmethod
+    def get_projects_to_freeze(older_than: timedelta):
+        return Project.objects.filter(
+            status="archived", updated_at__lt=timezone.now() - older_than, archive__isnull=True
+        ).order_by("id")
+
+    @staticmethod
+    @transaction.atomic
+    def freeze(project, user=None) -> ProjectArchive:
+        """Store the content of an archived project in a ProjectArchive and delete its rows"""
+        if project.status != "archived":
+            raise InvalidParameterError("Only archived projects can be moved to cold storage.")
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError("The project is already in cold storage.")
+
+        tables = {name: ArchiveService._dump(queryset) for name, queryset in ArchiveService._querysets(project).items()}
+        content = json.dumps({"version": ARCHIVE_VERSION, "tables": tables}, default=_json_default).encode("utf-8")
+
+        archive = ProjectArchive.objects.create(
+            project=project,
+            version=ARCHIVE_VERSION,
+            data=gzip.compress(content),
+            size=len(content),
+            counts={name: len(table["rows"]) for name, table in tables.items()},
+            created_by=user,
+        )
+
+        # Tasks, comments, fields and their search entries follow the cascade
+        fast_delete(ProjectStep.objects.filter(project=project))
+        fast_delete(ProjectInventory.objects.filter(project=project))
+        ReadModelService.invalidate([project.pk])
+        bump_versions([project.pk])
+        LiveService.publish(project.pk, "steps")
+        return archive
+
+    @staticmethod
+    def load(archive: ProjectArchive) -> dict[str, list]:
+        """Unsaved model instances of the snapshot per table, linked to their parents (read-only view, restore)"""
+        snapshot = ArchiveService._read(archive)
+        if snapshot["version"] != ARCHIVE_VERSION:
+            raise InvalidParameterError(f"Unsupported archive version {snapshot['version']}.")
+
+        objects = {}
+        for name, model in ARCHIVE_TABLES.items():
+            table = snapshot["tables"].get(name, {"columns": [], "rows": []})
+            # Columns added since the archive get their default, removed columns are ignored
+            fields = {field.attname: field for field in model._meta.concrete_fields}
+            columns = [(index, fields[column]) for index, column in enumerate(table["columns"]) if column in fields]
+            objects[name] = [
+                model(**{field.attname: field.to_python(row[index]) for index, field in columns}) for row in table["rows"]
+            ]
+
+        steps = {step.pk: step for step in objects["steps"]}
+        tasks = {task.pk: task for task in objects["tasks"]}
+        inventories = {inventory.pk: inventory for inventory in objects["inventories"]}
+        for obj in objects["steps"] + objects["inventories"]:
+            obj.project = archive.project
+        for task in objects["tasks"]:
+            task.project_step = steps[task.project_step_id]
+        for comment in objects["comments"]:
+            comment.project_task = tasks[comment.project_task_id]
+        for field in objects["fields"]:
+            field.inventory = inventories[field.inventory_id]
+        return objects
+
+    @staticmethod
+    @transaction.atomic
+    def restore(project) -> dict[str, int]:
+        """Put the content of the snapshot back in the live tables and drop the archive. Returns the counts."""
+        archive = ArchiveService.get_archive(project)
+        if ProjectStep.objects.filter(project=project).exists() or ProjectInventory.objects.filter(project=project).exists():
+            raise InvalidParameterError("The project has new steps or inventories, it cannot be restored.")
+
+        objects = ArchiveService.load(archive)
+        for name, objs in objects.items():
+            objects[name] = ArchiveService._drop_missing_references(objs)
+
+        for name, model in ARCHIVE_TABLES.items():
+            ArchiveService._insert(model, objects[name])
+
+        # bulk_create does not send post_save, the search entries are rebuilt explicitly
+        templates = TemplateField.objects.in_bulk({field.field_template_id for field in objects["fields"]} - {None})
+        for field in objects["fields"]:
+            field.field_template = templates.get(field.field_template_id)
+        SearchService.index_many([obj for objs in objects.values() for obj in objs if not isinstance(obj, ProjectInventory)])
+
+        ARCHIVE_CACHE.delete(archive.pk)
+        archive.delete()
+        ReadModelService.invalidate([project.pk])
+        bump_versions([project.pk])
+        LiveService.publish(project.pk, "steps")
+        return {name: len(objs) for name, objs in objects.items()}
+
+    @staticmethod
+    def _read(archive: ProjectArchive) -> dict:
+        def decode():
+            return json.loads(gzip.decompress(archive.data))
+
+        if archive.size > ARCHIVE_CACHE_MAX_SIZE:
+            return decode()
+        return ARCHIVE_CACHE.get_or_set(archive.pk, decode)
+
+    @staticmethod
+    def _querysets(project) -> dict:
+        return {
+            "steps": ProjectStep.objects.filter(project=project),
+            "tasks": ProjectTask.objects.filter(project_step__project=project),
+            "comments": TaskComment.objects.filter(project_task__project_step__project=project),
+            "inventories": ProjectInventory.objects.filter(project=project),
+            "fields": InventoryField.objects.filter(inventory__project=project),
+        }
+
+    @staticmethod
+    def _dump(queryset) -> dict:
+        fields = queryset.model._meta.concrete_fields
+        rows = queryset.order_by("pk").values_list(*[field.attname for field in fields])
+        return {
+            "columns": [field.attname for field in fields],
+            # get_prep_value gives the stored value, e.g. the encrypted password instead of the clear one
+            "rows": [[field.get_prep_value(value) for field, value in zip(fields, row)] for row in rows.iterator()],
+        }
+
+    @staticmethod
+    def _drop_missing_references(objs: list) -> list:
+        """
+        Templates and users may have been deleted while the project was in cold storage.
+        Nullable links to them are cleared, rows with a mandatory one are dropped (as the cascade would have done).
+        """
+        if not objs:
+            return objs
+
+        for field in objs[0]._meta.concrete_fields:
+            if not field.is_relation or field.related_model in [Project, *ARCHIVE_TABLES.values()]:
+                continue
+            ids = {getattr(obj, field.attname) for obj in objs} - {None}
+            missing = ids - set(field.related_model._base_manager.filter(pk__in=ids).values_list("pk", flat=True))
+            if not missing:
+                continue
+            if field.null:
+                for obj in objs:
+                    if getattr(obj, field.attname) in missing:
+                        setattr(obj, field.attname, None)
+            else:
+                objs = [obj for obj in objs if getattr(obj, field.attname) not in missing]
+        return objs
+
+    @staticmethod
+    def _insert(model, objs: list):
+        """bulk_create keeping the original dates, which auto_now(_add) fields would replace by now"""
+        dates = [
+            field.attname
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        ]
+        original = [[getattr(obj, attname) for attname in dates] for obj in objs]
+
+        model.objects.bulk_create(objs, batch_size=ARCHIVE_BATCH_SIZE)
+
+        if dates and objs:
+            for obj, values in zip(objs, original):
+                for attname, value in zip(dates, values):
+                    setattr(obj, attname, value)
+            model.objects.bulk_update(objs, dates, batch_size=ARCHIVE_BATCH_SIZE)
+
+
+class _Echo:
+    """File-like object returning what is written, used to stream csv.writer output"""
+
+    def write(self, value):
+        return value
+
+
+class ExportService:
+    """
+    Stream the checklist and audit trail of projects as CSV or NDJSON in constant memory.
+    Every query is a values_list projection read with .iterator(chunk_size), nothing is buffered.
+    """
+
+    COLUMNS = [
+        "record",
+        "project_id",
+        "project",
+        "step_id",
+        "task_id",
+        "comment_id",
+        "inventory_id",
+        "order",
+        "group",
+        "title",
+        "type",
+        "status",
+        "user",
+        "date",
+        "text",
+    ]
+
+    @staticmethod
+    def iter_records(project: Project, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[dict]:
+        """Yield one dict per step, task, active comment and non-secret inventory field of the project"""
+        # The live tables of a project in cold storage are empty, an export would silently lose its content
+        if ArchiveService.is_frozen(project):
+            raise InvalidParameterError(f'The project "{project.name}" is in cold storage, restore it before exporting it.')
+
+        base = {"project_id": project.id, "project": project.name}
+
+        steps = (
+            ProjectStep.objects.filter(project=project)
+            .order_by("order")
+            .values_list("id", "order", "title", "description")
+            .iterator(chunk_size=chunk_size)
+        )
+        for step_id, order, title, description in steps:
+            yield {**base, "record": "step", "step_id": step_id, "order": order, "title": title, "text": description}
+
+        tasks = (
+            ProjectTask.objects.filter(project_step__project=project)
+            .order_by("project_step__order", "order")
+            .values_list(
+                "id", "project_step_id", "order", "title", "status", "completed_by__username", "completed_at", "info_text"
+            )
+            .iterator(chunk_size=chunk_size)
+        )
+        for task_id, step_id, order, title, status, username, completed_at, info_text in tasks:
+            yield {
+                **base,
+                "record": "task",
+                "step_id": step_id,
+                "task_id": task_id,
+                "order": order,
+                "title": title,
+                "status": status,
+                "user": username,
+                "date": completed_at,
+                "text": info_text,
+            }
+
+        comments = (
+            TaskComment.objects.filter(project_task__project_step__project=project, deleted_at__isnull=True)
+            .order_by("project_task__project_step__order", "project_task__order", "created_at")
+            .values_list(
+                "id", "project_task__project_step_id", "project_task_id", "user__username", "created_at", "comment_text"
+            )
+            .iterator(chunk_size=chunk_size)
+        )
+        for comment_id, step_id, task_id, username, created_at, comment_text in comments:
+            yield {
+                **base,
+                "record": "comment",
+                "step_id": step_id,
+                "task_id": task_id,
+                "comment_id": comment_id,
+                "user": username,
+                "date": created_at,
+                "text": comment_text,
+            }
+
+        # Secret and password values are never exported, files are exported by name only
+        fields = (
+            InventoryField.objects.filter(inventory__project=project)
+            .exclude(field_type="password")
+            .exclude(field_template__is_secret=True)
+            .order_by("inventory__order", "group_order", "field_order")
+            .values_list(
+                "inventory_id",
+                "inventory__title",
+                "field_order",
+                "group_name",
+                "field_name",
+                "field_type",
+                "text_value",
+                "number_value",
+                "datetime_value",
+            )
+            .iterator(chunk_size=chunk_size)
+        )
+        for inventory_id, inventory_title, order, group, name, field_type, text, number, date in fields:
+            yield {
+                **base,
+                "record": "inventory",
+                "inventory_id": inventory_id,
+                "order": order,
+                "group": f"{inventory_title} / {group}",
+                "title": name,
+                "type": field_type,
+                "text": number if field_type == "number" else date if field_type == "datetime" else text,
+            }
+
+    @staticmethod
+    def export(projects: Iterable[Project], export_format: str = "csv", chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Return an iterator over the export of the projects, as text lines of the requested format.
+        The format is validated eagerly so errors are raised before any streaming starts.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise InvalidParameterError(f"Export format must be one of {', '.join(EXPORT_FORMATS)}.")
+
+        if export_format == "csv":
+            return ExportService._iter_csv(projects, chunk_size)
+        return ExportService._iter_ndjson(projects, chunk_size)
+
+    @staticmethod
+    def _iter_csv(projects: Iterable[Project], chunk_size: int) -> Iterator[str]:
+        writer = csv.DictWriter(_Echo(), fieldnames=ExportService.COLUMNS)
+        yield writer.writeheader()
+        for project in projects:
+            for record in ExportService.iter_records(project, chunk_size):
+                yield writer.writerow(ExportService._serialize(record))
+
+    @staticmethod
+    def _iter_ndjson(projects: Iterable[Project], chunk_size: int) -> Iterator[str]:
+        for project in projects:
+            for record in ExportService.iter_records(project, chunk_size):
+                yield json.dumps(ExportService._serialize(record), ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def _serialize(record: dict) -> dict:
+        return {key: value.isoformat() if hasattr(value, "isoformat") else value for key, value in record.items()}
+
+
+class ImportService:
+    """
+    Create a project with its steps, tasks and inventories from a CSV or YAML file.
+
+    YAML:
+        name: Deployment v2
+        description: optional
+        expected_completion_date: 2026-12-31
+        steps:
+          - template: Pre-deployment checks     # StepTemplate title or id, optional
+            title: Pre-deployment (staging)     # optional when a template is given
+            tasks:                              # custom tasks appended after the template tasks
+              - title: Check the VPN
+                info_text: optional
+                help_url: https://...
+        inventories:
+          - template: Servers                   # InventoryTemplate title or id
+            title: optional
+            values: {"Host": "db01.internal"}   # "field name" or "GROUP / field name"
+
+    CSV: one row per task with the columns step,template,task,info_text,help_url,work_url.
+    Consecutive rows with the same step title belong to the same step.
+    A row without task only declares the step (e.g. a step built from a template).
+
+    Everything is validated before writing, then written with batched bulk_create
+    in a single transaction, bypassing the per-row signals.
+    """
+
+    @staticmethod
+    def load(content: bytes | str, file_format: str) -> dict:
+        """Parse the file content into the import data structure (see class docstring)"""
+        if file_format not in IMPORT_FORMATS:
+            raise InvalidParameterError(f"Import format must be one of {', '.join(IMPORT_FORMATS)}.")
+
+        if isinstance(content, bytes):
+            try:
+                content = content.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                raise InvalidParameterError("The file must be encoded in UTF-8.")
+
+        if file_format == "yaml":
+            try:
+                data = yaml.safe_load(content)
+            except yaml.YAMLError as e:
+                raise InvalidParameterError(f"Invalid YAML file: {e}")
+            if not isinstance(data, dict):
+                raise InvalidParameterError("The YAML file must contain a mapping with the project fields.")
+            return data
+
+        return ImportService._load_csv(content)
+
+    @staticmethod
+    def _load_csv(content: str) -> dict:
+        reader = csv.DictReader(io.StringIO(content))
+        missing = {"step", "task"} - set(reader.fieldnames or [])
+        if missing:
+            raise InvalidParameterError(f"Missing CSV columns: {', '.join(sorted(missing))}.")
+
+        steps = []
+        for row in reader:
+            row = {key: (value or "").strip() for key, value in row.items() if key in IMPORT_CSV_COLUMNS}
+            if not steps or steps[-1]["title"] != row["step"]:
+                steps.append({"title": row["step"], "tasks": []})
+            if row.get("template"):
+                steps[-1]["template"] = row["template"]
+            if row["task"]:
+                steps[-1]["tasks"].append(
+                    {
+                        "title": row["task"],
+                        "info_text": row.get("info_text"),
+                        "help_url": row.get("help_url"),
+                        "work_url": row.get("work_url"),
+                    }
+                )
+
+        return {"steps": steps}
+
+    @staticmethod
+    def validate(data: dict) -> dict:
+        """
+        Validate the whole import and resolve the templates.
+        Raises InvalidParameterError listing every error, nothing is written.
+        """
+        errors = []
+
+        form = ProjectCreationForm(
+            data={
+                "name": data.get("name") or "",
+                "status": data.get("status") or "active",
+                "description": data.get("description") or "",
+                "expected_completion_date": data.get("expected_completion_date") or "",
+            }
+        )
+        if not form.is_valid():
+            errors += [f"{field}: {error}" for field, field_errors in form.errors.items() for error in field_errors]
+
+        step_templates = ImportService._index_templates(ChecklistService.get_template(load_tasks=True))
+        inventory_templates = ImportService._index_templates(InventoryService.get_template(load_fields=True))
+
+        steps = []
+        for i, step in enumerate(ImportService._as_list(data.get("steps"), "steps", errors), start=1):
+            where = f"step {i}"
+            if not isinstance(step, dict):
+                errors.append(f"{where}: must be a mapping")
+                continue
+
+            template = None
+            if step.get("template") not in (None, ""):
+                template = step_templates.get(str(step["template"]).strip().lower())
+                if template is None:
+                    errors.append(f"{where}: unknown step template '{step['template']}'")
+                    continue
+
+            title = str(step.get("title") or "").strip() or (template.title if template else "")
+            if not title:
+                errors.append(f"{where}: a title or a template is required")
+            elif len(title) > ProjectStep._meta.get_field("title").max_length:
+                errors.append(f"{where}: title is too long")
+
+            tasks = []
+            for j, task in enumerate(ImportService._as_list(step.get("tasks"), f"{where} tasks", errors), start=1):
+                task = ImportService._validate_task(task, f"{where}, task {j}", errors)
+                if task:
+                    tasks.append(task)
+
+            steps.append(
+                {
+                    "template": template,
+                    "title": title,
+                    "icon": str(step.get("icon") or getattr(template, "icon", "📋"))[:10],
+                    "description": step.get("description") or (template.description if template else None),
+                    "tasks": tasks,
+                }
+            )
+
+        inventories = []
+        for i, inventory in enumerate(ImportService._as_list(data.get("inventories"), "inventories", errors), start=1):
+            where = f"inventory {i}"
+            if not isinstance(inventory, dict):
+                errors.append(f"{where}: must be a mapping")
+                continue
+
+            template = inventory_templates.get(str(inventory.get("template") or "").strip().lower())
+            if template is None:
+                errors.append(f"{where}: unknown inventory template '{inventory.get('template')}'")
+                continue
+
+            values = inventory.get("values") or {}
+            if not isinstance(values, dict):
+                errors.append(f"{where}: values must be a mapping")
+                continue
+
+            inventories.append(
+                {
+                    "template": template,
+                    "title": str(inventory.get("title") or template.title).strip(),
+                    "values": ImportService._validate_values(template, values, where, errors),
+                }
+            )
+
+        if errors:
+            raise InvalidParameterError(f"{len(errors)} error(s) in the import file: " + "; ".join(errors[:20]))
+
+        return {"project": form.cleaned_data, "steps": steps, "inventories": inventories}
+
+    @staticmethod
+    def _as_list(value, where, errors) -> list:
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            errors.append(f"{where}: must be a list")
+            return []
+        return value
+
+    @staticmethod
+    def _index_templates(templates) -> dict:
+        """Templates can be referenced by id or by title (case insensitive)"""
+        index = {}
+        for template in templates:
+            index[str(template.id)] = template
+            index[template.title.strip().lower()] = template
+        return index
+
+    @staticmethod
+    def _validate_task(task, where, errors) -> dict | None:
+        if isinstance(task, str):
+            task = {"title": task}
+        if not isinstance(task, dict):
+            errors.append(f"{where}: must be a title or a mapping")
+            return None
+
+        title = str(task.get("title") or "").strip()
+        if not title:
+            errors.append(f"{where}: title is required")
+        elif len(title) > ProjectTask._meta.get_field("title").max_length:
+            errors.append(f"{where}: title is too long")
+
+        urls = {}
+        for key in ["help_url", "work_url"]:
+            urls[key] = str(task.get(key) or "").strip() or None
+            if urls[key]:
+                try:
+                    URLValidator()(urls[key])
+                except ValidationError:
+                    errors.append(f"{where}: {key} is not a valid URL")
+
+        return {"title": title, "info_text": task.get("info_text") or None, **urls}
+
+    @staticmethod
+    def _validate_values(template, values: dict, where, errors) -> dict:
+        """Map the imported values on the template fields, returns {field_template_id: value}"""
+        fields = {}
+        for field in template.fields.all():
+            fields[field.field_name.strip().lower()] = field
+            fields[f"{field.group_name} / {field.field_name}".strip().lower()] = field
+
+        result = {}
+        for name, value in values.items():
+            field = fields.get(str(name).strip().lower())
+            if field is None:
+                errors.append(f"{where}: unknown field '{name}'")
+            elif field.field_type not in IMPORT_FIELD_TYPES:
+                errors.append(f"{where}: field '{name}' of type {field.field_type} cannot be imported")
+            elif value in (None, ""):
+                continue
+            elif field.field_type == "number" and (isinstance(value, bool) or not isinstance(value, int)):
+                errors.append(f"{where}: field '{name}' must be an integer")  # YAML booleans are ints in Python
+            elif field.field_type == "number" and not NUMBER_VALUE_RANGE[0] <= value <= NUMBER_VALUE_RANGE[1]:
+                errors.append(f"{where}: field '{name}' must be between {NUMBER_VALUE_RANGE[0]} and {NUMBER_VALUE_RANGE[1]}")
+            elif field.field_type == "datetime":
+                parsed = value if isinstance(value, datetime) else parse_datetime(str(value))
+                if parsed is None:
+                    errors.append(f"{where}: field '{name}' must be a date time (YYYY-MM-DD HH:MM)")
+                elif timezone.is_naive(parsed):
+                    parsed = timezone.make_aware(parsed)  # In the current time zone, like the forms
+                result[field.id] = parsed
+            elif field.field_type in ("text", "url"):
+                value = str(value)
+                if len(value) > InventoryField._meta.get_field("text_value").max_length:
+                    errors.append(f"{where}: field '{name}' is too long")
+                    continue
+                if field.field_type == "url":
+                    try:
+                        URLValidator()(value)
+                    except ValidationError:
+                        errors.append(f"{where}: field '{name}' is not a valid URL")
+                        continue
+                result[field.id] = value
+            else:
+                result[field.id] = value
+        return result
+
+    @staticmethod
+    @transaction.atomic
+    def import_project(data: dict, user, progress: Callable[[int, int], None] | None = None) -> Project:
+        """
+        Validate then create the project, its steps, tasks and inventories with batched inserts.
+        The user becomes admin of the project. progress(done, total) is called after each batch.
+        """
+        plan = ImportService.validate(data)
+
+        project = Project.objects.create(**plan["project"])
+        AccountService.create_permission(project, user, True, True, True)
+
+        steps = [
+            ProjectStep(
+                project=project,
+                step_template=spec["template"],
+                title=spec["title"],
+                description=spec["description"],
+                icon=spec["icon"],
+                order=order,
+            )
+            for order, spec in enumerate(plan["steps"], start=1)
+        ]
+
+        tasks = []
+        for step, spec in zip(steps, plan["steps"]):
+            template_tasks = spec["template"].tasks.all() if spec["template"] else []
+            for order, task_template in enumerate(template_tasks):
+                tasks.append(
+                    ProjectTask(
+                        project_step=step,
+                        task_template=task_template,
+                        title=task_template.title,
+                        info_text=task_template.info_text,
+                        help_url=task_template.help_url,
+                        work_url=task_template.work_url,
+                        order=order,
+                    )
+                )
+            for order, task in enumerate(spec["tasks"], start=len(template_tasks)):
+                tasks.append(ProjectTask(project_step=step, order=order, manually_created=True, **task))
+
+        inventories = [
+            ProjectInventory(
+                project=project,
+                inventory_template=spec["template"],
+                title=spec["title"],
+                description=spec["template"].description,
+                icon=spec["template"].icon,
+                order=order,
+            )
+            for order, spec in enumerate(plan["inventories"], start=1)
+        ]
+
+        fields = []
+        for inventory, spec in zip(inventories, plan["inventories"]):
+            for field_template in spec["template"].fields.all():
+                field = InventoryField(
+                    inventory=inventory,
+                    field_template=field_template,
+                    group_name=field_template.group_name,
+                    group_order=field_template.group_order,
+                    field_name=field_template.field_name,
+                    field_order=field_template.field_order,
+                    field_type=field_template.field_type,
+                )
+                value = spec["values"].get(field_template.id)
+                if value is not None:
+                    ImportService._set_field_value(field, value)
+                field.refresh_lookup_values()  # bulk_create does not call save()
+                fields.append(field)
+
+        total = len(steps) + len(tasks) + len(inventories) + len(fields)
+        done = 0
+        for model, objs in [
+            (ProjectStep, steps),
+            (ProjectTask, tasks),
+            (ProjectInventory, inventories),
+            (InventoryField, fields),
+        ]:
+            for start in range(0, len(objs), IMPORT_BATCH_SIZE):
+                batch = objs[start : start + IMPORT_BATCH_SIZE]
+                model.objects.bulk_create(batch)
+                done += len(batch)
+                if progress:
+                    progress(done, total)
+
+        # bulk_create does not send post_save
+        SearchService.index_many([*steps, *tasks, *fields])
+
+        return project
+
+    @staticmethod
+    def _set_field_value(field: InventoryField, value):
+        match field.field_type:
+            case "text" | "url":
+                field.text_value = value
+            case "number":
+                field.number_value = value
+            case "datetime":
+                field.datetime_value = value
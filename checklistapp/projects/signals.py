@@ -1,10 +1,26 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from inventory.models import ProjectInventory
+from templates_management.models import TemplateField
 
 from .models import ProjectTask
+from .versions import bump_inventory_template_versions, bump_versions
 
 
 @receiver(post_save, sender=ProjectTask)
 def update_project_status(sender, instance: ProjectTask, **kwargs):
     """Signal to update project status when a task is updated"""
     instance.project_step.project.update_status()
+
+
+@receiver(post_save, sender=ProjectInventory)
+def bump_inventory_version(sender, instance: ProjectInventory, raw=False, **kwargs):
+    if not raw:
+        bump_versions([instance.project_id], inventory_ids=[instance.pk])
+
+
+@receiver(post_save, sender=TemplateField)
+def bump_template_field_inventory_versions(sender, instance: TemplateField, raw=False, **kwargs):
+    """The inventories render the name and the secret flag of their template fields"""
+    if not raw:
+        bump_inventory_template_versions([instance.template_id])
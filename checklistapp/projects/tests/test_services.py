@@ -1,10 +1,25 @@
-from datetime import date
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta
 
 import pytest
+from accounts.models import UserProjectPermissions
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from core.exceptions import InvalidParameterError
 from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from inventory.models import InventoryField, ProjectInventory
+from jobs.models import Job
+from search.models import SearchEntry
+from templates_management.models import BlueprintInventory, BlueprintStep, ProjectBlueprint, TemplateField
 
-from projects.models import Project
-from projects.services import ProjectService
+from projects.models import Project, ProjectArchive
+from projects.services import ArchiveService, ExportService, ImportService, ProjectService
 
 User = get_user_model()
 
@@ -54,3 +69,483 @@ def test_get_projects_for_user_ordering(mocker, admin_user):
 
     # Check that the mock was called
     mock_get_permissions.assert_called_once_with(admin_user, True, False, False)
+
+
+@pytest.fixture
+def export_project(project, user, inventory_field_text, template_field_password, project_inventory):
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    task = ProjectTask.objects.create(project_step=step, title="Ship", order=1)
+    task.mark_done(user)
+    TaskComment.objects.create(project_task=task, user=user, comment_text="Shipped on time")
+    TaskComment.objects.create(project_task=task, user=user, comment_text="Removed").soft_delete()
+    project_inventory.fields.create(
+        field_template=template_field_password,
+        group_name="Security",
+        field_name="Password",
+        field_type="password",
+        password_value="secret",
+    )
+    return project
+
+
+@pytest.mark.django_db
+def test_export_records(export_project, user):
+    """Test that steps, tasks, active comments and non-secret inventory are exported"""
+    records = list(ExportService.iter_records(export_project))
+
+    assert [r["record"] for r in records] == ["step", "task", "comment", "inventory"]
+
+    task = records[1]
+    assert task["status"] == "done"
+    assert task["user"] == user.username
+    assert task["date"] is not None
+
+    assert records[2]["text"] == "Shipped on time"
+    assert records[3]["text"] == "Test Value"
+
+
+@pytest.mark.django_db
+def test_export_csv(export_project):
+    content = "".join(ExportService.export([export_project], "csv"))
+
+    rows = list(csv.DictReader(io.StringIO(content)))
+    assert len(rows) == 4
+    assert rows[0]["project"] == export_project.name
+    assert "secret" not in content
+
+
+@pytest.mark.django_db
+def test_export_ndjson(export_project):
+    lines = "".join(ExportService.export([export_project], "ndjson")).splitlines()
+
+    records = [json.loads(line) for line in lines]
+    assert [r["record"] for r in records] == ["step", "task", "comment", "inventory"]
+
+
+def test_export_invalid_format():
+    with pytest.raises(InvalidParameterError):
+        ExportService.export([], "xml")
+
+
+@pytest.mark.django_db
+def test_export_projects_command(export_project, project2):
+    out = io.StringIO()
+
+    call_command("export_projects", "--format", "ndjson", stdout=out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {r["project_id"] for r in records} == {export_project.id}  # project2 has no content
+
+
+@pytest.mark.django_db
+def test_export_projects_command_skips_frozen_projects(archived_project):
+    """Projects in cold storage are skipped, or refused when they are asked for"""
+    ArchiveService.freeze(archived_project)
+    out, err = io.StringIO(), io.StringIO()
+
+    call_command("export_projects", "--format", "ndjson", stdout=out, stderr=err)
+
+    assert out.getvalue() == ""
+    assert f"cold storage: {archived_project.id}" in err.getvalue()
+    with pytest.raises(CommandError):
+        call_command("export_projects", "--project", str(archived_project.id), stdout=out)
+    with pytest.raises(InvalidParameterError):
+        list(ExportService.iter_records(archived_project))
+
+
+IMPORT_YAML = """
+name: Imported project
+description: From a file
+steps:
+  - template: deploy
+    tasks:
+      - title: Check the VPN
+        help_url: https://wiki.example.com/vpn
+  - title: Custom step
+    icon: 🚀
+    tasks:
+      - Run the smoke tests
+inventories:
+  - template: Test Inventory Template
+    values:
+      Test Text Field: db01.internal
+"""
+
+
+@pytest.mark.django_db
+def test_import_yaml(user, task_template_1, task_template_2, template_field_text, template_field_password):
+    progress = []
+
+    project = ImportService.import_project(
+        ImportService.load(IMPORT_YAML, "yaml"), user, progress=lambda *p: progress.append(p)
+    )
+
+    steps = list(project.steps.order_by("order"))
+    assert [(s.title, s.icon, s.order) for s in steps] == [("Deploy", "", 1), ("Custom step", "🚀", 2)]
+    tasks = list(steps[0].tasks.order_by("order").values_list("title", "order", "manually_created"))
+    assert tasks == [("Build", 0, False), ("Ship", 1, False), ("Check the VPN", 2, True)]
+    assert steps[1].tasks.get().title == "Run the smoke tests"
+
+    field = InventoryField.objects.get(inventory__project=project, field_name="Test Text Field")
+    assert field.text_value == "db01.internal"
+    assert field.lookup_value == "db01.internal"
+    assert InventoryField.objects.filter(inventory__project=project).count() == 2
+
+    assert UserProjectPermissions.objects.get(project=project, user=user).is_admin
+    assert SearchEntry.objects.filter(project=project, kind="task").count() == 4
+    assert progress[-1] == (9, 9)  # 2 steps, 4 tasks, 1 inventory, 2 fields
+
+
+@pytest.mark.django_db
+def test_import_csv(user, step_template, task_template_1):
+    content = (
+        b"step,template,task,info_text,help_url,work_url\n"
+        b"Release,Deploy,,,,\n"
+        b"Release,,Tag the release,,,https://git.example.com\n"
+        b"Notify,,Send the email,Use the template,,\n"
+    )
+
+    data = ImportService.load(content, "csv")
+    data["name"] = "CSV project"
+    project = ImportService.import_project(data, user)
+
+    steps = list(project.steps.order_by("order"))
+    assert [s.title for s in steps] == ["Release", "Notify"]
+    assert steps[0].step_template == step_template
+    assert list(steps[0].tasks.order_by("order").values_list("title", flat=True)) == ["Build", "Tag the release"]
+    assert steps[1].tasks.get().info_text == "Use the template"
+
+
+@pytest.mark.django_db
+def test_import_validation_writes_nothing(user, project):
+    data = {
+        "name": project.name,
+        "steps": [{"template": "unknown"}, {"title": "Ok", "tasks": [{"title": "Bad", "help_url": "not an url"}]}],
+        "inventories": [{"template": "unknown"}],
+    }
+
+    with pytest.raises(InvalidParameterError) as e:
+        ImportService.import_project(data, user)
+
+    message = str(e.value)
+    assert "4 error(s)" in message
+    assert "Project name already used" in message
+    assert "unknown step template 'unknown'" in message
+    assert "help_url is not a valid URL" in message
+    assert Project.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_rejects_secret_values(user, template_field_password):
+    data = {"name": "Secrets", "inventories": [{"template": "Test Inventory Template", "values": {"Test Password Field": "x"}}]}
+
+    with pytest.raises(InvalidParameterError, match="cannot be imported"):
+        ImportService.import_project(data, user)
+
+
+@pytest.mark.django_db
+def test_import_typed_values(user, inventory_template):
+    TemplateField.objects.create(template=inventory_template, group_name="General", field_name="Port", field_type="number")
+    TemplateField.objects.create(template=inventory_template, group_name="General", field_name="Since", field_type="datetime")
+    data = {"name": "Typed", "inventories": [{"template": inventory_template.title, "values": {"Port": True}}]}
+
+    with pytest.raises(InvalidParameterError, match="'Port' must be an integer"):
+        ImportService.import_project(data, user)
+
+    data["inventories"][0]["values"] = {"Port": 5432, "Since": "2026-01-02 03:04"}
+    project = ImportService.import_project(data, user)
+
+    fields = {field.field_name: field for field in InventoryField.objects.filter(inventory__project=project)}
+    assert fields["Port"].number_value == 5432
+    assert fields["Since"].datetime_value == timezone.make_aware(datetime(2026, 1, 2, 3, 4))
+    assert timezone.is_aware(fields["Since"].datetime_value)
+
+
+@pytest.mark.django_db
+def test_import_rejects_invalid_values(user, inventory_template, template_field_text):
+    """Out of range numbers, invalid URLs and over-long texts are reported with their inventory"""
+    TemplateField.objects.create(template=inventory_template, group_name="General", field_name="Port", field_type="number")
+    TemplateField.objects.create(template=inventory_template, group_name="General", field_name="Docs", field_type="url")
+    values = {"Port": 2**31, "Docs": "not a url", "Test Text Field": "x" * 1000}
+    data = {"name": "Invalid", "inventories": [{"template": inventory_template.title, "values": values}]}
+
+    with pytest.raises(InvalidParameterError) as error:
+        ImportService.validate(data)
+
+    assert "3 error(s)" in str(error.value)
+    assert "inventory 1: field 'Port' must be between -2147483648 and 2147483647" in str(error.value)
+    assert "inventory 1: field 'Docs' is not a valid URL" in str(error.value)
+    assert "inventory 1: field 'Test Text Field' is too long" in str(error.value)
+
+
+def test_import_load_errors():
+    with pytest.raises(InvalidParameterError):
+        ImportService.load("- a list", "yaml")
+    with pytest.raises(InvalidParameterError):
+        ImportService.load("title,other\n", "csv")
+    with pytest.raises(InvalidParameterError):
+        ImportService.load("", "xml")
+
+
+@pytest.mark.django_db
+def test_import_project_command(tmp_path, user, step_template):
+    path = tmp_path / "project.yaml"
+    path.write_text("name: From command\nsteps:\n  - template: Deploy\n")
+    out = io.StringIO()
+
+    call_command("import_project", str(path), "--user", user.username, stdout=out)
+
+    assert Project.objects.get(name="From command").steps.count() == 1
+    assert "imported" in out.getvalue()
+
+
+@pytest.fixture
+def blueprint(step_template, task_template_1, task_template_2, inventory_template, template_field_text):
+    blueprint = ProjectBlueprint.objects.create(title="Software Deployment")
+    BlueprintStep.objects.create(blueprint=blueprint, step_template=step_template, order=1)
+    BlueprintStep.objects.create(blueprint=blueprint, step_template=step_template, title="Deploy region", count=3, order=2)
+    BlueprintInventory.objects.create(blueprint=blueprint, inventory_template=inventory_template, title="Servers")
+    return blueprint
+
+
+@pytest.mark.django_db
+def test_apply_blueprint(project, blueprint):
+    ProjectStep.objects.create(project=project, title="Existing", icon="📝", order=5)
+
+    result = ProjectService.apply_blueprint(project, blueprint)
+
+    assert [(s.title, s.order) for s in result["steps"]] == [
+        ("Deploy", 6),
+        ("Deploy region", 7),
+        ("Deploy region", 8),
+        ("Deploy region", 9),
+    ]
+    assert ProjectTask.objects.filter(project_step__project=project).count() == 8
+    assert list(result["steps"][1].tasks.order_by("order").values_list("title", "order")) == [("Build", 0), ("Ship", 1)]
+    assert result["inventories"][0].title == "Servers"
+    assert result["inventories"][0].fields.get().field_name == "Test Text Field"
+    assert SearchEntry.objects.filter(project=project, kind="task").count() == 8
+
+
+@pytest.mark.django_db
+def test_apply_blueprint_query_count_does_not_depend_on_steps(project, project2, blueprint):
+    with CaptureQueriesContext(connection) as small:
+        ProjectService.apply_blueprint(project, blueprint)
+
+    blueprint.steps.update(count=20)
+    with CaptureQueriesContext(connection) as large:
+        ProjectService.apply_blueprint(project2, blueprint)
+
+    assert len(large) == len(small)
+
+
+@pytest.fixture
+def clone_project(project, user, admin_user, permission, admin_permission, inventory_field_text, template_field_password):
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    done = ProjectTask.objects.create(
+        project_step=step, title="Build", order=1, status="done", completed_by=user, comment_count=1
+    )
+    ProjectTask.objects.create(project_step=step, title="Ship", order=2)
+    TaskComment.objects.create(project_task=done, user=user, comment_text="Built with v2")
+    TaskComment.objects.create(project_task=done, user=user, comment_text="Removed", deleted_at=timezone.now())
+    InventoryField.objects.create(
+        inventory=inventory_field_text.inventory,
+        field_template=template_field_password,
+        group_name="Security",
+        field_name="Test Password Field",
+        field_type="password",
+        password_value="s3cr3t",
+    )
+    return project
+
+
+@pytest.mark.django_db
+def test_clone_project(clone_project, user, admin_user):
+    clone = ProjectService.clone(clone_project, "Clone", user=user)
+
+    assert clone.pk != clone_project.pk
+    tasks = list(ProjectTask.objects.filter(project_step__project=clone).order_by("order"))
+    assert [(t.title, t.status, t.completed_by_id, t.comment_count) for t in tasks] == [
+        ("Build", "pending", None, 0),
+        ("Ship", "pending", None, 0),
+    ]
+    assert not TaskComment.objects.filter(project_task__project_step__project=clone).exists()
+
+    fields = {f.field_name: f for f in InventoryField.objects.filter(inventory__project=clone)}
+    assert fields["Test Text Field"].text_value == "Test Value"
+    assert fields["Test Text Field"].lookup_value == "test value"
+    assert fields["Test Password Field"].password_value == "s3cr3t"
+
+    permissions = {p.user_id: p.is_admin for p in UserProjectPermissions.objects.filter(project=clone)}
+    assert permissions == {user.id: True, admin_user.id: True}
+
+    assert SearchEntry.objects.filter(project=clone, kind="task").count() == 2
+    assert SearchEntry.objects.filter(project=clone, kind="inventory_field").count() == 1  # Password not indexed
+    assert ProjectTask.objects.filter(project_step__project=clone_project).count() == 2  # Source untouched
+
+
+@pytest.mark.django_db
+def test_clone_project_keeps_status_and_comments(clone_project):
+    clone = ProjectService.clone(clone_project, "Clone", reset_status=False, include_inventory=False, include_comments=True)
+
+    task = ProjectTask.objects.get(project_step__project=clone, title="Build")
+    assert task.status == "done"
+    assert task.comment_count == 1
+    assert list(task.comments.values_list("comment_text", flat=True)) == ["Built with v2"]
+    assert not ProjectInventory.objects.filter(project=clone).exists()
+
+
+@pytest.mark.django_db
+def test_clone_project_query_count_does_not_depend_on_size(project, django_assert_max_num_queries):
+    steps = ProjectStep.objects.bulk_create(
+        [ProjectStep(project=project, title=f"Step {i}", icon="📝", order=i) for i in range(50)]
+    )
+    ProjectTask.objects.bulk_create(
+        [ProjectTask(project_step=step, title=f"Task {j}", order=j) for step in steps for j in range(20)]
+    )
+
+    with django_assert_max_num_queries(20):
+        clone = ProjectService.clone(project, "Clone")
+
+    assert ProjectTask.objects.filter(project_step__project=clone).count() == 1000
+
+
+@pytest.mark.django_db
+def test_delete_project(user, project, permission):
+    """Small projects are deleted in the request"""
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    ProjectTask.objects.create(project_step=step, title="Tag", order=1)
+
+    assert ProjectService.delete(project, user) is None
+    assert not Project.objects.filter(pk=project.pk).exists()
+    assert not ProjectTask.objects.exists()
+    assert not SearchEntry.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)  # The worker closes the connections left in a transaction
+def test_delete_project_in_background(settings, user, project, permission):
+    """Big projects are hidden at once, then deleted by a job"""
+    settings.JOBS_EAGER = False
+
+    job = ProjectService.delete(project, user, background=True)
+
+    assert job.kind == "projects.delete"
+    assert Project.objects.filter(pk=project.pk).exists()
+    assert not ProjectService.get_projects_for_user(user, "all").exists()
+    assert not UserProjectPermissions.objects.filter(project=project).exists()
+
+    call_command("run_worker", "--once")
+
+    job.refresh_from_db()
+    assert job.status == "done"
+    assert job.result["deleted"]["projects.Project"] == 1
+    assert not Project.objects.filter(pk=project.pk).exists()
+    assert Job.objects.filter(pk=job.pk).exists()
+
+
+@pytest.fixture
+def archived_project(user, project, permission, project_inventory, inventory_field_text, template_field_password):
+    """Archived project with a step, two tasks, comments and a password"""
+    project.status = "archived"
+    project.save()
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    done = ProjectTask.objects.create(project_step=step, title="Tag", order=1, status="done", completed_by=user)
+    ProjectTask.objects.create(project_step=step, title="Release", order=2, help_url="https://example.com")
+    TaskComment.objects.create(project_task=done, user=user, comment_text="v1.0 tagged")
+    InventoryField.objects.create(
+        inventory=project_inventory,
+        field_template=template_field_password,
+        group_name="Access",
+        field_name="Password",
+        field_type="password",
+        password_value="s3cret",
+    )
+    return project
+
+
+@pytest.mark.django_db
+def test_freeze_project(user, archived_project):
+    """The content is stored in a single compressed row and removed from the live tables"""
+    created_at = ProjectTask.objects.get(title="Tag").created_at
+
+    archive = ArchiveService.freeze(archived_project, user)
+
+    assert archive.counts == {"steps": 1, "tasks": 2, "comments": 1, "inventories": 1, "fields": 2}
+    assert len(archive.data) < archive.size
+    assert b"s3cret" not in gzip.decompress(archive.data)
+    assert not ProjectTask.objects.exists()
+    assert not InventoryField.objects.exists()
+    assert list(SearchEntry.objects.values_list("kind", flat=True)) == ["project"]
+
+    snapshot = ArchiveService.load(archive)
+    task = next(task for task in snapshot["tasks"] if task.title == "Tag")
+    assert task.created_at == created_at
+    assert task.project_step.title == "Deploy"
+    assert next(field for field in snapshot["fields"] if field.field_type == "password").password_value == "s3cret"
+
+
+@pytest.mark.django_db
+def test_archive_snapshot_is_cached(django_assert_num_queries, archived_project):
+    """The next views of a frozen project do not load and decode the archive data again"""
+    ArchiveService.freeze(archived_project)
+    ArchiveService.load(ArchiveService.get_archive(archived_project))
+
+    archive = ArchiveService.get_archive(archived_project)
+    with django_assert_num_queries(0):
+        snapshot = ArchiveService.load(archive)
+
+    assert len(snapshot["tasks"]) == 2
+
+
+@pytest.mark.django_db
+def test_freeze_requires_archived_status(project):
+    with pytest.raises(InvalidParameterError):
+        ArchiveService.freeze(project)
+
+
+@pytest.mark.django_db
+def test_restore_project(user, archived_project):
+    """Rows come back with their ids, dates, secrets and search entries"""
+    tasks = {task.pk: (task.title, task.created_at, task.completed_by_id) for task in ProjectTask.objects.all()}
+    entries = SearchEntry.objects.count()
+    ArchiveService.freeze(archived_project)
+
+    counts = ArchiveService.restore(archived_project)
+
+    assert counts["tasks"] == 2
+    assert {task.pk: (task.title, task.created_at, task.completed_by_id) for task in ProjectTask.objects.all()} == tasks
+    assert InventoryField.objects.get(field_type="password").password_value == "s3cret"
+    assert SearchEntry.objects.count() == entries
+    assert not ProjectArchive.objects.exists()
+    archived_project.refresh_from_db()
+    assert archived_project.status == "archived"
+
+
+@pytest.mark.django_db
+def test_restore_with_deleted_references(user, archived_project, template_field_password):
+    """Deleted templates are unlinked, comments of deleted users are dropped"""
+    ArchiveService.freeze(archived_project)
+    template_field_password.delete()
+    user.delete()
+
+    counts = ArchiveService.restore(archived_project)
+
+    assert counts["comments"] == 0
+    assert ProjectTask.objects.get(title="Tag").completed_by is None
+    assert InventoryField.objects.get(field_type="password").field_template is None
+
+
+@pytest.mark.django_db
+def test_freeze_projects_command(archived_project, project2):
+    project2.status = "archived"
+    project2.save()
+    Project.objects.filter(pk=archived_project.pk).update(updated_at=timezone.now() - timedelta(days=40))
+
+    call_command("freeze_projects", "--days", "30")
+
+    assert ArchiveService.is_frozen(archived_project)
+    assert not ArchiveService.is_frozen(project2)
+
+    call_command("freeze_projects", "--restore", str(archived_project.pk))
+
+    assert not ArchiveService.is_frozen(archived_project)
@@ -1,8 +1,15 @@
 import pytest
 from accounts.models import UserProjectPermissions
+from checklist.models import ProjectStep, ProjectTask
+from core.exceptions import RecordNotFoundError
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
+from inventory.models import ProjectInventory
+from jobs.models import Job
+from templates_management.models import BlueprintStep, ProjectBlueprint
 
-from projects.models import Project
+from projects.models import Project, ProjectArchive
+from projects.services import ProjectService
 
 
 @pytest.mark.django_db
@@ -361,6 +368,18 @@ def test_project_delete_success(client, admin_user, project, admin_permission):
     assert not Project.objects.filter(id=project_id).exists()
 
 
+@pytest.mark.django_db
+def test_project_delete_form_post(client, admin_user, project, admin_permission):
+    """The project list posts the deletion form"""
+    client.login(username=admin_user.username, password="password")
+    ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+
+    response = client.post(reverse("projects:project_delete", kwargs={"project_id": project.id}))
+
+    assert response.url == reverse("projects:project_list")
+    assert not Project.objects.filter(id=project.id).exists()
+
+
 @pytest.mark.django_db
 def test_project_delete_using_post(client, admin_user, project, admin_permission):
     """Test project deletion using POST method"""
@@ -405,3 +424,239 @@ def test_project_delete_non_existent_project(client, admin_user):
     response = client.delete(url)
 
     assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_project_export_requires_permission(client, user, project):
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("projects:project_export", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_project_export_streams_csv(client, user, project, permission):
+    ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("projects:project_export", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Disposition"] == f'attachment; filename="project-{project.id}.csv"'
+    content = b"".join(response.streaming_content).decode()
+    assert content.startswith("record,project_id")
+    assert "Deploy" in content
+
+
+@pytest.mark.django_db
+def test_project_export_invalid_format(client, user, project, permission):
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("projects:project_export", kwargs={"project_id": project.id}), {"format": "xml"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_project_import(client, user, step_template):
+    client.login(username=user.username, password="password")
+    file = SimpleUploadedFile("project.csv", b"step,template,task\nRelease,Deploy,Tag\n", content_type="text/csv")
+
+    response = client.post(reverse("projects:project_import"), {"file": file, "name": "Imported"})
+
+    project = Project.objects.get(name="Imported")
+    assert response.status_code == 302
+    assert response.url == reverse("projects:project_edit", kwargs={"project_id": project.id})
+    assert project.steps.get().tasks.get().title == "Tag"
+
+
+@pytest.mark.django_db
+def test_project_import_invalid_file(client, user):
+    client.login(username=user.username, password="password")
+    file = SimpleUploadedFile("project.yaml", b"name: Imported\nsteps:\n  - template: unknown\n")
+
+    response = client.post(reverse("projects:project_import"), {"file": file})
+
+    assert response.status_code == 200
+    assert "unknown step template" in [str(m) for m in response.context["messages"]][0]
+    assert not Project.objects.filter(name="Imported").exists()
+
+
+@pytest.mark.django_db
+def test_project_create_with_blueprint(client, user, step_template, task_template_1):
+    """Test project creation instantiating a blueprint"""
+    blueprint = ProjectBlueprint.objects.create(title="Software Deployment")
+    BlueprintStep.objects.create(blueprint=blueprint, step_template=step_template, count=2)
+    client.login(username=user.username, password="password")
+
+    response = client.post(
+        reverse("projects:project_create"), {"name": "New Project", "status": "active", "blueprint": blueprint.id}
+    )
+
+    assert response.status_code == 302
+    project = Project.objects.get(name="New Project")
+    assert list(project.steps.order_by("order").values_list("title", "order")) == [("Deploy", 1), ("Deploy", 2)]
+    assert project.steps.first().tasks.get().title == "Build"
+
+
+@pytest.mark.django_db
+def test_project_create_with_inactive_blueprint_template(client, user, step_template):
+    """Test that a blueprint using a deactivated template is refused by the form"""
+    blueprint = ProjectBlueprint.objects.create(title="Software Deployment")
+    BlueprintStep.objects.create(blueprint=blueprint, step_template=step_template)
+    step_template.is_active = False
+    step_template.save()
+    client.login(username=user.username, password="password")
+
+    response = client.post(
+        reverse("projects:project_create"), {"name": "New Project", "status": "active", "blueprint": blueprint.id}
+    )
+
+    assert response.status_code == 200
+    assert "inactive templates: Deploy" in response.context["form"].errors["blueprint"][0]
+    assert not Project.objects.filter(name="New Project").exists()
+
+
+@pytest.mark.django_db
+def test_project_create_rolls_back_when_blueprint_fails(client, user, step_template, mocker):
+    """Test that a failing blueprint shows its message and creates nothing"""
+    blueprint = ProjectBlueprint.objects.create(title="Software Deployment")
+    BlueprintStep.objects.create(blueprint=blueprint, step_template=step_template)
+    mocker.patch.object(ProjectService, "apply_blueprint", side_effect=RecordNotFoundError("Step template not found."))
+    client.login(username=user.username, password="password")
+
+    response = client.post(
+        reverse("projects:project_create"), {"name": "New Project", "status": "active", "blueprint": blueprint.id}
+    )
+
+    assert response.status_code == 200
+    assert "Step template not found." in [str(m) for m in response.context["messages"]]
+    assert not Project.objects.filter(name="New Project").exists()
+    assert not UserProjectPermissions.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_project_clone_requires_admin(client, user, project, permission):
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("projects:project_clone", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_project_clone(client, admin_user, project, admin_permission):
+    ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    client.login(username=admin_user.username, password="password")
+    url = reverse("projects:project_clone", kwargs={"project_id": project.id})
+
+    assert client.get(url).context["form"].initial["name"] == "Test Project (copy)"
+    response = client.post(url, {"name": "Second run", "reset_status": "on"})
+
+    clone = Project.objects.get(name="Second run")
+    assert response.status_code == 302
+    assert response.url == reverse("projects:project_edit", kwargs={"project_id": clone.id})
+    assert clone.steps.get().title == "Deploy"
+
+
+@pytest.mark.django_db
+def test_project_clone_duplicated_name(client, admin_user, project, admin_permission):
+    client.login(username=admin_user.username, password="password")
+
+    response = client.post(reverse("projects:project_clone", kwargs={"project_id": project.id}), {"name": project.name})
+
+    assert response.status_code == 200
+    assert response.context["form"].errors["name"] == ["Project name already used"]
+
+
+@pytest.mark.django_db
+def test_project_import_queued(client, settings, user, step_template):
+    """With a worker, the import is validated then queued and the user follows the job page"""
+    settings.JOBS_EAGER = False
+    client.login(username=user.username, password="password")
+    file = SimpleUploadedFile("project.csv", b"step,template,task\nRelease,Deploy,Tag\n", content_type="text/csv")
+
+    response = client.post(reverse("projects:project_import"), {"file": file, "name": "Imported"})
+
+    job = Job.objects.get(kind="projects.import")
+    assert response.url == reverse("jobs:job_detail", kwargs={"job_id": job.id})
+    assert job.payload["content"].startswith("step,template,task")
+    assert not Project.objects.filter(name="Imported").exists()
+
+
+@pytest.mark.django_db
+def test_project_freeze_and_restore(client, admin_user, project, admin_permission):
+    """Archived projects can be moved to cold storage, read from the snapshot and restored"""
+    project.status = "archived"
+    project.save()
+    step = ProjectStep.objects.create(project=project, title="Deploy", icon="📝", order=1)
+    ProjectTask.objects.create(project_step=step, title="Tag", order=1)
+    client.login(username=admin_user.username, password="password")
+
+    response = client.post(reverse("projects:project_freeze", kwargs={"project_id": project.id}))
+    assert response.url == reverse("projects:project_archive", kwargs={"project_id": project.id})
+    assert not ProjectStep.objects.exists()
+
+    # The checklist and edit pages redirect to the read-only view
+    response = client.get(reverse("projects:checklist:step_detail_default", kwargs={"project_id": project.id}))
+    assert response.url == reverse("projects:project_archive", kwargs={"project_id": project.id})
+    response = client.get(reverse("projects:project_archive", kwargs={"project_id": project.id}))
+    assert "Tag" in response.content.decode()
+
+    response = client.post(reverse("projects:project_restore", kwargs={"project_id": project.id}))
+    assert response.url == reverse("projects:checklist:step_detail_default", kwargs={"project_id": project.id})
+    assert ProjectTask.objects.get().title == "Tag"
+
+
+@pytest.mark.django_db
+def test_frozen_project_refuses_changes(client, admin_user, project, admin_permission, step_template, inventory_template):
+    """Nothing can be added to a project in cold storage, it could not be restored anymore"""
+    project.status = "archived"
+    project.save()
+    client.login(username=admin_user.username, password="password")
+    client.post(reverse("projects:project_freeze", kwargs={"project_id": project.id}))
+
+    client.post(
+        reverse("projects:checklist:step_add", kwargs={"project_id": project.id}), {"step_template_id": step_template.id}
+    )
+    client.post(
+        reverse("projects:inventory:inventory_add", kwargs={"project_id": project.id}),
+        {"inventory_template_id": inventory_template.id},
+    )
+    response = client.post(
+        reverse("projects:project_edit", kwargs={"project_id": project.id}), {"name": "Renamed", "status": "active"}
+    )
+
+    assert response.url == reverse("projects:project_archive", kwargs={"project_id": project.id})
+    project.refresh_from_db()
+    assert (project.name, project.status) == ("Test Project", "archived")
+    assert not ProjectStep.objects.exists()
+    assert not ProjectInventory.objects.exists()
+
+    response = client.post(reverse("projects:project_restore", kwargs={"project_id": project.id}))
+    assert response.url == reverse("projects:checklist:step_detail_default", kwargs={"project_id": project.id})
+
+
+@pytest.mark.django_db
+def test_export_frozen_project(client, admin_user, project, admin_permission):
+    """The export of a project in cold storage fails clearly instead of being empty"""
+    project.status = "archived"
+    project.save()
+    client.login(username=admin_user.username, password="password")
+    client.post(reverse("projects:project_freeze", kwargs={"project_id": project.id}))
+
+    response = client.get(reverse("projects:project_export", kwargs={"project_id": project.id}))
+
+    assert response.status_code == 400
+    assert "cold storage" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_project_freeze_active_project(client, admin_user, project, admin_permission):
+    client.login(username=admin_user.username, password="password")
+
+    client.post(reverse("projects:project_freeze", kwargs={"project_id": project.id}))
+
+    assert not ProjectArchive.objects.exists()
@@ -8,12 +8,19 @@ urlpatterns = [
     # Project URLs
     path("", views.ProjectListView.as_view(), name="project_list"),
     path("create/", views.ProjectCreateView.as_view(), name="project_create"),
+    path("import/", views.ProjectImportView.as_view(), name="project_import"),
     path("<int:project_id>/edit/", views.ProjectEditView.as_view(), name="project_edit"),
     path(
         "<int:project_id>/delete/",
         views.ProjectDeleteView.as_view(),
         name="project_delete",
     ),
+    path("<int:project_id>/clone/", views.ProjectCloneView.as_view(), name="project_clone"),
+    path("<int:project_id>/export/", views.ProjectExportView.as_view(), name="project_export"),
+    path("<int:project_id>/archive/", views.ProjectArchiveView.as_view(), name="project_archive"),
+    path("<int:project_id>/archive/freeze/", views.ProjectFreezeView.as_view(), name="project_freeze"),
+    path("<int:project_id>/archive/restore/", views.ProjectRestoreView.as_view(), name="project_restore"),
     path("<int:project_id>/steps/", include(("checklist.urls", "checklist"), namespace="checklist")),
     path("<int:project_id>/inventory/", include(("inventory.urls", "inventory"), namespace="inventory")),
+    path("<int:project_id>/events/", include(("live.urls", "live"), namespace="live")),
 ]
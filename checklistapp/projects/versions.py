@@ -0,0 +1,38 @@
+from collections.abc import Iterable
+
+from checklist.models import ProjectStep
+from core.utils import new_version
+from inventory.models import ProjectInventory
+
+from .models import Project
+
+"""
+Version of the projects, steps and inventories, used to build the ETags of the checklist and inventory
+partials (see core.mixins.ConditionalGetMixin).
+
+Every write must change them: the post_save receivers cover save(), the services bump them explicitly
+after bulk_create/bulk_update/update() and deletions. A bump writes a new random value rather than
+incrementing a counter: a later save() of an instance loaded before the bump would write the old
+counter back, and an ETag already sent to a browser would become valid again.
+"""
+
+
+def bump_versions(project_ids: Iterable[int], step_ids: Iterable[int] = (), inventory_ids: Iterable[int] = ()):
+    """Change the version of the projects and of the given steps and inventories"""
+    version = new_version()
+    if step_ids := list(step_ids):
+        ProjectStep.objects.filter(pk__in=step_ids).update(version=version)
+    if inventory_ids := list(inventory_ids):
+        ProjectInventory.objects.filter(pk__in=inventory_ids).update(version=version)
+    Project.objects.filter(pk__in=list(project_ids)).update(version=version)
+
+
+def bump_inventory_template_versions(template_ids: Iterable[int]):
+    """Change the version of the inventories using the fields of the given inventory templates, and of their projects"""
+    inventories = list(
+        ProjectInventory.objects.filter(fields__field_template__template_id__in=list(template_ids))
+        .values_list("id", "project_id")
+        .distinct()
+    )
+    if inventories:
+        bump_versions({project_id for _, project_id in inventories}, inventory_ids={pk for pk, _ in inventories})
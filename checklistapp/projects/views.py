@@ -1,19 +1,28 @@
 import logging
 
+from accounts.models import User
 from accounts.services import AccountService
 from checklist.models import ProjectStep
-from core.mixins import ProjectAdminRequiredMixin
+from checklist.services import ChecklistService
+from core.exceptions import InvalidParameterError
+from core.mixins import CommonContextMixin, ProjectAdminRequiredMixin, ProjectReadRequiredMixin
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
-from django.views.generic import CreateView, DeleteView, ListView, UpdateView
+from django.utils.functional import cached_property
+from django.views import View
+from django.views.generic import CreateView, DeleteView, DetailView, FormView, ListView, UpdateView
 from inventory.services import InventoryService
-from templates_management.models import StepTemplate
+from jobs.services import JobService
+from jobs.views import redirect_to_job
+from templates_management.models import TemplateField
 
-from projects.services import ProjectService
+from projects.services import ArchiveService, ExportService, ImportService, ProjectService
 
-from .forms import ProjectCreationForm
+from .forms import ProjectBlueprintCreationForm, ProjectCloneForm, ProjectCreationForm, ProjectImportForm
 from .models import Project
 
 logger = logging.getLogger(__name__)
@@ -63,20 +72,34 @@ class ProjectCreateView(LoginRequiredMixin, CreateView):
     """
 
     model = Project
-    form_class = ProjectCreationForm
+    form_class = ProjectBlueprintCreationForm
     template_name = "projects/project_create.html"
 
     def get_success_url(self):
         return reverse_lazy("projects:project_edit", kwargs={"project_id": self.object.pk})
 
     def form_valid(self, form):
-        # 1. Create the project instance
-        response = super().form_valid(form)
+        try:
+            with transaction.atomic():
+                # 1. Create the project instance
+                response = super().form_valid(form)
 
-        # 2. Create UserProjectPermissions for the creator
-        AccountService.create_permission(self.object, self.request.user, True, True, True)
+                # 2. Create UserProjectPermissions for the creator
+                AccountService.create_permission(self.object, self.request.user, True, True, True)
 
-        # 3. Response with success message
+                # 3. Instantiate the blueprint, if any
+                if form.cleaned_data.get("blueprint"):
+                    ProjectService.apply_blueprint(self.object, form.cleaned_data["blueprint"])
+        except Exception as e:
+            logger.error(e)
+            self.object = None  # Rolled back
+            if hasattr(e, "custom"):
+                messages.error(self.request, str(e))
+            else:
+                messages.error(self.request, "Something went wrong when creating the project.")
+            return self.form_invalid(form)
+
+        # 4. Response with success message
         messages.success(self.request, f'Project "{self.object.name}" created successfully!')
         return response
 
@@ -85,6 +108,43 @@ class ProjectCreateView(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
 
 
+class ProjectImportView(LoginRequiredMixin, FormView):
+    """
+    View to create a project with its steps, tasks and inventories from a YAML or CSV file.
+    The file is validated here so that the errors are shown on the form, the import itself runs as a job.
+    On success, redirects to the job page, then to the project edit page.
+    """
+
+    form_class = ProjectImportForm
+    template_name = "projects/project_import.html"
+
+    def form_valid(self, form):
+        try:
+            content = form.cleaned_data["file"].read()
+            data = ImportService.load(content, form.get_format())
+            if form.cleaned_data["name"]:
+                data["name"] = form.cleaned_data["name"]
+            ImportService.validate(data)
+
+            job = JobService.enqueue(
+                "projects.import",
+                {"content": content.decode("utf-8-sig"), "file_format": form.get_format(), "name": form.cleaned_data["name"]},
+                user=self.request.user,
+            )
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(self.request, str(e))
+            else:
+                messages.error(self.request, "Something went wrong when importing the project.")
+            return self.form_invalid(form)
+
+        if job.status == "failed":
+            messages.error(self.request, job.message)
+            return self.form_invalid(form)
+        return redirect_to_job(self.request, job)
+
+
 class ProjectEditView(ProjectAdminRequiredMixin, UpdateView):
     """
     View to edit an existing project, including its steps and tasks.
@@ -98,14 +158,24 @@ class ProjectEditView(ProjectAdminRequiredMixin, UpdateView):
     context_object_name = "project"
     pk_url_kwarg = "project_id"
 
+    def get(self, request, *args, **kwargs):
+        # The checklist of a project in cold storage must be restored before being edited
+        if ArchiveService.is_frozen(kwargs["project_id"]):
+            return redirect("projects:project_archive", project_id=kwargs["project_id"])
+        return super().get(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        if ArchiveService.is_frozen(kwargs["project_id"]):
+            messages.error(request, "The project is in cold storage, restore it before changing it.")
+            return redirect("projects:project_archive", project_id=kwargs["project_id"])
+        return super().post(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # TODO: refactor after checklistService
-
-        # Get all available step templates
-        context["available_templates"] = StepTemplate.objects.filter(is_active=True).order_by("default_order")
-        context["inventory_templates"] = InventoryService.get_template()
+        # Get all available templates
+        context["available_templates"] = ChecklistService.get_template_catalog()
+        context["inventory_templates"] = InventoryService.get_template_catalog()
 
         # Get current project steps
         context["project_steps"] = (
@@ -124,7 +194,10 @@ class ProjectEditView(ProjectAdminRequiredMixin, UpdateView):
 
 
 class ProjectDeleteView(ProjectAdminRequiredMixin, DeleteView):
-    """View to delete a project."""
+    """
+    View to delete a project.
+    Big projects are hidden at once and deleted in the background (see ProjectService.delete).
+    """
 
     model = Project
     success_url = reverse_lazy("projects:project_list")
@@ -135,7 +208,7 @@ class ProjectDeleteView(ProjectAdminRequiredMixin, DeleteView):
         self.object = self.get_object()
 
         try:
-            self.object.delete()
+            ProjectService.delete(self.object, user=request.user)
             messages.success(request, "Project deleted successfully.")
 
         except Exception as e:
@@ -143,3 +216,156 @@ class ProjectDeleteView(ProjectAdminRequiredMixin, DeleteView):
             messages.error(request, "Something went wrong deleting the project.")
 
         return redirect(self.success_url)
+
+    def form_valid(self, form):
+        """The form of the project list posts the deletion"""
+        return self.delete(self.request)
+
+
+class ProjectCloneView(ProjectAdminRequiredMixin, FormView):
+    """
+    View to copy a project under a new name, with its steps, tasks, permissions
+    and optionally its inventories and comments.
+    Only admins can clone as the inventory secrets are copied.
+    On success, redirects to the edit page of the new project.
+    """
+
+    form_class = ProjectCloneForm
+    template_name = "projects/project_clone.html"
+
+    @cached_property
+    def project(self):
+        return ProjectService.get(self.kwargs["project_id"])
+
+    def get_initial(self):
+        return {"name": f"{self.project.name} (copy)"}
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["project"] = self.project
+        return context
+
+    def form_valid(self, form):
+        job = JobService.enqueue(
+            "projects.clone",
+            {"project_id": self.project.pk, **form.cleaned_data},
+            user=self.request.user,
+            project=self.project,
+        )
+        return redirect_to_job(self.request, job)
+
+
+class ProjectArchiveView(ProjectReadRequiredMixin, CommonContextMixin, DetailView):
+    """
+    Read-only view of a project in cold storage, rendered from its snapshot.
+    Secret inventory values are never shown.
+    """
+
+    model = Project
+    template_name = "projects/project_archive.html"
+    context_object_name = "project"
+    pk_url_kwarg = "project_id"
+
+    def get(self, request, *args, **kwargs):
+        if not ArchiveService.is_frozen(kwargs["project_id"]):
+            return redirect("projects:checklist:step_detail_default", project_id=kwargs["project_id"])
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["archive"] = archive = ArchiveService.get_archive(self.object)
+        snapshot = ArchiveService.load(archive)
+
+        # Authors may have been deleted since the project was archived
+        users = User.objects.in_bulk(
+            {comment.user_id for comment in snapshot["comments"]}
+            | {task.completed_by_id for task in snapshot["tasks"] if task.completed_by_id}
+        )
+
+        tasks, comments, fields = {}, {}, {}
+        for comment in snapshot["comments"]:
+            if not comment.is_deleted:
+                comment.author = users.get(comment.user_id)
+                comments.setdefault(comment.project_task_id, []).append(comment)
+        for task in snapshot["tasks"]:
+            task.completer = users.get(task.completed_by_id)
+            task.archived_comments = comments.get(task.pk, [])
+            tasks.setdefault(task.project_step_id, []).append(task)
+        templates = TemplateField.objects.in_bulk({field.field_template_id for field in snapshot["fields"]} - {None})
+        for field in snapshot["fields"]:
+            field.field_template = templates.get(field.field_template_id)  # for is_secret
+            fields.setdefault(field.inventory_id, []).append(field)
+
+        for step in snapshot["steps"]:
+            step.archived_tasks = sorted(tasks.get(step.pk, []), key=lambda task: task.order)
+        for inventory in snapshot["inventories"]:
+            inventory.archived_fields = sorted(
+                fields.get(inventory.pk, []), key=lambda field: (field.group_order, field.field_order)
+            )
+
+        context["steps"] = sorted(snapshot["steps"], key=lambda step: step.order)
+        context["inventories"] = sorted(snapshot["inventories"], key=lambda inventory: inventory.order)
+        return context
+
+
+class ProjectFreezeView(ProjectAdminRequiredMixin, View):
+    """Move an archived project to cold storage, then show its read-only view"""
+
+    def post(self, request, project_id):
+        try:
+            ArchiveService.freeze(ProjectService.get(project_id), user=request.user)
+            messages.success(request, "Project moved to cold storage.")
+            return redirect("projects:project_archive", project_id=project_id)
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(request, str(e))
+            else:
+                messages.error(request, "Something went wrong when moving the project to cold storage.")
+            return redirect("projects:checklist:step_detail_default", project_id=project_id)
+
+
+class ProjectRestoreView(ProjectAdminRequiredMixin, View):
+    """Put the content of a project in cold storage back in the live tables"""
+
+    def post(self, request, project_id):
+        try:
+            ArchiveService.restore(ProjectService.get(project_id))
+            messages.success(request, "Project restored from cold storage.")
+            return redirect("projects:checklist:step_detail_default", project_id=project_id)
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(request, str(e))
+            else:
+                messages.error(request, "Something went wrong when restoring the project.")
+            return redirect("projects:project_archive", project_id=project_id)
+
+
+class ProjectExportView(ProjectReadRequiredMixin, View):
+    """
+    Stream the checklist (steps, tasks, comments) and the non-secret inventory of a project.
+    Use '?format=csv' (default) or '?format=ndjson'.
+    """
+
+    content_types = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson; charset=utf-8"}
+
+    def get(self, request, project_id):
+        try:
+            export_format = request.GET.get("format", "csv")
+            project = ProjectService.get(project_id)
+            if ArchiveService.is_frozen(project):
+                raise InvalidParameterError("The project is in cold storage, restore it before exporting it.")
+
+            response = StreamingHttpResponse(
+                ExportService.export([project], export_format),
+                content_type=self.content_types.get(export_format),
+            )
+            response["Content-Disposition"] = f'attachment; filename="project-{project.id}.{export_format}"'
+            return response
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                return HttpResponse(str(e), status=400)
+            else:
+                return HttpResponse("Something went wrong when exporting the project.", status=500)
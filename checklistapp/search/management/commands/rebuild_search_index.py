@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from search.services import SearchService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from scratch (projects, steps, tasks, comments and inventory)."
+
+    def handle(self, *args, **options):
+        count = SearchService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{count} records indexed."))
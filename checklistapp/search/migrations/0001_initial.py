@@ -0,0 +1,140 @@
+# Generated by Django 6.0 on 2026-10-19 09:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POSTGRESQL_FORWARD = [
+    "ALTER TABLE search_searchentry ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION search_searchentry_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.body, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER search_searchentry_vector_trigger
+    BEFORE INSERT OR UPDATE ON search_searchentry
+    FOR EACH ROW EXECUTE FUNCTION search_searchentry_vector_update()
+    """,
+    "CREATE INDEX search_searchentry_vector_gin ON search_searchentry USING gin (search_vector)",
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_searchentry_vector_trigger ON search_searchentry",
+    "DROP FUNCTION IF EXISTS search_searchentry_vector_update()",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE search_searchentry_fts USING fts5(
+        title, body, content='search_searchentry', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_insert AFTER INSERT ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_delete AFTER DELETE ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_update AFTER UPDATE ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_insert",
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_delete",
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_update",
+    "DROP TABLE IF EXISTS search_searchentry_fts",
+]
+
+
+def _execute_for_vendor(schema_editor, statements_per_vendor):
+    for statement in statements_per_vendor.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    _execute_for_vendor(schema_editor, {"postgresql": POSTGRESQL_FORWARD, "sqlite": SQLITE_FORWARD})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _execute_for_vendor(schema_editor, {"postgresql": POSTGRESQL_BACKWARD, "sqlite": SQLITE_BACKWARD})
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("checklist", "0003_projecttask_comment_count"),
+        ("inventory", "0005_alter_projectinventory_description"),
+        ("projects", "0002_project_expected_completion_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("project", "Project"),
+                            ("step", "Step"),
+                            ("task", "Task"),
+                            ("comment", "Comment"),
+                            ("inventory_field", "Inventory field"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("title", models.CharField(blank=True, default="", max_length=500)),
+                ("body", models.TextField(blank=True, default="")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "inventory",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="inventory.projectinventory",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="projects.project"),
+                ),
+                (
+                    "project_step",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="checklist.projectstep"
+                    ),
+                ),
+                (
+                    "project_task",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="checklist.projecttask"
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("kind", "object_id"), name="unique_search_entry_per_object")],
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
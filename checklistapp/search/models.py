@@ -0,0 +1,55 @@
+from django.db import models
+from django.urls import reverse
+
+"""
+The search index stores one SearchEntry per searchable record (project, step, task, comment, inventory field).
+
+The full-text index itself is maintained by the database (see migration 0001):
+- PostgreSQL: a `search_vector` tsvector column (not declared on the model) is filled by a trigger and indexed with GIN
+- SQLite: an FTS5 table `search_searchentry_fts` is kept in sync by triggers
+
+Entries are linked to their parents with cascading foreign keys so deleting
+a project, step, task or inventory removes the related entries without any signal.
+"""
+
+
+class SearchEntry(models.Model):
+    KIND_CHOICES = [
+        ("project", "Project"),
+        ("step", "Step"),
+        ("task", "Task"),
+        ("comment", "Comment"),
+        ("inventory_field", "Inventory field"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+
+    project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="+")
+    project_step = models.ForeignKey("checklist.ProjectStep", on_delete=models.CASCADE, null=True, related_name="+")
+    project_task = models.ForeignKey("checklist.ProjectTask", on_delete=models.CASCADE, null=True, related_name="+")
+    inventory = models.ForeignKey("inventory.ProjectInventory", on_delete=models.CASCADE, null=True, related_name="+")
+
+    title = models.CharField(max_length=500, blank=True, default="")
+    body = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["kind", "object_id"], name="unique_search_entry_per_object")]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}: {self.title}"
+
+    def __repr__(self):
+        return f"SearchEntry(id={self.id}, kind={self.kind}, object_id={self.object_id})"
+
+    def get_absolute_url(self):
+        if self.kind == "inventory_field":
+            return reverse(
+                "projects:inventory:inventory_detail", kwargs={"project_id": self.project_id, "inventory_id": self.inventory_id}
+            )
+        if self.project_step_id:
+            return reverse(
+                "projects:checklist:step_detail", kwargs={"project_id": self.project_id, "step_id": self.project_step_id}
+            )
+        return reverse("projects:checklist:step_detail_default", kwargs={"project_id": self.project_id})
@@ -0,0 +1,226 @@
+import re
+
+from accounts.services import AccountService
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from django.db import connection, transaction
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from inventory.models import InventoryField
+from projects.models import Project
+
+from .models import SearchEntry
+
+# SQLite FTS5 table maintained by triggers (see migration 0001)
+FTS_TABLE = "search_searchentry_fts"
+
+# Fields rewritten when an entry is upserted
+ENTRY_FIELDS = ["project", "project_step", "project_task", "inventory", "title", "body"]
+
+BATCH_SIZE = 1000
+
+
+class SearchService:
+    @staticmethod
+    def get_kind(obj) -> str | None:
+        if isinstance(obj, Project):
+            return "project"
+        if isinstance(obj, ProjectStep):
+            return "step"
+        if isinstance(obj, ProjectTask):
+            return "task"
+        if isinstance(obj, TaskComment):
+            return "comment"
+        if isinstance(obj, InventoryField):
+            return "inventory_field"
+        return None
+
+    @staticmethod
+    def build_entry(obj) -> SearchEntry | None:
+        """
+        Build the (unsaved) search entry of a record.
+        Returns None if the record must not be searchable (deleted comment, secret field, ...)
+        """
+        kind = SearchService.get_kind(obj)
+        entry = SearchEntry(kind=kind, object_id=obj.pk)
+
+        match kind:
+            case "project":
+                entry.project_id = obj.pk
+                entry.title = obj.name
+                entry.body = obj.description or ""
+            case "step":
+                entry.project_id = obj.project_id
+                entry.project_step_id = obj.pk
+                entry.title = obj.title
+                entry.body = obj.description or ""
+            case "task":
+                entry.project_id = obj.project_step.project_id
+                entry.project_step_id = obj.project_step_id
+                entry.project_task_id = obj.pk
+                entry.title = obj.title
+                entry.body = obj.info_text or ""
+            case "comment":
+                if obj.is_deleted:
+                    return None
+                task = obj.project_task
+                entry.project_id = task.project_step.project_id
+                entry.project_step_id = task.project_step_id
+                entry.project_task_id = task.pk
+                entry.body = obj.comment_text
+            case "inventory_field":
+                # Secret and password values are never indexed
+                if obj.is_secret or not obj.text_value:
+                    return None
+                entry.project_id = obj.inventory.project_id
+                entry.inventory_id = obj.inventory_id
+                entry.title = obj.field_name
+                entry.body = obj.text_value
+            case _:
+                return None
+
+        return entry
+
+    @staticmethod
+    def index(obj):
+        """
+        Create, update or remove the search entry of a single record.
+        Nothing is written if the indexed content did not change (e.g. a task status toggle).
+        """
+        kind = SearchService.get_kind(obj)
+        entry = SearchService.build_entry(obj)
+
+        if entry is None:
+            SearchEntry.objects.filter(kind=kind, object_id=obj.pk).delete()
+            return
+
+        existing = SearchEntry.objects.filter(kind=kind, object_id=obj.pk).first()
+        if existing is None:
+            entry.save()
+        elif SearchService._entry_values(existing) != SearchService._entry_values(entry):
+            entry.pk = existing.pk
+            entry.save()
+
+    @staticmethod
+    def _entry_values(entry: SearchEntry) -> tuple:
+        return tuple(getattr(entry, SearchEntry._meta.get_field(name).attname) for name in ENTRY_FIELDS)
+
+    @staticmethod
+    def index_many(objs):
+        """Upsert the search entries of many records with batched queries (used after bulk_create)"""
+        entries = []
+        for obj in objs:
+            entry = SearchService.build_entry(obj)
+            if entry is not None:
+                entries.append(entry)
+
+        for start in range(0, len(entries), BATCH_SIZE):
+            SearchEntry.objects.bulk_create(
+                entries[start : start + BATCH_SIZE],
+                update_conflicts=True,
+                unique_fields=["kind", "object_id"],
+                update_fields=[*ENTRY_FIELDS, "updated_at"],
+            )
+
+    @staticmethod
+    def index_template_fields(template_fields):
+        """
+        Follow the secret flag of template fields (admin, catalog import): the values of the secret ones leave
+        the index, the values of the others missing from the index are indexed again.
+        """
+        secret_ids = [field.pk for field in template_fields if field.is_secret]
+        public_ids = [field.pk for field in template_fields if not field.is_secret]
+        entries = SearchEntry.objects.filter(kind="inventory_field")
+
+        if secret_ids:
+            entries.filter(object_id__in=InventoryField.objects.filter(field_template_id__in=secret_ids).values("id")).delete()
+        if public_ids:
+            SearchService.index_many(
+                InventoryField.objects.filter(field_template_id__in=public_ids)
+                .exclude(text_value="")
+                .exclude(id__in=entries.values("object_id"))
+                .select_related("inventory", "field_template")
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """Drop and rebuild the whole search index. Returns the number of indexed records."""
+        SearchEntry.objects.all().delete()
+
+        querysets = [
+            Project.objects.all(),
+            ProjectStep.objects.all(),
+            ProjectTask.objects.select_related("project_step"),
+            TaskComment.objects.filter(deleted_at__isnull=True).select_related("project_task__project_step"),
+            InventoryField.objects.filter(field_type__in=["text", "url", "file"])
+            .exclude(text_value="")
+            .select_related("inventory", "field_template"),
+        ]
+
+        count = 0
+        for qs in querysets:
+            batch = []
+            for obj in qs.iterator(chunk_size=BATCH_SIZE):
+                batch.append(obj)
+                if len(batch) == BATCH_SIZE:
+                    SearchService.index_many(batch)
+                    count += len(batch)
+                    batch = []
+            SearchService.index_many(batch)
+            count += len(batch)
+
+        return count
+
+    @staticmethod
+    def search(user, text: str):
+        """
+        Return the entries matching `text` in the projects visible by the user, best matches first.
+        Uses tsvector/GIN on PostgreSQL and FTS5 on SQLite.
+        """
+        project_ids = AccountService.get_all_permissions_for_user(user, True, False, False).values("project_id")
+
+        qs = SearchEntry.objects.filter(project_id__in=project_ids).select_related(
+            "project", "project_step", "project_task", "inventory"
+        )
+
+        if connection.vendor == "postgresql":
+            # search_vector and its GIN index only exist on PostgreSQL (see migration 0001)
+            query = SearchService._to_tsquery(text)
+            if not query:
+                return qs.none()
+            tsquery = "to_tsquery('simple', %s)"
+            return (
+                qs.filter(RawSQL(f"search_vector @@ {tsquery}", [query], output_field=BooleanField()))
+                .annotate(rank=RawSQL(f"ts_rank(search_vector, {tsquery})", [query], output_field=FloatField()))
+                .order_by("-rank", "-updated_at")
+            )
+
+        match = SearchService._to_fts5_query(text)
+        if not match:
+            return qs.none()
+
+        # bm25() is lower for better matches, title weighted 10x more than body
+        return (
+            qs.filter(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]))
+            .annotate(
+                rank=RawSQL(
+                    f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH %s AND rowid = {SearchEntry._meta.db_table}.id",
+                    [match],
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-rank", "-updated_at")
+        )
+
+    @staticmethod
+    def _to_tsquery(text: str) -> str:
+        """Turn free text into a safe tsquery: every word must match, as a prefix"""
+        words = re.findall(r"[^\W_]+", text)
+        return " & ".join(f"{word}:*" for word in words)
+
+    @staticmethod
+    def _to_fts5_query(text: str) -> str:
+        """Turn free text into a safe FTS5 query: every word must match, as a prefix"""
+        words = re.findall(r"\w+", text)
+        return " ".join(f'"{word}"*' for word in words)
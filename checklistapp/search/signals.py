@@ -0,0 +1,34 @@
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from inventory.models import InventoryField
+from projects.models import Project
+from templates_management.models import TemplateField
+
+from .services import SearchService
+
+"""
+Keep the search index in sync on write.
+Deletions are handled by the cascading foreign keys of SearchEntry.
+Records created with bulk_create must be indexed explicitly with SearchService.index_many.
+"""
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=ProjectStep)
+@receiver(post_save, sender=ProjectTask)
+@receiver(post_save, sender=TaskComment)
+@receiver(post_save, sender=InventoryField)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    """Signal to index a record when it is created or updated"""
+    if raw:
+        return  # Loading fixtures
+    SearchService.index(instance)
+
+
+@receiver(post_save, sender=TemplateField)
+def update_template_field_search_index(sender, instance, raw=False, **kwargs):
+    """Signal to remove the values of a template field from the index when it becomes secret, or add them back"""
+    if raw:
+        return  # Loading fixtures
+    SearchService.index_template_fields([instance])
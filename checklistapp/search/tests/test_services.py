@@ -0,0 +1,153 @@
+import pytest
+from checklist.models import ProjectStep, ProjectTask, TaskComment
+from checklist.services import ChecklistService
+from django.core.management import call_command
+from inventory.models import InventoryField
+
+from search.models import SearchEntry
+from search.services import SearchService
+
+
+@pytest.fixture
+def project_step(project):
+    return ProjectStep.objects.create(project=project, title="Network setup", icon="📝", order=1)
+
+
+@pytest.fixture
+def project_task(project_step):
+    return ProjectTask.objects.create(project_step=project_step, title="Install the VPN client", order=1)
+
+
+@pytest.mark.django_db
+def test_records_are_indexed_on_save(project, project_step, project_task):
+    """Test that projects, steps and tasks get a search entry when saved"""
+    kinds = set(SearchEntry.objects.filter(project=project).values_list("kind", flat=True))
+
+    assert kinds == {"project", "step", "task"}
+
+
+@pytest.mark.django_db
+def test_search_finds_comment(user, permission, project_task):
+    """Test that comments are searchable and point to their step"""
+    TaskComment.objects.create(project_task=project_task, user=user, comment_text="The VPN certificate expired")
+
+    results = list(SearchService.search(user, "certificate"))
+
+    assert len(results) == 1
+    assert results[0].kind == "comment"
+    assert results[0].project_step_id == project_task.project_step_id
+
+
+@pytest.mark.django_db
+def test_search_prefix_and_all_words(user, permission, project_task):
+    """Test that every word must match, as a prefix"""
+    assert SearchService.search(user, "vpn inst").count() == 1
+    assert SearchService.search(user, "vpn missing").count() == 0
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_first(user, permission, project_step):
+    """Test that title matches rank before body matches"""
+    ProjectTask.objects.create(project_step=project_step, title="Check logs", info_text="Look at the firewall", order=1)
+    ProjectTask.objects.create(project_step=project_step, title="Open the firewall", order=2)
+
+    results = list(SearchService.search(user, "firewall"))
+
+    assert [r.title for r in results] == ["Open the firewall", "Check logs"]
+
+
+@pytest.mark.django_db
+def test_search_restricted_to_visible_projects(user, permission, project_task, project2):
+    """Test that projects without read permission are never returned"""
+    other_step = ProjectStep.objects.create(project=project2, title="Other", icon="📝", order=1)
+    ProjectTask.objects.create(project_step=other_step, title="Install the VPN server", order=1)
+
+    results = list(SearchService.search(user, "vpn"))
+
+    assert [r.project_id for r in results] == [permission.project_id]
+
+
+@pytest.mark.django_db
+def test_search_with_empty_query(user, permission, project_task):
+    assert SearchService.search(user, "  !! ").count() == 0
+
+
+@pytest.mark.django_db
+def test_soft_deleted_comment_is_removed(user, project_task):
+    comment = TaskComment.objects.create(project_task=project_task, user=user, comment_text="Temporary note")
+    assert SearchEntry.objects.filter(kind="comment", object_id=comment.id).exists()
+
+    comment.soft_delete()
+
+    assert not SearchEntry.objects.filter(kind="comment", object_id=comment.id).exists()
+
+
+@pytest.mark.django_db
+def test_deleting_step_removes_entries(user, permission, project_step, project_task):
+    """Test that cascading deletes clean the index, including the full-text table"""
+    project_step.delete()
+
+    assert not SearchEntry.objects.filter(kind__in=["step", "task"]).exists()
+    assert SearchService.search(user, "vpn").count() == 0
+
+
+@pytest.mark.django_db
+def test_secret_and_password_fields_are_not_indexed(inventory_field_text, template_field_text, template_field_password):
+    """Test that only non-secret text values are indexed"""
+    assert SearchEntry.objects.filter(kind="inventory_field", object_id=inventory_field_text.id).exists()
+
+    template_field_text.is_secret = True
+    template_field_text.save()
+    inventory_field_text.save()
+    assert not SearchEntry.objects.filter(kind="inventory_field", object_id=inventory_field_text.id).exists()
+
+    password = InventoryField.objects.create(
+        inventory=inventory_field_text.inventory,
+        field_template=template_field_password,
+        group_name="Security",
+        field_name="Password",
+        field_type="password",
+        password_value="secret",
+    )
+    assert not SearchEntry.objects.filter(kind="inventory_field", object_id=password.id).exists()
+
+
+@pytest.mark.django_db
+def test_field_made_secret_leaves_the_search_results(user, permission, inventory_field_text, template_field_text):
+    """Test that the values of a template field made secret are no longer found, and come back when it is public again"""
+    assert SearchService.search(user, "test value").count() == 1
+
+    template_field_text.is_secret = True
+    template_field_text.save()
+    assert SearchService.search(user, "test value").count() == 0
+
+    template_field_text.is_secret = False
+    template_field_text.save()
+    assert SearchService.search(user, "test value").count() == 1
+
+
+@pytest.mark.django_db
+def test_unchanged_record_is_not_rewritten(project_task, django_assert_num_queries):
+    """Test that re-indexing an unchanged task (e.g. status toggle) only reads the index"""
+    project_task.status = "done"
+
+    with django_assert_num_queries(1):
+        SearchService.index(project_task)
+
+
+@pytest.mark.django_db
+def test_bulk_created_tasks_are_indexed(user, permission, project, step_template, task_template_1, task_template_2):
+    """Test that tasks created with bulk_create from a template are searchable"""
+    ChecklistService.add_steps_to_project(project, [(step_template.id, 1, None)])
+
+    assert SearchService.search(user, "ship").count() == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_command(user, permission, project_task):
+    SearchEntry.objects.all().delete()
+
+    call_command("rebuild_search_index")
+
+    assert SearchEntry.objects.count() == 3
+    assert SearchService.search(user, "vpn").count() == 1
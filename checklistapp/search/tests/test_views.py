@@ -0,0 +1,80 @@
+import base64
+
+import pytest
+from checklist.models import ProjectStep, ProjectTask
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from inventory.models import InventoryField
+
+
+@pytest.mark.django_db
+def test_search_requires_login(client):
+    response = client.get(reverse("search:search"), {"q": "vpn"})
+
+    assert response.status_code == 302
+    assert "/accounts/login/" in response.url
+
+
+@pytest.mark.django_db
+def test_search_without_query(client, user, permission):
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("search:search"))
+
+    assert response.status_code == 200
+    assert list(response.context["results"]) == []
+
+
+@pytest.mark.django_db
+def test_search_results_paginated(client, user, project, permission):
+    step = ProjectStep.objects.create(project=project, title="Step", icon="📝", order=1)
+    for i in range(25):
+        ProjectTask.objects.create(project_step=step, title=f"Renew certificate {i}", order=i)
+
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("search:search"), {"q": "certificate"})
+
+    assert response.status_code == 200
+    assert response.context["paginator"].count == 25
+    assert len(response.context["results"]) == 20
+    assert reverse("projects:checklist:step_detail", kwargs={"project_id": project.id, "step_id": step.id}) in (
+        response.content.decode()
+    )
+
+    response = client.get(reverse("search:search"), {"q": "certificate", "page": 2})
+    assert len(response.context["results"]) == 5
+
+
+@pytest.mark.django_db
+def test_inventory_lookup_view(client, user, permission, project_inventory):
+    InventoryField.objects.create(
+        inventory=project_inventory, group_name="General", field_name="Host", field_type="text", text_value="vpn.example.com"
+    )
+    client.login(username=user.username, password="password")
+
+    response = client.get(reverse("search:inventory_lookup"), {"q": "vpn"})
+
+    assert response.status_code == 200
+    assert response.context["paginator"].count == 1
+    assert "vpn.example.com" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_inventory_lookup_view_by_file(client, user, permission, project_inventory):
+    InventoryField.objects.create(
+        inventory=project_inventory,
+        group_name="General",
+        field_name="Certificate",
+        field_type="file",
+        file_value=base64.b64encode(b"certificate").decode(),
+        text_value="cert.pem",
+    )
+    client.login(username=user.username, password="password")
+
+    response = client.post(reverse("search:inventory_lookup"), {"file": SimpleUploadedFile("cert.pem", b"certificate")})
+    assert response.status_code == 302
+
+    response = client.get(response.url)
+    assert response.context["paginator"].count == 1
+    assert "cert.pem" in response.content.decode()
@@ -0,0 +1,87 @@
+import hashlib
+import logging
+
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.views.generic import ListView
+from inventory.models import InventoryField
+from inventory.services import InventoryService
+
+from .models import SearchEntry
+from .services import SearchService
+
+logger = logging.getLogger(__name__)
+
+
+class SearchView(LoginRequiredMixin, ListView):
+    """
+    Full-text search across projects, steps, tasks, comments and inventory.
+    Only the projects visible by the user are searched.
+    """
+
+    model = SearchEntry
+    template_name = "search/search_results.html"
+    context_object_name = "results"
+    paginate_by = 20
+
+    def get_queryset(self):
+        query = self.request.GET.get("q", "").strip()
+        if not query:
+            return SearchEntry.objects.none()
+
+        return SearchService.search(self.request.user, query)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["q"] = self.request.GET.get("q", "").strip()
+        return context
+
+
+class InventoryLookupView(LoginRequiredMixin, ListView):
+    """
+    Find which projects reference a host, an URL or a file in their inventory.
+    GET with 'q' (value prefix) or 'file_hash', POST a 'file' to look it up by content.
+    """
+
+    model = InventoryField
+    template_name = "search/inventory_lookup.html"
+    context_object_name = "fields"
+    paginate_by = 50
+
+    def get_queryset(self):
+        value = self.request.GET.get("q", "").strip()
+        file_hash = self.request.GET.get("file_hash", "").strip()
+        if not value and not file_hash:
+            return InventoryField.objects.none()
+
+        try:
+            return InventoryService.lookup_values(self.request.user, value=value, file_hash=file_hash)
+        except Exception as e:
+            logger.error(e)
+            if hasattr(e, "custom"):
+                messages.error(self.request, str(e))
+            else:
+                messages.error(self.request, "Something went wrong when looking up the inventory.")
+            return InventoryField.objects.none()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["q"] = self.request.GET.get("q", "").strip()
+        context["file_hash"] = self.request.GET.get("file_hash", "").strip()
+        return context
+
+    def post(self, request, *args, **kwargs):
+        uploaded = request.FILES.get("file")
+        if not uploaded:
+            messages.error(request, "Please select a file.")
+            return redirect("search:inventory_lookup")
+
+        # Same digest as InventoryField.file_hash, computed by chunks to support large files
+        digest = hashlib.sha256()
+        for chunk in uploaded.chunks():
+            digest.update(chunk)
+
+        # Redirect to a GET so results can be paginated
+        return redirect(f"{reverse('search:inventory_lookup')}?file_hash={digest.hexdigest()}")
@@ -40,9 +40,45 @@ function autoCloseAlerts() {
     });
 }
 
+/**
+ * Relative dates of the <time data-timesince> elements (see the timestamp filter), like smart_timesince:
+ * "2 hours, 5 minutes ago" for a day, then the date rendered by the server
+ */
+function pluralize(count, unit) {
+    return count + '\u00a0' + unit + (count === 1 ? '' : 's');
+}
+
+function timesince(seconds) {
+    const units = [['day', 86400], ['hour', 3600], ['minute', 60]];
+    for (let i = 0; i < units.length; i++) {
+        const count = Math.floor(seconds / units[i][1]);
+        if (count === 0) continue;
+
+        let text = pluralize(count, units[i][0]);
+        const next = units[i + 1];
+        const nextCount = next ? Math.floor((seconds % units[i][1]) / next[1]) : 0;
+        if (nextCount > 0) text += ', ' + pluralize(nextCount, next[0]);
+        return text;
+    }
+    return pluralize(0, 'minute');
+}
+
+function renderTimesince() {
+    const now = Date.now();
+    document.querySelectorAll('time[data-timesince]').forEach(function(element) {
+        if (!element.dataset.absolute) element.dataset.absolute = element.textContent;
+
+        const seconds = Math.floor((now - Date.parse(element.getAttribute('datetime'))) / 1000);
+        element.textContent = seconds >= 0 && seconds <= 86400 ? timesince(seconds) + ' ago' : element.dataset.absolute;
+    });
+}
+
+setInterval(renderTimesince, 60000);
+
 document.addEventListener('DOMContentLoaded', function() {
     autoCloseAlerts();
     lucide.createIcons();
+    renderTimesince();
 
     // htmx.logAll();
     // document.body.addEventListener("htmx:oobErrorNoTarget", e => {
@@ -53,6 +89,7 @@ document.addEventListener('DOMContentLoaded', function() {
 document.addEventListener('htmx:afterSwap', function(event) {
     autoCloseAlerts();
     lucide.createIcons();
+    renderTimesince();
 });
 
 // Setup icons: https://lucide.dev/icons/
@@ -0,0 +1,34 @@
+// static/js/live.js
+
+/**
+ * Live updates of the checklist pages.
+ *
+ * Stand-in for the htmx SSE extension, with the same markup: the element with a sse-connect attribute opens
+ * the event stream of the project, and each message triggers the "sse:<name>" event on the elements declaring
+ * hx-trigger="sse:<name>". Those elements re-fetch only the row, card or list that changed.
+ */
+(function () {
+    function connect(element) {
+        const source = new EventSource(element.getAttribute('sse-connect'));
+
+        source.onmessage = function (event) {
+            event.data.split(' ').forEach(function (name) {
+                document.querySelectorAll('[hx-trigger="sse:' + name + '"]').forEach(function (listener) {
+                    htmx.trigger(listener, 'sse:' + name);
+                });
+            });
+        };
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        document.querySelectorAll('[sse-connect]').forEach(connect);
+    });
+})();
+
+/**
+ * Id of the step highlighted in the sidebar, kept when a card or the list is fetched again
+ */
+function liveActiveStep() {
+    const card = document.querySelector('#sidebar .active-step');
+    return card ? card.id.replace('step-card-', '') : '';
+}
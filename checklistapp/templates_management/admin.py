@@ -1,9 +1,17 @@
 from checklist.models import ProjectStep, ProjectTask
 from django import forms
 from django.contrib import admin
-from django.db import models
+from jobs.services import JobService
 
-from .models import InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
+from .models import (
+    BlueprintInventory,
+    BlueprintStep,
+    InventoryTemplate,
+    ProjectBlueprint,
+    StepTemplate,
+    TaskTemplate,
+    TemplateField,
+)
 
 
 class TaskTemplateInline(admin.TabularInline):
@@ -33,6 +41,7 @@ class StepTemplateAdmin(admin.ModelAdmin):
     list_filter = ["is_active"]
     search_fields = ["title", "description"]
     ordering = ["default_order"]
+    prepopulated_fields = {"key": ["title"]}
     inlines = [TaskTemplateInline]
 
     def task_count(self, obj):
@@ -60,39 +69,11 @@ class StepTemplateAdmin(admin.ModelAdmin):
         super().save_related(request, form, formsets, change)
 
         if sync and change:
-            # Handle synchronization of all tasks (new and previously missed)
-            # We fetch fresh active_project_steps and current templates
-            active_project_steps = ProjectStep.objects.filter(step_template=form.instance, project__status="active")
-            # Get all current task templates for this step
-            current_task_templates = form.instance.tasks.all()
-
-            for p_step in active_project_steps:
-                # Get IDs of task templates already present in this step
-                existing_template_ids = set(
-                    p_step.tasks.exclude(task_template__isnull=True).values_list("task_template_id", flat=True)
-                )
-
-                # Determine the current max order to append new tasks at the end
-                current_max_order = p_step.tasks.aggregate(m=models.Max("order"))["m"] or 0
-
-                tasks_to_create = []
-                for task_template in current_task_templates:
-                    if task_template.id not in existing_template_ids:
-                        current_max_order += 1
-                        tasks_to_create.append(
-                            ProjectTask(
-                                project_step=p_step,
-                                task_template=task_template,
-                                title=task_template.title,
-                                info_text=task_template.info_text,
-                                help_url=task_template.help_url,
-                                work_url=task_template.work_url,
-                                order=current_max_order,
-                            )
-                        )
-
-                if tasks_to_create:
-                    ProjectTask.objects.bulk_create(tasks_to_create)
+            # Handle synchronization of all tasks (new and previously missed) in the background,
+            # the admin page does not wait for thousands of projects to be updated
+            JobService.enqueue(
+                "templates.propagate", {"step_template_ids": [form.instance.pk]}, user=getattr(request, "user", None)
+            )
 
 
 class TemplateFieldInline(admin.TabularInline):
@@ -115,4 +96,33 @@ class TemplateFieldInline(admin.TabularInline):
 class MetadataTemplateAdmin(admin.ModelAdmin):
     list_display = ["icon", "title", "description", "default_order", "is_active"]
     search_fields = ["title"]
+    prepopulated_fields = {"key": ["title"]}
     inlines = [TemplateFieldInline]
+
+
+class BlueprintStepInline(admin.TabularInline):
+    model = BlueprintStep
+    extra = 1
+    fields = ["step_template", "title", "count", "order"]
+    ordering = ["order"]
+
+
+class BlueprintInventoryInline(admin.TabularInline):
+    model = BlueprintInventory
+    extra = 1
+    fields = ["inventory_template", "title", "order"]
+    ordering = ["order"]
+
+
+@admin.register(ProjectBlueprint)
+class ProjectBlueprintAdmin(admin.ModelAdmin):
+    list_display = ["title", "step_count", "default_order", "is_active"]
+    list_filter = ["is_active"]
+    search_fields = ["title", "description"]
+    prepopulated_fields = {"key": ["title"]}
+    inlines = [BlueprintStepInline, BlueprintInventoryInline]
+
+    def step_count(self, obj):
+        return sum(obj.steps.values_list("count", flat=True))
+
+    step_count.short_description = "Steps"
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TemplatesManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "templates_management"
+
+    def ready(self):
+        # Import signal handlers to invalidate the template catalog cache
+        import templates_management.signals  # noqa
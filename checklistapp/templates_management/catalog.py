@@ -0,0 +1,152 @@
+import threading
+from dataclasses import dataclass
+
+from django.db.models import Prefetch
+
+from .models import CatalogVersion, InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
+
+"""
+In-memory cache of the active template catalog, shared by the threads of a worker.
+
+The catalog changes rarely while it is rendered on every project edition page, each worker
+keeps an immutable snapshot and only compares its version with CatalogVersion (one single row query).
+Any save or delete of a template bumps the version (see signals.py) and every worker reloads on its next read.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskTemplateSnapshot:
+    id: int
+    key: str
+    title: str
+    order: int
+    info_text: str | None
+    help_url: str | None
+    work_url: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class StepTemplateSnapshot:
+    id: int
+    key: str
+    title: str
+    icon: str
+    description: str | None
+    default_order: int
+    tasks: tuple[TaskTemplateSnapshot, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateFieldSnapshot:
+    id: int
+    group_name: str
+    group_order: int
+    field_name: str
+    field_order: int
+    field_type: str
+    is_secret: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryTemplateSnapshot:
+    id: int
+    key: str
+    title: str
+    icon: str
+    description: str | None
+    default_order: int
+    fields: tuple[TemplateFieldSnapshot, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    version: tuple
+    step_templates: tuple[StepTemplateSnapshot, ...]
+    inventory_templates: tuple[InventoryTemplateSnapshot, ...]
+
+
+class TemplateCatalog:
+    _catalog: Catalog | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> Catalog:
+        """Return the snapshot of the active templates, reloaded when the catalog version changed"""
+        version = CatalogVersion.current()
+        catalog = cls._catalog
+        if catalog is not None and catalog.version == version:
+            return catalog
+
+        with cls._lock:
+            # Another thread may have reloaded it while we were waiting
+            if cls._catalog is None or cls._catalog.version != version:
+                cls._catalog = cls._load(version)
+            return cls._catalog
+
+    @classmethod
+    def clear(cls):
+        cls._catalog = None
+
+    @staticmethod
+    def _load(version: tuple) -> Catalog:
+        """Same content as ChecklistService.get_template(load_tasks=True) and InventoryService.get_template(load_fields=True)"""
+        steps = (
+            StepTemplate.objects.filter(is_active=True)
+            .order_by("default_order")
+            .prefetch_related(Prefetch("tasks", queryset=TaskTemplate.objects.order_by("order")))
+        )
+        inventories = (
+            InventoryTemplate.objects.filter(is_active=True)
+            .order_by("default_order")
+            .prefetch_related(Prefetch("fields", queryset=TemplateField.objects.order_by("group_order", "field_order")))
+        )
+
+        return Catalog(
+            version=version,
+            step_templates=tuple(
+                StepTemplateSnapshot(
+                    id=step.id,
+                    key=step.key,
+                    title=step.title,
+                    icon=step.icon,
+                    description=step.description,
+                    default_order=step.default_order,
+                    tasks=tuple(
+                        TaskTemplateSnapshot(
+                            id=task.id,
+                            key=task.key,
+                            title=task.title,
+                            order=task.order,
+                            info_text=task.info_text,
+                            help_url=task.help_url,
+                            work_url=task.work_url,
+                        )
+                        for task in step.tasks.all()
+                    ),
+                )
+                for step in steps
+            ),
+            inventory_templates=tuple(
+                InventoryTemplateSnapshot(
+                    id=inventory.id,
+                    key=inventory.key,
+                    title=inventory.title,
+                    icon=inventory.icon,
+                    description=inventory.description,
+                    default_order=inventory.default_order,
+                    fields=tuple(
+                        TemplateFieldSnapshot(
+                            id=field.id,
+                            group_name=field.group_name,
+                            group_order=field.group_order,
+                            field_name=field.field_name,
+                            field_order=field.field_order,
+                            field_type=field.field_type,
+                            is_secret=field.is_secret,
+                        )
+                        for field in inventory.fields.all()
+                    ),
+                )
+                for inventory in inventories
+            ),
+        )
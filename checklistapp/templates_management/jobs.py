@@ -0,0 +1,11 @@
+from jobs.services import register
+
+from templates_management.services import CatalogService
+
+
+@register("templates.propagate", "Updating the active projects")
+def propagate_templates(job, step_template_ids=(), inventory_template_ids=()):
+    # {"tasks": n, "fields": n} is kept as the job result
+    return CatalogService.propagate_to_active_projects(
+        step_template_ids=step_template_ids, inventory_template_ids=inventory_template_ids
+    )
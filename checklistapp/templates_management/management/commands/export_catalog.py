@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from templates_management.services import CATALOG_FORMATS, CatalogService
+
+
+class Command(BaseCommand):
+    help = "Export the template catalog (step, task, inventory templates and fields) with their natural keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=CATALOG_FORMATS, default="json")
+        parser.add_argument("--output", "-o", help="Output file, defaults to stdout")
+
+    def handle(self, *args, **options):
+        content = CatalogService.dump(CatalogService.export_catalog(), options["format"])
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                output.write(content)
+        else:
+            self.stdout.write(content)
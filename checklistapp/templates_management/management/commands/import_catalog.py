@@ -0,0 +1,47 @@
+from core.exceptions import CustomExceptionError
+from django.core.management.base import BaseCommand, CommandError
+
+from templates_management.services import CATALOG_FORMATS, CatalogService
+
+
+class Command(BaseCommand):
+    help = "Create or update the template catalog from a file produced by export_catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="JSON or YAML catalog file")
+        parser.add_argument("--format", choices=CATALOG_FORMATS, help="Defaults to the file extension")
+        parser.add_argument("--dry-run", action="store_true", help="Only print the differences with the current catalog")
+        parser.add_argument(
+            "--propagate",
+            action="store_true",
+            help="Append the new tasks and fields to the active projects using the imported templates",
+        )
+
+    def handle(self, *args, **options):
+        file_format = options["format"] or ("yaml" if options["file"].lower().endswith((".yaml", ".yml")) else "json")
+        with open(options["file"], "rb") as file:
+            content = file.read()
+
+        try:
+            catalog = CatalogService.load(content, file_format)
+            if options["dry_run"]:
+                diff = CatalogService.diff(catalog)
+            else:
+                diff = CatalogService.import_catalog(catalog, propagate=options["propagate"])
+        except CustomExceptionError as e:
+            raise CommandError(str(e))
+
+        for name, changes in diff.items():
+            self.stdout.write(
+                f"{name}: {len(changes['create'])} to create, {len(changes['update'])} to update, "
+                f"{changes['unchanged']} unchanged, {len(changes['missing'])} not in the file"
+            )
+            for key in changes["create"]:
+                self.stdout.write(f"  + {key}")
+            for key in changes["update"]:
+                self.stdout.write(f"  ~ {key}")
+
+        if options["dry_run"]:
+            self.stdout.write("Dry run, nothing was written.")
+        else:
+            self.stdout.write(self.style.SUCCESS("Catalog imported."))
@@ -0,0 +1,79 @@
+# Generated by Django 6.0 on 2026-10-19 10:02
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def _slug(title, used):
+    base = slugify(title)[:96] or "template"
+    key, i = base, 1
+    while key in used:
+        i += 1
+        key = f"{base}-{i}"
+    used.add(key)
+    return key
+
+
+def backfill_keys(apps, schema_editor):
+    for model_name in ["StepTemplate", "InventoryTemplate"]:
+        model = apps.get_model("templates_management", model_name)
+        used = set()
+        objs = list(model.objects.order_by("id"))
+        for obj in objs:
+            obj.key = _slug(obj.title, used)
+        model.objects.bulk_update(objs, ["key"], batch_size=1000)
+
+    TaskTemplate = apps.get_model("templates_management", "TaskTemplate")
+    used_per_step = {}
+    objs = list(TaskTemplate.objects.order_by("id"))
+    for obj in objs:
+        obj.key = _slug(obj.title, used_per_step.setdefault(obj.step_template_id, set()))
+    TaskTemplate.objects.bulk_update(objs, ["key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("templates_management", "0005_rename_name_inventorytemplate_title_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="steptemplate",
+            name="key",
+            field=models.SlugField(db_index=False, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="tasktemplate",
+            name="key",
+            field=models.SlugField(db_index=False, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="inventorytemplate",
+            name="key",
+            field=models.SlugField(db_index=False, max_length=100, null=True),
+        ),
+        migrations.RunPython(backfill_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="steptemplate",
+            name="key",
+            field=models.SlugField(
+                blank=True, help_text="Stable identifier used to export/import the catalog", max_length=100, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tasktemplate",
+            name="key",
+            field=models.SlugField(blank=True, help_text="Stable identifier within the step template", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="inventorytemplate",
+            name="key",
+            field=models.SlugField(
+                blank=True, help_text="Stable identifier used to export/import the catalog", max_length=100, unique=True
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tasktemplate",
+            constraint=models.UniqueConstraint(fields=("step_template", "key"), name="unique_task_key_per_step_template"),
+        ),
+    ]
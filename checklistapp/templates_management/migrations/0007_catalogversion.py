@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-19 11:14
+
+from django.db import migrations, models
+
+
+def create_version(apps, schema_editor):
+    CatalogVersion = apps.get_model("templates_management", "CatalogVersion")
+    CatalogVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("templates_management", "0006_template_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogVersion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Catalog Version",
+            },
+        ),
+        migrations.RunPython(create_version, migrations.RunPython.noop),
+    ]
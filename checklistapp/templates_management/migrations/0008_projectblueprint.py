@@ -0,0 +1,105 @@
+# Generated by Django 6.0 on 2026-10-19 09:38
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("templates_management", "0007_catalogversion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectBlueprint",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "key",
+                    models.SlugField(blank=True, help_text="Stable identifier of the blueprint", max_length=100, unique=True),
+                ),
+                ("title", models.CharField(max_length=200)),
+                ("description", models.TextField(blank=True, null=True)),
+                ("default_order", models.IntegerField(default=0)),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Project Blueprint",
+                "verbose_name_plural": "Project Blueprints",
+                "ordering": ["default_order"],
+            },
+        ),
+        migrations.CreateModel(
+            name="BlueprintStep",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "title",
+                    models.CharField(blank=True, help_text="Custom title, defaults to the template title", max_length=200),
+                ),
+                (
+                    "count",
+                    models.PositiveSmallIntegerField(
+                        default=1,
+                        help_text="Number of times the step is added",
+                        validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(50)],
+                    ),
+                ),
+                ("order", models.IntegerField(default=0)),
+                (
+                    "step_template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="templates_management.steptemplate"
+                    ),
+                ),
+                (
+                    "blueprint",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="steps",
+                        to="templates_management.projectblueprint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blueprint Step",
+                "verbose_name_plural": "Blueprint Steps",
+                "ordering": ["order"],
+            },
+        ),
+        migrations.CreateModel(
+            name="BlueprintInventory",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "title",
+                    models.CharField(blank=True, help_text="Custom title, defaults to the template title", max_length=200),
+                ),
+                ("order", models.IntegerField(default=0)),
+                (
+                    "inventory_template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="templates_management.inventorytemplate",
+                    ),
+                ),
+                (
+                    "blueprint",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventories",
+                        to="templates_management.projectblueprint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blueprint Inventory",
+                "verbose_name_plural": "Blueprint Inventories",
+                "ordering": ["order"],
+            },
+        ),
+    ]
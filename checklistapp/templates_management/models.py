@@ -1,7 +1,24 @@
-from django.db import models
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.text import slugify
+
+
+def unique_key(queryset, title: str, max_length: int = 100) -> str:
+    """Slugify the title into a natural key not used yet in the queryset"""
+    base = slugify(title)[: max_length - 4] or "template"
+    key, i = base, 1
+    while queryset.filter(key=key).exists():
+        i += 1
+        key = f"{base}-{i}"
+    return key
 
 
 class StepTemplate(models.Model):
+    key = models.SlugField(
+        max_length=100, unique=True, blank=True, help_text="Stable identifier used to export/import the catalog"
+    )
     title = models.CharField(max_length=200)
     icon = models.CharField(max_length=10)
     description = models.TextField(blank=True, null=True)
@@ -18,9 +35,15 @@ class StepTemplate(models.Model):
     def __str__(self):
         return f"{self.icon} {self.title}"
 
+    def save(self, *args, **kwargs):
+        if not self.key:
+            self.key = unique_key(StepTemplate.objects.exclude(pk=self.pk), self.title)
+        super().save(*args, **kwargs)
+
 
 class TaskTemplate(models.Model):
     step_template = models.ForeignKey(StepTemplate, on_delete=models.CASCADE, related_name="tasks")
+    key = models.SlugField(max_length=100, blank=True, help_text="Stable identifier within the step template")
     title = models.CharField(max_length=500)
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
@@ -35,12 +58,23 @@ class TaskTemplate(models.Model):
         ordering = ["order"]
         verbose_name = "Task Template"
         verbose_name_plural = "Task Templates"
+        constraints = [models.UniqueConstraint(fields=["step_template", "key"], name="unique_task_key_per_step_template")]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if not self.key:
+            self.key = unique_key(
+                TaskTemplate.objects.filter(step_template_id=self.step_template_id).exclude(pk=self.pk), self.title
+            )
+        super().save(*args, **kwargs)
+
 
 class InventoryTemplate(models.Model):
+    key = models.SlugField(
+        max_length=100, unique=True, blank=True, help_text="Stable identifier used to export/import the catalog"
+    )
     title = models.CharField(max_length=200)
     icon = models.CharField(max_length=10)
     description = models.TextField(blank=True, null=True)
@@ -57,6 +91,11 @@ class InventoryTemplate(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if not self.key:
+            self.key = unique_key(InventoryTemplate.objects.exclude(pk=self.pk), self.title)
+        super().save(*args, **kwargs)
+
 
 class TemplateField(models.Model):
     FIELD_TYPES = [
@@ -92,6 +131,111 @@ class TemplateField(models.Model):
     def __str__(self):
         return f"{self.group_name} / {self.field_name}"
 
+    @transaction.atomic  # The search index follows the secret flag in post_save (see search.signals)
     def save(self, *args, **kwargs):
         self.group_name = self.group_name.upper().strip()
+        was_secret = self.pk is not None and TemplateField.objects.filter(pk=self.pk, is_secret=True).exists()
+        super().save(*args, **kwargs)
+
+        if self.is_secret:
+            # Secret values must never stay in the inventory lookup indexes
+            self.inventoryfield_set.exclude(lookup_value__isnull=True, file_hash__isnull=True).update(
+                lookup_value=None, file_hash=None
+            )
+        elif was_secret:
+            self.refresh_inventory_lookups()
+
+    def refresh_inventory_lookups(self):
+        """Fill the lookup columns of the inventory fields again, once the field is no longer secret"""
+        fields = list(self.inventoryfield_set.filter(field_type__in=["text", "url", "file"]))
+        for field in fields:
+            field.field_template = self
+            field.refresh_lookup_values()
+        self.inventoryfield_set.bulk_update(fields, ["lookup_value", "file_hash"], batch_size=1000)
+
+
+class ProjectBlueprint(models.Model):
+    """Named and ordered set of step and inventory templates to instantiate a whole project at once"""
+
+    key = models.SlugField(max_length=100, unique=True, blank=True, help_text="Stable identifier of the blueprint")
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True, null=True)
+    default_order = models.IntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["default_order"]
+        verbose_name = "Project Blueprint"
+        verbose_name_plural = "Project Blueprints"
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        if not self.key:
+            self.key = unique_key(ProjectBlueprint.objects.exclude(pk=self.pk), self.title)
         super().save(*args, **kwargs)
+
+
+class BlueprintStep(models.Model):
+    blueprint = models.ForeignKey(ProjectBlueprint, on_delete=models.CASCADE, related_name="steps")
+    step_template = models.ForeignKey(StepTemplate, on_delete=models.CASCADE, related_name="+")
+    title = models.CharField(max_length=200, blank=True, help_text="Custom title, defaults to the template title")
+    count = models.PositiveSmallIntegerField(
+        default=1, validators=[MinValueValidator(1), MaxValueValidator(50)], help_text="Number of times the step is added"
+    )
+    order = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["order"]
+        verbose_name = "Blueprint Step"
+        verbose_name_plural = "Blueprint Steps"
+
+    def __str__(self):
+        return f"{self.title or self.step_template.title} x{self.count}"
+
+
+class BlueprintInventory(models.Model):
+    blueprint = models.ForeignKey(ProjectBlueprint, on_delete=models.CASCADE, related_name="inventories")
+    inventory_template = models.ForeignKey(InventoryTemplate, on_delete=models.CASCADE, related_name="+")
+    title = models.CharField(max_length=200, blank=True, help_text="Custom title, defaults to the template title")
+    order = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["order"]
+        verbose_name = "Blueprint Inventory"
+        verbose_name_plural = "Blueprint Inventories"
+
+    def __str__(self):
+        return self.title or self.inventory_template.title
+
+
+class CatalogVersion(models.Model):
+    """
+    Single row counter bumped on every change of the template catalog.
+    Each worker compares it with the version of its in-memory catalog (see templates_management.catalog).
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Catalog Version"
+
+    def __str__(self):
+        return f"Catalog v{self.version}"
+
+    @staticmethod
+    def current() -> tuple:
+        """
+        (version, updated_at) of the catalog. The timestamp distinguishes two bumps to the same
+        number when the transaction of the first one was rolled back.
+        """
+        return CatalogVersion.objects.filter(pk=1).values_list("version", "updated_at").first() or (0, None)
+
+    @staticmethod
+    def bump():
+        if not CatalogVersion.objects.filter(pk=1).update(version=F("version") + 1, updated_at=timezone.now()):
+            CatalogVersion.objects.get_or_create(pk=1, defaults={"version": 1})
@@ -0,0 +1,381 @@
+import json
+
+import yaml
+from checklist.models import ProjectStep, ProjectTask
+from checklist.services import ReadModelService
+from core.exceptions import InvalidParameterError
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from inventory.models import InventoryField, ProjectInventory
+from live.services import LiveService
+from projects.versions import bump_inventory_template_versions, bump_versions
+from search.services import SearchService
+
+from .models import CatalogVersion, InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
+
+CATALOG_FORMATS = ["json", "yaml"]
+CATALOG_VERSION = 1
+CATALOG_BATCH_SIZE = 1000
+
+# Exported columns per model, the natural key comes first
+STEP_FIELDS = ["key", "title", "icon", "description", "default_order", "is_active"]
+TASK_FIELDS = ["key", "title", "order", "is_active", "info_text", "help_url", "work_url"]
+INVENTORY_FIELDS = ["key", "title", "icon", "description", "default_order", "is_active"]
+FIELD_FIELDS = ["group_name", "field_name", "group_order", "field_order", "field_type", "is_secret", "is_active"]
+
+
+class CatalogService:
+    """
+    Export and import the template catalog (step/task/inventory templates and template fields)
+    to promote it between environments.
+
+    Templates are identified by their natural keys, never by their ids:
+        - StepTemplate / InventoryTemplate: key
+        - TaskTemplate: (step key, key)
+        - TemplateField: (inventory key, group_name, field_name)
+
+    The import only creates or updates, templates missing from the file are reported but kept.
+    """
+
+    @staticmethod
+    def export_catalog() -> dict:
+        steps = StepTemplate.objects.order_by("default_order", "key").prefetch_related(
+            models.Prefetch("tasks", queryset=TaskTemplate.objects.order_by("order", "key"))
+        )
+        inventories = InventoryTemplate.objects.order_by("default_order", "key").prefetch_related(
+            models.Prefetch("fields", queryset=TemplateField.objects.order_by("group_order", "field_order", "field_name"))
+        )
+
+        return {
+            "version": CATALOG_VERSION,
+            "step_templates": [
+                {
+                    **CatalogService._values(step, STEP_FIELDS),
+                    "tasks": [CatalogService._values(task, TASK_FIELDS) for task in step.tasks.all()],
+                }
+                for step in steps
+            ],
+            "inventory_templates": [
+                {
+                    **CatalogService._values(inventory, INVENTORY_FIELDS),
+                    "fields": [CatalogService._values(field, FIELD_FIELDS) for field in inventory.fields.all()],
+                }
+                for inventory in inventories
+            ],
+        }
+
+    @staticmethod
+    def dump(catalog: dict, file_format: str = "json") -> str:
+        if file_format not in CATALOG_FORMATS:
+            raise InvalidParameterError(f"Catalog format must be one of {', '.join(CATALOG_FORMATS)}.")
+        if file_format == "yaml":
+            return yaml.safe_dump(catalog, allow_unicode=True, sort_keys=False)
+        return json.dumps(catalog, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def load(content: bytes | str, file_format: str = "json") -> dict:
+        if file_format not in CATALOG_FORMATS:
+            raise InvalidParameterError(f"Catalog format must be one of {', '.join(CATALOG_FORMATS)}.")
+        try:
+            catalog = yaml.safe_load(content) if file_format == "yaml" else json.loads(content)
+        except (ValueError, yaml.YAMLError) as e:
+            raise InvalidParameterError(f"Invalid catalog file: {e}")
+
+        if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_VERSION:
+            raise InvalidParameterError(f"The catalog file must be a mapping with version {CATALOG_VERSION}.")
+        return catalog
+
+    @staticmethod
+    def diff(catalog: dict) -> dict:
+        """
+        Compare the catalog with the database, without writing anything.
+        Returns per model the natural keys to create and update, and the ones missing from the file
+        {
+            "step_templates": {"create": [...], "update": [...], "unchanged": 3, "missing": [...]},
+            ...
+        }
+        """
+        return CatalogService._plan(CatalogService._validate(catalog))["diff"]
+
+    @staticmethod
+    @transaction.atomic
+    def import_catalog(catalog: dict, propagate: bool = False) -> dict:
+        """
+        Upsert the changed templates with bulk_create(update_conflicts=True), one query per batch and model.
+        With propagate, the new task templates and template fields are then added to the active projects
+        using the imported templates. Returns the diff applied.
+        """
+        plan = CatalogService._plan(CatalogService._validate(catalog))
+        was_secret = set(TemplateField.objects.filter(is_secret=True).values_list("template__key", "group_name", "field_name"))
+
+        CatalogService._upsert(StepTemplate, plan["step_templates"], ["key"], STEP_FIELDS[1:])
+        CatalogService._upsert(InventoryTemplate, plan["inventory_templates"], ["key"], INVENTORY_FIELDS[1:])
+
+        # Children are resolved after their parents got an id
+        step_ids = dict(StepTemplate.objects.values_list("key", "id"))
+        inventory_ids = dict(InventoryTemplate.objects.values_list("key", "id"))
+        for step_key, task in plan["tasks"]:
+            task.step_template_id = step_ids[step_key]
+        for inventory_key, field in plan["fields"]:
+            field.template_id = inventory_ids[inventory_key]
+
+        CatalogService._upsert(TaskTemplate, [task for _, task in plan["tasks"]], ["step_template", "key"], TASK_FIELDS[1:])
+        CatalogService._upsert(
+            TemplateField,
+            [field for _, field in plan["fields"]],
+            ["template", "group_name", "field_name"],
+            FIELD_FIELDS[2:],
+        )
+
+        # Same as TemplateField.save(), secret values must leave the lookup indexes
+        secret_fields = [field for _, field in plan["fields"] if field.is_secret]
+        if secret_fields:
+            InventoryField.objects.filter(
+                field_template__template_id__in={field.template_id for field in secret_fields},
+                field_template__is_secret=True,
+            ).exclude(lookup_value__isnull=True, file_hash__isnull=True).update(lookup_value=None, file_hash=None)
+        public_again = {(key, field.group_name, field.field_name) for key, field in plan["fields"] if not field.is_secret}
+        public_again &= was_secret
+        for template_field in TemplateField.objects.filter(
+            template__key__in={key for key, _, _ in public_again}
+        ).select_related("template"):
+            if (template_field.template.key, template_field.group_name, template_field.field_name) in public_again:
+                template_field.refresh_inventory_lookups()
+        SearchService.index_template_fields(
+            TemplateField.objects.filter(template_id__in={field.template_id for _, field in plan["fields"]})
+        )
+        bump_inventory_template_versions({field.template_id for _, field in plan["fields"]})
+
+        if any(plan[name] for name in ["step_templates", "inventory_templates", "tasks", "fields"]):
+            CatalogVersion.bump()  # bulk_create does not send post_save
+
+        if propagate:
+            CatalogService.propagate_to_active_projects(
+                step_template_ids=[step_ids[key] for key in plan["keys"]["step_templates"]],
+                inventory_template_ids=[inventory_ids[key] for key in plan["keys"]["inventory_templates"]],
+            )
+
+        return plan["diff"]
+
+    @staticmethod
+    def propagate_to_active_projects(step_template_ids=(), inventory_template_ids=()) -> dict:
+        """
+        Append the task templates (resp. template fields) missing from the steps (resp. inventories)
+        of active projects built from the given templates. Set-based: a few queries whatever the number of projects.
+        """
+        tasks = []
+        if step_template_ids:
+            steps = ProjectStep.objects.filter(step_template_id__in=step_template_ids, project__status="active")
+            existing = set(
+                ProjectTask.objects.filter(project_step__in=steps, task_template__isnull=False).values_list(
+                    "project_step_id", "task_template_id"
+                )
+            )
+            max_orders = dict(
+                ProjectTask.objects.filter(project_step__in=steps)
+                .values("project_step_id")
+                .annotate(m=models.Max("order"))
+                .values_list("project_step_id", "m")
+            )
+            templates = {}
+            for task_template in TaskTemplate.objects.filter(step_template_id__in=step_template_ids).order_by("order", "id"):
+                templates.setdefault(task_template.step_template_id, []).append(task_template)
+
+            for step in steps.only("id", "project_id", "step_template_id"):
+                order = max_orders.get(step.id) or 0
+                for task_template in templates.get(step.step_template_id, []):
+                    if (step.id, task_template.id) not in existing:
+                        order += 1
+                        tasks.append(
+                            ProjectTask(
+                                project_step=step,  # Object, so indexing needs no query per task
+                                task_template=task_template,
+                                title=task_template.title,
+                                info_text=task_template.info_text,
+                                help_url=task_template.help_url,
+                                work_url=task_template.work_url,
+                                order=order,
+                            )
+                        )
+
+        fields = []
+        if inventory_template_ids:
+            inventories = ProjectInventory.objects.filter(
+                inventory_template_id__in=inventory_template_ids, project__status="active"
+            )
+            existing = set(
+                InventoryField.objects.filter(inventory__in=inventories, field_template__isnull=False).values_list(
+                    "inventory_id", "field_template_id"
+                )
+            )
+            templates = {}
+            for field_template in TemplateField.objects.filter(template_id__in=inventory_template_ids):
+                templates.setdefault(field_template.template_id, []).append(field_template)
+
+            inventory_projects = {}
+            for inventory_id, project_id, inventory_template_id in inventories.values_list(
+                "id", "project_id", "inventory_template_id"
+            ):
+                inventory_projects[inventory_id] = project_id
+                for field_template in templates.get(inventory_template_id, []):
+                    if (inventory_id, field_template.id) not in existing:
+                        fields.append(
+                            InventoryField(
+                                inventory_id=inventory_id,
+                                field_template=field_template,
+                                group_name=field_template.group_name,
+                                group_order=field_template.group_order,
+                                field_name=field_template.field_name,
+                                field_order=field_template.field_order,
+                                field_type=field_template.field_type,
+                            )
+                        )
+
+        ProjectTask.objects.bulk_create(tasks, batch_size=CATALOG_BATCH_SIZE)
+        InventoryField.objects.bulk_create(fields, batch_size=CATALOG_BATCH_SIZE)
+        SearchService.index_many(tasks)  # bulk_create does not send post_save, new fields are empty
+        if tasks:
+            ReadModelService.invalidate({task.project_step.project_id for task in tasks})
+        bump_versions(
+            {task.project_step.project_id for task in tasks} | {inventory_projects[field.inventory_id] for field in fields},
+            step_ids={task.project_step_id for task in tasks},
+            inventory_ids={field.inventory_id for field in fields},
+        )
+        steps_per_project = {}
+        for task in tasks:
+            steps_per_project.setdefault(task.project_step.project_id, set()).add(task.project_step_id)
+        for project_id, step_ids in steps_per_project.items():
+            LiveService.publish(project_id, *(f"{event}-{step_id}" for step_id in step_ids for event in ["tasks", "step"]))
+
+        return {"tasks": len(tasks), "fields": len(fields)}
+
+    @staticmethod
+    def _values(obj, fields: list[str]) -> dict:
+        return {field: getattr(obj, field) for field in fields}
+
+    @staticmethod
+    def _validate(catalog: dict) -> dict:
+        """
+        Build the unsaved instances from the catalog and validate them (types, lengths, choices, urls, duplicates).
+        Returns {"step_templates": {key: obj}, "tasks": {(step key, key): obj}, ...}
+        """
+        errors = []
+        # The icon is not validated: templates created outside the admin may have none, the export must re-import
+        result = {"step_templates": {}, "tasks": {}, "inventory_templates": {}, "fields": {}}
+
+        def build(model, fields, data, where, exclude):
+            if not isinstance(data, dict):
+                errors.append(f"{where}: must be a mapping")
+                return None
+            obj = model(**{field: data[field] for field in fields if field in data})
+            if model is TemplateField:
+                obj.group_name = (obj.group_name or "").upper().strip()  # Same normalization as save()
+            if "key" in fields and not data.get("key"):
+                errors.append(f"{where}: key is required")
+            try:
+                obj.clean_fields(exclude=exclude)
+            except ValidationError as e:
+                errors.extend(f"{where}: {field}: {' '.join(messages)}" for field, messages in e.message_dict.items())
+            return obj
+
+        for i, data in enumerate(catalog.get("step_templates") or [], start=1):
+            step = build(StepTemplate, STEP_FIELDS, data, f"step template {i}", ["icon"])
+            if step is None:
+                continue
+            if step.key in result["step_templates"]:
+                errors.append(f"step template {i}: duplicated key '{step.key}'")
+            result["step_templates"][step.key] = step
+
+            for j, task_data in enumerate(data.get("tasks") or [], start=1):
+                task = build(TaskTemplate, TASK_FIELDS, task_data, f"step template {step.key}, task {j}", ["step_template"])
+                if task is not None:
+                    if (step.key, task.key) in result["tasks"]:
+                        errors.append(f"step template {step.key}, task {j}: duplicated key '{task.key}'")
+                    result["tasks"][(step.key, task.key)] = task
+
+        for i, data in enumerate(catalog.get("inventory_templates") or [], start=1):
+            inventory = build(InventoryTemplate, INVENTORY_FIELDS, data, f"inventory template {i}", ["icon"])
+            if inventory is None:
+                continue
+            if inventory.key in result["inventory_templates"]:
+                errors.append(f"inventory template {i}: duplicated key '{inventory.key}'")
+            result["inventory_templates"][inventory.key] = inventory
+
+            for j, field_data in enumerate(data.get("fields") or [], start=1):
+                field = build(
+                    TemplateField, FIELD_FIELDS, field_data, f"inventory template {inventory.key}, field {j}", ["template"]
+                )
+                if field is not None:
+                    natural_key = (inventory.key, field.group_name, field.field_name)
+                    if natural_key in result["fields"]:
+                        errors.append(f"inventory template {inventory.key}, field {j}: duplicated field '{field}'")
+                    result["fields"][natural_key] = field
+
+        if errors:
+            raise InvalidParameterError(f"{len(errors)} error(s) in the catalog: " + "; ".join(errors[:20]))
+
+        return result
+
+    @staticmethod
+    def _plan(objects: dict) -> dict:
+        """Compare the validated instances with the database and keep only the ones to write"""
+        current = {
+            "step_templates": {obj.key: obj for obj in StepTemplate.objects.only(*STEP_FIELDS)},
+            "tasks": {
+                (obj.step_template.key, obj.key): obj
+                for obj in TaskTemplate.objects.select_related("step_template").only("step_template__key", *TASK_FIELDS)
+            },
+            "inventory_templates": {obj.key: obj for obj in InventoryTemplate.objects.only(*INVENTORY_FIELDS)},
+            "fields": {
+                (obj.template.key, obj.group_name, obj.field_name): obj
+                for obj in TemplateField.objects.select_related("template").only("template__key", *FIELD_FIELDS)
+            },
+        }
+        compared_fields = {
+            "step_templates": STEP_FIELDS,
+            "tasks": TASK_FIELDS,
+            "inventory_templates": INVENTORY_FIELDS,
+            "fields": FIELD_FIELDS,
+        }
+
+        plan = {"diff": {}, "keys": {name: list(objects[name]) for name in ["step_templates", "inventory_templates"]}}
+        for name, objs in objects.items():
+            to_write, diff = [], {"create": [], "update": [], "unchanged": 0, "missing": []}
+            for natural_key, obj in objs.items():
+                existing = current[name].get(natural_key)
+                label = natural_key if isinstance(natural_key, str) else "/".join(natural_key)
+                if existing is None:
+                    diff["create"].append(label)
+                elif CatalogService._values(existing, compared_fields[name]) != CatalogService._values(
+                    obj, compared_fields[name]
+                ):
+                    diff["update"].append(label)
+                else:
+                    diff["unchanged"] += 1
+                    continue
+                to_write.append((natural_key, obj))
+
+            diff["missing"] = [key if isinstance(key, str) else "/".join(key) for key in current[name] if key not in objs]
+            plan["diff"][name] = diff
+            # Children keep the key of their parent, resolved to an id once the parents are written
+            plan[name] = (
+                [obj for _, obj in to_write]
+                if name.endswith("templates")
+                else [(natural_key[0], obj) for natural_key, obj in to_write]
+            )
+
+        return plan
+
+    @staticmethod
+    def _upsert(model, objs: list, unique_fields: list[str], update_fields: list[str]):
+        if not objs:
+            return
+        if any(field.name == "updated_at" for field in model._meta.fields):
+            update_fields = [*update_fields, "updated_at"]
+        model.objects.bulk_create(
+            objs,
+            batch_size=CATALOG_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+        )
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CatalogVersion, InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
+
+"""
+Invalidate the in-memory template catalog of every worker on change.
+Records written with bulk_create/update must bump the version explicitly with CatalogVersion.bump().
+"""
+
+
+@receiver(post_save, sender=StepTemplate)
+@receiver(post_save, sender=TaskTemplate)
+@receiver(post_save, sender=InventoryTemplate)
+@receiver(post_save, sender=TemplateField)
+@receiver(post_delete, sender=StepTemplate)
+@receiver(post_delete, sender=TaskTemplate)
+@receiver(post_delete, sender=InventoryTemplate)
+@receiver(post_delete, sender=TemplateField)
+def bump_catalog_version(sender, raw=False, **kwargs):
+    """Signal to bump the catalog version when a template is saved or deleted"""
+    if raw:
+        return  # Loading fixtures
+    CatalogVersion.bump()
@@ -1,12 +1,21 @@
+import dataclasses
+import io
+import json
 from unittest.mock import Mock
 
 import pytest
 from checklist.models import ProjectTask
+from core.exceptions import InvalidParameterError
 from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
 from django.forms import modelform_factory
+from inventory.models import InventoryField
+from search.models import SearchEntry
 
 from templates_management.admin import StepTemplateAdmin
-from templates_management.models import StepTemplate, TaskTemplate
+from templates_management.catalog import TemplateCatalog
+from templates_management.models import InventoryTemplate, StepTemplate, TaskTemplate, TemplateField
+from templates_management.services import CatalogService
 
 
 @pytest.mark.django_db
@@ -149,3 +158,162 @@ def test_no_sync_does_nothing(
     admin.save_related(None, form, [], True)
 
     assert ProjectTask.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_keys_are_generated_from_title(step_template, task_template_1):
+    other = StepTemplate.objects.create(title="Deploy", default_order=2)
+
+    assert step_template.key == "deploy"
+    assert other.key == "deploy-2"
+    assert task_template_1.key == "build"
+
+
+@pytest.mark.django_db
+def test_export_import_round_trip(step_template, task_template_1, task_template_2, template_field_text):
+    catalog = CatalogService.load(CatalogService.dump(CatalogService.export_catalog(), "yaml"), "yaml")
+    StepTemplate.objects.all().delete()
+    InventoryTemplate.objects.all().delete()
+
+    diff = CatalogService.import_catalog(catalog)
+
+    assert diff["step_templates"]["create"] == ["deploy"]
+    assert diff["tasks"]["create"] == ["deploy/build", "deploy/ship"]
+    assert CatalogService.export_catalog() == catalog
+
+
+@pytest.mark.django_db
+def test_import_updates_in_place(step_template, task_template_1, task_template_2):
+    catalog = CatalogService.export_catalog()
+    catalog["step_templates"][0]["tasks"][0]["title"] = "Build the image"
+    catalog["step_templates"][0]["tasks"].append({"key": "monitor", "title": "Monitor", "order": 3})
+
+    assert CatalogService.diff(catalog)["tasks"] == {
+        "create": ["deploy/monitor"],
+        "update": ["deploy/build"],
+        "unchanged": 1,
+        "missing": [],
+    }
+    assert TaskTemplate.objects.get(pk=task_template_1.pk).title == "Build"  # diff does not write
+
+    CatalogService.import_catalog(catalog)
+
+    assert TaskTemplate.objects.get(pk=task_template_1.pk).title == "Build the image"
+    assert list(step_template.tasks.order_by("order").values_list("key", flat=True)) == ["build", "ship", "monitor"]
+
+
+@pytest.mark.django_db
+def test_import_propagates_to_active_projects(step_template, task_template_1, active_project_step, inactive_project_step):
+    catalog = CatalogService.export_catalog()
+    catalog["step_templates"][0]["tasks"].append({"key": "monitor", "title": "Monitor", "order": 3})
+
+    CatalogService.import_catalog(catalog, propagate=True)
+
+    assert list(active_project_step.tasks.order_by("order").values_list("title", "order")) == [("Build", 1), ("Monitor", 2)]
+    assert not inactive_project_step.tasks.exists()
+
+
+@pytest.mark.django_db
+def test_import_secret_field_clears_lookup(inventory_field_text):
+    assert inventory_field_text.lookup_value is not None
+    catalog = CatalogService.export_catalog()
+    catalog["inventory_templates"][0]["fields"][0]["is_secret"] = True
+
+    CatalogService.import_catalog(catalog)
+
+    assert TemplateField.objects.get(pk=inventory_field_text.field_template_id).is_secret
+    assert InventoryField.objects.get(pk=inventory_field_text.pk).lookup_value is None
+    assert not SearchEntry.objects.filter(kind="inventory_field", object_id=inventory_field_text.pk).exists()
+
+
+@pytest.mark.django_db
+def test_import_public_field_fills_lookup(inventory_field_text, template_field_text):
+    template_field_text.is_secret = True
+    template_field_text.save()
+    catalog = CatalogService.export_catalog()
+    catalog["inventory_templates"][0]["fields"][0]["is_secret"] = False
+
+    CatalogService.import_catalog(catalog)
+
+    assert InventoryField.objects.get(pk=inventory_field_text.pk).lookup_value == "test value"
+    assert SearchEntry.objects.filter(kind="inventory_field", object_id=inventory_field_text.pk).exists()
+
+
+@pytest.mark.django_db
+def test_import_validation_writes_nothing(step_template):
+    catalog = {
+        "version": 1,
+        "step_templates": [
+            {"key": "new", "title": "New", "icon": "🚀", "tasks": [{"title": "No key"}]},
+            {"key": "other", "icon": "🚀"},
+        ],
+        "inventory_templates": [
+            {
+                "key": "inv",
+                "title": "Inv",
+                "icon": "📦",
+                "fields": [{"group_name": "g", "field_name": "f", "field_type": "blob"}],
+            }
+        ],
+    }
+
+    with pytest.raises(InvalidParameterError) as e:
+        CatalogService.import_catalog(catalog)
+
+    assert "3 error(s)" in str(e.value)
+    assert list(StepTemplate.objects.values_list("key", flat=True)) == ["deploy"]
+
+
+def test_load_rejects_unknown_version():
+    with pytest.raises(InvalidParameterError):
+        CatalogService.load(json.dumps({"version": 2}))
+
+
+@pytest.mark.django_db
+def test_import_catalog_command_dry_run(tmp_path, step_template):
+    catalog = CatalogService.export_catalog()
+    catalog["step_templates"][0]["title"] = "Deploy to production"
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(catalog))
+    out = io.StringIO()
+
+    call_command("import_catalog", str(path), "--dry-run", stdout=out)
+
+    assert "~ deploy" in out.getvalue()
+    assert StepTemplate.objects.get().title == "Deploy"
+
+
+@pytest.mark.django_db
+def test_catalog_is_cached_until_version_changes(django_assert_num_queries, step_template, task_template_1):
+    TemplateCatalog.clear()
+    catalog = TemplateCatalog.get()
+
+    with django_assert_num_queries(1):  # Only the version
+        assert TemplateCatalog.get() is catalog
+
+    assert [(t.title, [task.title for task in t.tasks]) for t in catalog.step_templates] == [("Deploy", ["Build"])]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        catalog.step_templates[0].title = "Other"
+
+
+@pytest.mark.django_db
+def test_catalog_reloads_on_save_and_delete(step_template, task_template_1, inventory_template):
+    TemplateCatalog.get()
+
+    task_template_1.title = "Build the image"
+    task_template_1.save()
+    assert TemplateCatalog.get().step_templates[0].tasks[0].title == "Build the image"
+
+    inventory_template.delete()
+    assert TemplateCatalog.get().inventory_templates == ()
+
+
+@pytest.mark.django_db
+def test_catalog_reloads_after_import(step_template):
+    TemplateCatalog.get()
+    catalog = CatalogService.export_catalog()
+    catalog["step_templates"][0]["title"] = "Deploy to production"
+
+    CatalogService.import_catalog(catalog)
+
+    assert TemplateCatalog.get().step_templates[0].title == "Deploy to production"